@@ -0,0 +1 @@
+# Datacom package initialization
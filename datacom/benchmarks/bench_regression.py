@@ -0,0 +1,112 @@
+"""
+Performance regression suite (pytest-benchmark)
+Times every detector's generate/verify, the packet codec and every error
+injector across payload sizes from config.BENCHMARK_SIZES, plus
+config.BENCHMARK_LARGE_SIZES when config.BENCHMARK_LARGE is set. The pure
+Python reference detectors skip the large sizes (minutes per call).
+
+Not collected by the default test run; use benchmarks/run_regression.py
+to save a baseline and compare later runs against it.
+"""
+
+import random
+import string
+
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from datacom import config
+from datacom.utils import error_detection
+from datacom.utils.error_detection import get_error_detector
+from datacom.utils.packet_handler import Packet
+from datacom.server.error_injector import get_error_injector
+
+METHODS = list(config.ERROR_DETECTION_METHODS.values())
+INJECTIONS = list(config.ERROR_INJECTION_TYPES.values())
+
+_payloads = {}
+
+
+def size_id(size):
+    """Readable test id for a payload size (16B, 4KB, 16MB)"""
+    for unit, scale in (('MB', 1 << 20), ('KB', 1 << 10)):
+        if size >= scale and size % scale == 0:
+            return f"{size // scale}{unit}"
+    return f"{size}B"
+
+
+def payload(size):
+    """Printable ASCII payload of the given size, built once per size"""
+    if size not in _payloads:
+        rng = random.Random(size)
+        block = ''.join(rng.choice(string.ascii_letters + string.digits) for _ in range(4096))
+        _payloads[size] = (block * (size // len(block) + 1))[:size]
+    return _payloads[size]
+
+
+def run(benchmark, func, *args):
+    """Benchmark func, using a fixed number of rounds for large payloads"""
+    if args and len(args[0]) >= config.BENCHMARK_LARGE_SIZE:
+        return benchmark.pedantic(func, args=args, rounds=config.BENCHMARK_LARGE_ROUNDS,
+                                  iterations=1)
+    return benchmark(func, *args)
+
+
+def detector_for(method, size):
+    """Detector to benchmark, skipping reference classes at large sizes"""
+    detector = get_error_detector(method)
+    if size in config.BENCHMARK_LARGE_SIZES and detector.__module__ == error_detection.__name__:
+        pytest.skip(f"{method} has no native/NumPy backend here; too slow at {size_id(size)}")
+    return detector
+
+
+SIZES = config.BENCHMARK_SIZES + (config.BENCHMARK_LARGE_SIZES if config.BENCHMARK_LARGE else [])
+sizes = pytest.mark.parametrize('size', SIZES, ids=[size_id(size) for size in SIZES])
+
+
+@sizes
+@pytest.mark.parametrize('method', METHODS)
+def test_generate(benchmark, method, size):
+    """Control info generation"""
+    benchmark.group = f"generate-{method}"
+    run(benchmark, detector_for(method, size).generate, payload(size))
+
+
+@sizes
+@pytest.mark.parametrize('method', METHODS)
+def test_verify(benchmark, method, size):
+    """Control info verification of an intact payload"""
+    benchmark.group = f"verify-{method}"
+    detector = detector_for(method, size)
+    data = payload(size)
+    control_info = detector.generate(data)
+    assert run(benchmark, detector.verify, data, control_info)
+
+
+@sizes
+def test_packet_to_string(benchmark, size):
+    """Packet serialization"""
+    benchmark.group = "packet-to_string"
+    packet = Packet(payload(size), 'CRC', '1010', {'id': '1.1', 'ts': '1700000000000000'})
+    if size >= config.BENCHMARK_LARGE_SIZE:
+        benchmark.pedantic(packet.to_string, rounds=config.BENCHMARK_LARGE_ROUNDS, iterations=1)
+    else:
+        benchmark(packet.to_string)
+
+
+@sizes
+def test_packet_from_string(benchmark, size):
+    """Packet parsing"""
+    benchmark.group = "packet-from_string"
+    packet_string = Packet(payload(size), 'CRC', '1010', {'id': '1.1'}).to_string()
+    packet = run(benchmark, Packet.from_string, packet_string)
+    assert len(packet.data) == size
+
+
+@sizes
+@pytest.mark.parametrize('injection', INJECTIONS)
+def test_injector(benchmark, injection, size):
+    """Error injection"""
+    benchmark.group = f"inject-{injection}"
+    run(benchmark, get_error_injector(injection), payload(size))
@@ -0,0 +1,121 @@
+"""
+Compression benchmark
+Reports the bandwidth vs CPU trade-off of each compression codec: bytes on
+the wire, and per-packet time to compress, generate control info, verify
+and decompress, against sending the payload uncompressed
+"""
+
+import argparse
+import random
+import time
+
+from datacom import config
+from datacom.utils import compression
+from datacom.utils.detector_cache import resolve_detector
+
+WORDS = ("packet frame error parity checksum relay server client data signal bit byte "
+         "corrupt detect verify control method header channel noise burst stream").split()
+
+
+def make_text(size, rng):
+    """Generate a compressible text payload (random words and numbers)"""
+    parts = []
+    length = 0
+    while length < size:
+        word = rng.choice(WORDS) if rng.random() < 0.8 else str(rng.randrange(100000))
+        parts.append(word)
+        length += len(word) + 1
+    return ' '.join(parts)[:size]
+
+
+def make_random(size, rng):
+    """Generate an incompressible printable payload"""
+    return ''.join(chr(rng.randrange(33, 127)) for _ in range(size))
+
+
+def time_per_call(func, min_time=0.2):
+    """
+    Time a callable
+
+    Returns:
+        Mean microseconds per call
+    """
+    iterations = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_time:
+        func()
+        iterations += 1
+        elapsed = time.perf_counter() - start
+    return elapsed / iterations * 1e6
+
+
+def measure(codec, payload, detector, level):
+    """
+    Measure one codec on one payload
+
+    Returns:
+        dict: wire size, compress/generate/verify/decompress microseconds
+    """
+    if codec == 'none':
+        wire, used = payload, None
+        compress_us = decompress_us = 0.0
+    else:
+        wire, used = compression.compress(payload, codec, threshold=0, level=level)
+        compress_us = time_per_call(lambda: compression.compress(payload, codec, 0, level))
+        decompress_us = (time_per_call(lambda: compression.decompress(wire, used))
+                         if used else 0.0)
+
+    control_info = detector.generate(wire)
+    return {
+        'wire': len(wire),
+        'compressed': used is not None,
+        'compress': compress_us,
+        'generate': time_per_call(lambda: detector.generate(wire)),
+        'verify': time_per_call(lambda: detector.verify(wire, control_info)),
+        'decompress': decompress_us,
+    }
+
+
+def run(codecs, sizes, method, level, kind, seed):
+    """Run the benchmark and print one table per payload size"""
+    rng = random.Random(seed)
+    detector = resolve_detector(method)
+    make = make_text if kind == 'text' else make_random
+
+    print(f"{method} control info, {kind} payloads, level {level} (times in us per packet)")
+    for size in sizes:
+        payload = make(size, rng)
+        print(f"\n  {size} bytes")
+        print(f"  {'codec':<8}{'wire':>10}{'ratio':>8}{'compress':>11}{'generate':>11}"
+              f"{'verify':>11}{'decompress':>12}{'total':>11}")
+        for codec in codecs:
+            result = measure(codec, payload, detector, level)
+            total = sum(result[key] for key in ('compress', 'generate', 'verify', 'decompress'))
+            codec_label = codec if codec == 'none' or result['compressed'] else f"{codec}*"
+            print(f"  {codec_label:<8}{result['wire']:>10,}{result['wire'] / size:>8.2f}"
+                  f"{result['compress']:>11.1f}{result['generate']:>11.1f}"
+                  f"{result['verify']:>11.1f}{result['decompress']:>12.1f}{total:>11.1f}")
+    print("\n  * did not shrink, sent uncompressed")
+
+
+def main(argv=None):
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Compare payload compression codecs")
+    parser.add_argument('--codecs', default=','.join(('none',) + compression.CODECS))
+    parser.add_argument('--sizes', default='256,4096,65536',
+                        help="comma-separated payload sizes in bytes")
+    parser.add_argument('--method', default='CRC', help="error detection method")
+    parser.add_argument('--level', type=int, default=config.COMPRESSION_LEVEL,
+                        help="zlib level / lzma preset (0-9)")
+    parser.add_argument('--payload', choices=('text', 'random'), default='text')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args(argv)
+
+    run([codec.strip() for codec in args.codecs.split(',')],
+        [int(size) for size in args.sizes.split(',')],
+        args.method, args.level, args.payload, args.seed)
+
+
+if __name__ == "__main__":
+    main()
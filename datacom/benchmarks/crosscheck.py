@@ -0,0 +1,255 @@
+"""
+Differential cross-check of accelerated detectors
+Runs the reference classes in utils/error_detection.py as the oracle
+against every accelerated engine (C, NumPy, control info cache) on
+randomized and edge-case inputs, and measures each engine's speedup
+"""
+
+import argparse
+import random
+import sys
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+
+from datacom import config
+from datacom.utils import native_backend, numpy_backend
+from datacom.utils.detector_cache import CachedDetector, ControlInfoCache
+from datacom.utils.error_detection import (
+    ParityBit, TwoDParity, CRC, HammingCode, InternetChecksum,
+    Fletcher16, Fletcher32, Adler32, CRC32C
+)
+
+# Oracle for every built-in method
+REFERENCE_DETECTORS = {
+    'PARITY': ParityBit,
+    '2D_PARITY': TwoDParity,
+    'CRC': CRC,
+    'HAMMING': HammingCode,
+    'CHECKSUM': InternetChecksum,
+    'FLETCHER16': Fletcher16,
+    'FLETCHER32': Fletcher32,
+    'ADLER32': Adler32,
+    'CRC32C': CRC32C
+}
+
+# Extra CRC generators checked besides config.CRC_POLYNOMIAL (CRC-8, CRC-16, CRC-32, 3-bit)
+CRC_POLYNOMIALS = (0x107, 0x11021, 0x104C11DB7, 0xB)
+
+# Lengths around byte, word and block boundaries
+EDGE_LENGTHS = (0, 1, 2, 3, 4, 7, 8, 9, 15, 16, 17, 31, 32, 33, 63, 64, 65, 255, 256, 257)
+
+# Character ranges: printable ASCII, full latin-1, BMP (no surrogates), astral planes
+ALPHABETS = {
+    'ascii': [(32, 126)],
+    'latin1': [(0, 255)],
+    'bmp': [(0, 0xD7FF), (0xE000, 0xFFFF)],
+    'astral': [(0x10000, 0x10FFFF)]
+}
+
+Engine = namedtuple('Engine', 'backend method reference fast')
+
+
+def accelerated_engines():
+    """
+    List every accelerated engine available in this environment
+
+    Returns:
+        list of Engine(backend, method, reference class, fast detector)
+    """
+    engines = []
+
+    if native_backend.NATIVE_AVAILABLE or native_backend.load():
+        for method, detector in native_backend.NATIVE_DETECTORS.items():
+            engines.append(Engine('native', method, REFERENCE_DETECTORS[method], detector))
+
+    if numpy_backend.NUMPY_AVAILABLE:
+        for method, (reference, detector) in numpy_backend.NUMPY_DETECTORS.items():
+            engines.append(Engine('numpy', method, reference, detector))
+
+    for method, reference in REFERENCE_DETECTORS.items():
+        cached = CachedDetector(reference, method, ControlInfoCache(small_payload=16))
+        engines.append(Engine('cache', method, reference, cached))
+
+    return engines
+
+
+@contextmanager
+def fast_paths_forced():
+    """Route every payload size through the accelerated code paths"""
+    threshold = config.NUMPY_THRESHOLD
+    config.NUMPY_THRESHOLD = 0
+    try:
+        yield
+    finally:
+        config.NUMPY_THRESHOLD = threshold
+
+
+def random_string(rng, length, alphabet):
+    """Random string of the given length drawn from one of ALPHABETS"""
+    ranges = ALPHABETS[alphabet]
+    return ''.join(chr(rng.randint(*rng.choice(ranges))) for _ in range(length))
+
+
+def generate_inputs(rng, count, max_length=512, huge_size=0):
+    """
+    Build edge-case and randomized inputs
+
+    Args:
+        rng: random.Random instance
+        count: Number of randomized inputs on top of the edge cases
+        max_length: Maximum length of randomized inputs
+        huge_size: Length of one extra large input (0 to skip)
+
+    Returns:
+        list of strings
+    """
+    inputs = ["", "A", "Hello", "\x00", "\xff" * 3, "caf\xe9", "€ uro", "\U0001f600"]
+    for length in EDGE_LENGTHS:
+        inputs.append(random_string(rng, length, rng.choice(list(ALPHABETS))))
+
+    for _ in range(count):
+        length = rng.choice((rng.choice(EDGE_LENGTHS), rng.randint(0, max_length)))
+        inputs.append(random_string(rng, length, rng.choice(list(ALPHABETS))))
+
+    if huge_size:
+        inputs.append(random_string(rng, huge_size, 'latin1'))
+    return inputs
+
+
+def _corrupt(data):
+    """Flip the low bit of the middle character (returns data unchanged if empty)"""
+    if not data:
+        return data
+    middle = len(data) // 2
+    return data[:middle] + chr(ord(data[middle]) ^ 1) + data[middle + 1:]
+
+
+def _timed(func, *args):
+    """Call func and return (result, elapsed seconds)"""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def _reference_results(engine, data, extra):
+    """Reference generate() with its time, and reference verify() of a corrupted copy"""
+    expected, elapsed = _timed(engine.reference.generate, data, *extra)
+    corrupted_ok = engine.reference.verify(_corrupt(data), expected, *extra)
+    return expected, elapsed, corrupted_ok
+
+
+def crosscheck(engine, inputs, references=None):
+    """
+    Compare an accelerated engine against its reference on every input
+
+    generate() must match bit-for-bit, verify() must accept the reference
+    control info and agree with the reference on a corrupted copy.
+
+    Args:
+        engine: Engine from accelerated_engines()
+        inputs: Strings to check
+        references: Optional dict shared across calls on the same inputs, so
+            each reference class runs once per input however many engines
+            implement its method
+
+    Returns:
+        dict with cases, mismatches (list of descriptions), reference and
+        fast generate() time in seconds, and speedup
+    """
+    polynomials = (None,) + CRC_POLYNOMIALS if engine.method == 'CRC' else (None,)
+    mismatches = []
+    reference_time = fast_time = 0.0
+    cases = 0
+
+    with fast_paths_forced():
+        for index, data in enumerate(inputs):
+            for polynomial in polynomials:
+                extra = () if polynomial is None else (polynomial,)
+                if references is None:
+                    expected, elapsed, corrupted_ok = _reference_results(engine, data, extra)
+                else:
+                    key = (engine.reference, index, polynomial)
+                    if key not in references:
+                        references[key] = _reference_results(engine, data, extra)
+                    expected, elapsed, corrupted_ok = references[key]
+                reference_time += elapsed
+                actual, elapsed = _timed(engine.fast.generate, data, *extra)
+                fast_time += elapsed
+                cases += 1
+
+                label = f"{engine.method} len={len(data)} data={data[:24]!r}"
+                if polynomial is not None:
+                    label += f" poly={polynomial:#x}"
+
+                if actual != expected:
+                    mismatches.append(f"{label}: generate {actual[:32]!r} != {expected[:32]!r}")
+                    continue
+                if not engine.fast.verify(data, expected, *extra):
+                    mismatches.append(f"{label}: verify rejected reference control info")
+                    continue
+
+                if engine.fast.verify(_corrupt(data), expected, *extra) != corrupted_ok:
+                    mismatches.append(f"{label}: verify disagrees on corrupted data")
+
+    return {
+        'cases': cases,
+        'mismatches': mismatches,
+        'reference_time': reference_time,
+        'fast_time': fast_time,
+        'speedup': reference_time / fast_time if fast_time else float('inf')
+    }
+
+
+def run(engines, inputs):
+    """
+    Cross-check every engine and print a result table
+
+    Returns:
+        Total number of mismatches
+    """
+    total_chars = sum(len(data) for data in inputs)
+    print(f"Cross-checking {len(engines)} engines on {len(inputs)} inputs ({total_chars:,} chars)")
+    print(f"  {'backend':<8}{'method':<12}{'cases':>8}{'mismatch':>10}{'ref s':>10}{'fast s':>10}{'speedup':>10}")
+
+    failures = 0
+    references = {}
+    for engine in engines:
+        result = crosscheck(engine, inputs, references)
+        failures += len(result['mismatches'])
+        print(f"  {engine.backend:<8}{engine.method:<12}{result['cases']:>8}"
+              f"{len(result['mismatches']):>10}{result['reference_time']:>10.3f}"
+              f"{result['fast_time']:>10.3f}{result['speedup']:>9.1f}x")
+        for mismatch in result['mismatches'][:5]:
+            print(f"      {mismatch}")
+
+    return failures
+
+
+def main(argv=None):
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Cross-check accelerated detectors against the reference code")
+    parser.add_argument('--cases', type=int, default=50, help="randomized inputs besides the edge cases")
+    parser.add_argument('--max-length', type=int, default=512)
+    parser.add_argument('--huge', type=int, default=config.CROSSCHECK_HUGE_SIZE,
+                        help="length of one extra large input (0 to skip)")
+    parser.add_argument('--backend', choices=['native', 'numpy', 'cache'], default=None,
+                        help="only check this backend")
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    seed = args.seed if args.seed is not None else random.randrange(1 << 32)
+    print(f"Seed {seed}")
+    inputs = generate_inputs(random.Random(seed), args.cases, args.max_length, args.huge)
+    engines = [engine for engine in accelerated_engines()
+               if args.backend is None or engine.backend == args.backend]
+
+    failures = run(engines, inputs)
+    if failures:
+        print(f"{failures} mismatches")
+        sys.exit(1)
+    print("All engines match the reference implementations")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Detector benchmark
+Reports throughput (MB/s) of every error detection method and its
+detection rate against every error injection type
+"""
+
+import argparse
+import random
+import string
+import time
+
+from datacom import config
+from datacom.utils.error_detection import get_error_detector
+from datacom.server.error_injector import get_error_injector
+
+
+def make_payload(size, rng):
+    """Generate a printable ASCII payload of the given size"""
+    alphabet = string.ascii_letters + string.digits + ' '
+    return ''.join(rng.choice(alphabet) for _ in range(size))
+
+
+def measure_speed(detector, payload, min_time=0.2):
+    """
+    Measure generate() throughput
+
+    Args:
+        detector: Error detection class
+        payload: Payload string
+        min_time: Minimum seconds to run
+
+    Returns:
+        Throughput in MB/s
+    """
+    iterations = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_time:
+        detector.generate(payload)
+        iterations += 1
+        elapsed = time.perf_counter() - start
+    return len(payload) * iterations / elapsed / 1e6
+
+
+def measure_detection(detector, injector, payload_size, trials, rng):
+    """
+    Measure the fraction of corrupted payloads a detector flags
+
+    Payloads the injector leaves unchanged are not counted.
+
+    Returns:
+        Detection rate in percent, or None if nothing was corrupted
+    """
+    detected = 0
+    corrupted_count = 0
+    for _ in range(trials):
+        payload = make_payload(payload_size, rng)
+        control_info = detector.generate(payload)
+        corrupted = injector(payload, rng=rng)
+        if corrupted == payload:
+            continue
+        corrupted_count += 1
+        if not detector.verify(corrupted, control_info):
+            detected += 1
+    return (detected / corrupted_count * 100) if corrupted_count else None
+
+
+def run(methods, sizes, injections, trials, detection_size, seed):
+    """Run speed and detection benchmarks and print result tables"""
+    rng = random.Random(seed)
+
+    print("Throughput (MB/s)")
+    print(f"  {'method':<12}" + ''.join(f"{size:>12}" for size in sizes))
+    for method in methods:
+        detector = get_error_detector(method)
+        row = [measure_speed(detector, make_payload(size, rng)) for size in sizes]
+        print(f"  {method:<12}" + ''.join(f"{value:>12.3f}" for value in row))
+
+    print()
+    print(f"Detection rate (%), {trials} trials of {detection_size}-byte payloads")
+    print(f"  {'method':<12}" + ''.join(f"{name[:10]:>12}" for name in injections))
+    for method in methods:
+        detector = get_error_detector(method)
+        cells = []
+        for injection in injections:
+            rate = measure_detection(detector, get_error_injector(injection),
+                                     detection_size, trials, rng)
+            cells.append(f"{'-':>12}" if rate is None else f"{rate:>12.1f}")
+        print(f"  {method:<12}" + ''.join(cells))
+
+
+def main(argv=None):
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark error detection methods")
+    parser.add_argument('--methods', nargs='+', type=str.upper,
+                        default=list(config.ERROR_DETECTION_METHODS.values()))
+    parser.add_argument('--sizes', nargs='+', type=int, default=[64, 1024, 16384],
+                        help="payload sizes in bytes for the throughput table")
+    parser.add_argument('--injections', nargs='+', type=str.upper,
+                        default=[t for t in config.ERROR_INJECTION_TYPES.values() if t != 'NO_ERROR'])
+    parser.add_argument('--trials', type=int, default=500)
+    parser.add_argument('--detection-size', type=int, default=32)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args(argv)
+
+    run(args.methods, args.sizes, args.injections, args.trials, args.detection_size, args.seed)
+
+
+if __name__ == "__main__":
+    main()
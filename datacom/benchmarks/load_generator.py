@@ -0,0 +1,388 @@
+"""
+Load generator
+Drives the full Client 1 -> Server -> Client 2 chain on localhost with N
+synthetic senders, the Server and Client 2 each running in their own
+process, and reports achieved throughput, loss and end-to-end latency
+percentiles
+"""
+
+import argparse
+import json
+import os
+import random
+import socket
+import string
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+
+from datacom import config
+from datacom.utils import compression, settings, socket_utils, tracing, transport
+from datacom.utils.detector_cache import resolve_detector
+from datacom.utils.error_detection import get_error_detector
+from datacom.utils.packet_handler import create_packet
+from datacom.server.fault_schedule import InjectionStream
+from datacom.server.server import check_fault_stream
+
+PERCENTILES = (50, 90, 99, 99.9)
+
+# Directory that holds the datacom package (working directory of the child processes)
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Seconds to wait for a child process to accept connections, and between metrics polls
+STARTUP_TIMEOUT = 15.0
+POLL_INTERVAL = 0.05
+
+
+def parse_sizes(spec):
+    """
+    Parse a payload size distribution
+
+    Args:
+        spec: 'N' (fixed), 'MIN-MAX' (uniform) or 'A,B,C' (uniform choice)
+
+    Returns:
+        Callable taking a random.Random and returning a size
+    """
+    try:
+        if ',' in spec:
+            choices = [int(size) for size in spec.split(',')]
+            sizes = lambda rng: rng.choice(choices)
+        elif '-' in spec:
+            low, high = (int(size) for size in spec.split('-', 1))
+            sizes = lambda rng: rng.randint(low, high)
+        else:
+            fixed = int(spec)
+            sizes = lambda rng: fixed
+    except ValueError:
+        raise ValueError(f"Invalid size distribution: {spec}")
+
+    return sizes
+
+
+def parse_methods(spec):
+    """
+    Parse a method mix
+
+    Args:
+        spec: Comma-separated 'METHOD[:WEIGHT]' entries, e.g. 'CRC:3,HAMMING:1'
+
+    Returns:
+        tuple: (method names, weights)
+    """
+    names, weights = [], []
+    for entry in spec.split(','):
+        name, _, weight = entry.partition(':')
+        name = name.strip().upper()
+        if get_error_detector(name) is None:
+            raise ValueError(f"Unknown error detection method: {name}")
+        names.append(name)
+        weights.append(float(weight) if weight else 1.0)
+    return names, weights
+
+
+class Sender(threading.Thread):
+    """Synthetic Client 1 sending traced packets at a fixed rate"""
+
+    def __init__(self, index, rate, duration, sizes, methods, seed=None):
+        """
+        Initialize sender
+
+        Args:
+            index: Sender number (also offsets the seed)
+            rate: Packets per second for this sender (0 = as fast as possible)
+            duration: Seconds to send for
+            sizes: Payload size distribution from parse_sizes()
+            methods: (names, weights) from parse_methods()
+            seed: Optional base seed for payloads and method choice
+        """
+        super().__init__(name=f"load-sender-{index}", daemon=True)
+        self.rate = rate
+        self.duration = duration
+        self.sizes = sizes
+        self.methods, self.weights = methods
+        self.rng = random.Random(None if seed is None else seed + index)
+        self.sent = 0
+        self.bytes = 0
+        self.errors = 0
+        self.sock = None
+        self._pool = ''
+
+    def _payload(self, size):
+        """Random printable payload (sliced from a per-sender pool)"""
+        pool = self._pool
+        if len(pool) < size * 2:
+            alphabet = string.ascii_letters + string.digits
+            pool = ''.join(self.rng.choice(alphabet) for _ in range(max(size * 2, 4096)))
+            self._pool = pool
+        offset = self.rng.randrange(len(pool) - size + 1)
+        return pool[offset:offset + size]
+
+    def send_one(self):
+        """Build, trace and send one packet"""
+        method = self.rng.choices(self.methods, self.weights)[0]
+        data = self._payload(self.sizes(self.rng))
+
+        created_us = tracing.now_us()
+        data, codec = compression.compress(data)
+        control_info = resolve_detector(method).generate(data)
+        packet = create_packet(data, method, control_info, compression.headers_for(codec))
+        tracing.start_trace(packet, created_us)
+        tracing.stamp(packet, tracing.SENT)
+        buffers = packet.to_buffers(config.ENCODING)
+
+        if self.sock is None:
+            self.sock = transport.connect(config.SERVER_HOST, config.SERVER_TO_CLIENT1_PORT)
+        socket_utils.send_frames(self.sock, [buffers])
+
+        self.sent += 1
+        self.bytes += len(buffers[0]) + len(buffers[1])
+
+    def run(self):
+        """Send packets on an absolute schedule until the duration expires"""
+        start = time.monotonic()
+        interval = 1.0 / self.rate if self.rate else 0.0
+        next_send = start
+
+        while True:
+            now = time.monotonic()
+            if now - start >= self.duration:
+                break
+            if interval:
+                if next_send > now:
+                    time.sleep(next_send - now)
+                next_send += interval
+
+            try:
+                self.send_one()
+            except OSError:
+                self.errors += 1
+                self._close()
+
+        self._close()
+
+    def _close(self):
+        """Close the connection (the next send reconnects)"""
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+
+
+class RelayProcess:
+    """Server or Client 2 running as its own Python process, observed through its metrics endpoint"""
+
+    def __init__(self, module, ready_gauge, args):
+        """
+        Initialize process handle
+
+        Args:
+            module: Entry point module, e.g. 'datacom.server.server'
+            ready_gauge: Gauge that reads 1 once the process accepts connections
+            args: Extra command line arguments (settings are passed with --set)
+        """
+        self.module = module
+        self.ready_gauge = ready_gauge
+        self.port = _free_port()
+        self.command = [sys.executable, '-m', module, '--quiet',
+                        '--metrics-port', str(self.port)] + list(args)
+        self.proc = None
+        self._stderr = None
+
+    def start(self, timeout=STARTUP_TIMEOUT):
+        """Start the process and wait until it is ready"""
+        self._stderr = tempfile.TemporaryFile()
+        self.proc = subprocess.Popen(self.command, cwd=ROOT, stdin=subprocess.DEVNULL,
+                                     stdout=subprocess.DEVNULL, stderr=self._stderr)
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.proc.poll() is not None:
+                raise RuntimeError(f"{self.module} exited with status {self.proc.returncode}: "
+                                   f"{self._error_output()}")
+            try:
+                if self.metrics()['gauges'].get(self.ready_gauge):
+                    return
+            except OSError:
+                pass
+            time.sleep(POLL_INTERVAL)
+        raise RuntimeError(f"{self.module} did not become ready within {timeout:g}s")
+
+    def metrics(self):
+        """Current metrics snapshot of the process"""
+        url = f"http://127.0.0.1:{self.port}/metrics.json"
+        with urllib.request.urlopen(url, timeout=2) as response:
+            return json.load(response)
+
+    def _error_output(self):
+        """Last lines the process wrote to stderr"""
+        self._stderr.seek(0)
+        lines = self._stderr.read().decode('utf-8', 'replace').strip().splitlines()
+        return '\n'.join(lines[-5:]) or '(no output)'
+
+    def stop(self):
+        """Terminate the process"""
+        if self.proc is not None and self.proc.poll() is None:
+            self.proc.terminate()
+            try:
+                self.proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+                self.proc.wait()
+        if self._stderr is not None:
+            self._stderr.close()
+
+
+def _free_port():
+    """Free localhost TCP port for a metrics endpoint"""
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        return probe.getsockname()[1]
+
+
+def settings_args():
+    """--set arguments that give a child process this process's effective settings"""
+    args = []
+    for name in settings.SCHEMA:
+        if hasattr(config, name) and name not in ('METRICS_ENABLED', 'METRICS_PORT'):
+            args += ['--set', f"{name}={getattr(config, name)}"]
+    return args
+
+
+def _received(client2):
+    """Packets Client 2 has verified so far"""
+    return client2.metrics()['gauges']['client2_packets_received']
+
+
+def _wait_for_drain(client2, expected, timeout):
+    """Wait until Client 2 has seen every packet or stops making progress"""
+    last, last_change = _received(client2), time.monotonic()
+    while last < expected:
+        time.sleep(POLL_INTERVAL)
+        received = _received(client2)
+        if received != last:
+            last, last_change = received, time.monotonic()
+        elif time.monotonic() - last_change >= timeout:
+            break
+
+
+def run_load(senders=4, rate=1000, duration=5.0, sizes='64', methods='CRC',
+             injection='NO_ERROR', seed=None, drain_timeout=2.0):
+    """
+    Run a load test against a Server and Client 2 started as separate processes
+
+    The senders play Client 1 from this process, so the three stages of the
+    relay run in three interpreters as in a real deployment. The children get
+    this process's effective settings via --set and run with metrics enabled;
+    Client 2's totals and latency histogram are read from its endpoint.
+
+    Args:
+        senders: Number of concurrent synthetic senders
+        rate: Target packets per second across all senders (0 = unlimited)
+        duration: Seconds to send for
+        sizes: Payload size distribution (see parse_sizes)
+        methods: Method mix (see parse_methods)
+        injection: Error injection type applied by the server
+        seed: Optional seed for payloads, methods and injected faults
+        drain_timeout: Seconds without progress before in-flight packets count as lost
+
+    Returns:
+        dict with sent, received, lost, corrupted, reordered (UDP only), send_errors, elapsed,
+        pkt_per_s, mb_per_s and latency_us (percentile -> microseconds)
+
+    Raises:
+        settings.ConfigError: If the seed cannot be honoured with config.INJECT_WORKERS
+        RuntimeError: If the Server or Client 2 process fails to start
+    """
+    size_dist = parse_sizes(sizes)
+    method_mix = parse_methods(methods)
+    check_fault_stream(InjectionStream(seed))
+
+    server_args = ['--injection', injection] + settings_args()
+    if seed is not None:
+        server_args += ['--seed', str(seed)]
+    client2 = RelayProcess('datacom.client2.client2', 'client2_ready', settings_args())
+    server = RelayProcess('datacom.server.server', 'server_ready', server_args)
+    workers = [Sender(i, rate / senders, duration, size_dist, method_mix, seed)
+               for i in range(senders)]
+
+    try:
+        client2.start()
+        server.start()
+
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        sent = sum(worker.sent for worker in workers)
+        _wait_for_drain(client2, sent, drain_timeout)
+        elapsed = time.perf_counter() - start
+        snapshot = client2.metrics()
+    finally:
+        server.stop()
+        client2.stop()
+
+    gauges = snapshot['gauges']
+    total = snapshot['histograms'].get('trace_total', {})
+    received = gauges['client2_packets_received']
+    return {
+        'sent': sent,
+        'received': received,
+        'lost': max(sent - received, 0),
+        'corrupted': gauges['client2_packets_corrupted'],
+        'reordered': gauges['client2_udp_reordered'],
+        'send_errors': sum(worker.errors for worker in workers),
+        'elapsed': elapsed,
+        'pkt_per_s': received / elapsed,
+        'mb_per_s': sum(worker.bytes for worker in workers) / elapsed / 1e6,
+        'latency_us': {p: total.get(f"p{p:g}", 0) / 1000 for p in PERCENTILES}
+    }
+
+
+def format_results(results):
+    """Format load test results as a short report"""
+    loss = (results['lost'] / results['sent'] * 100) if results['sent'] else 0.0
+    latency = '  '.join(f"p{p:g} {value:,.0f}" for p, value in results['latency_us'].items())
+    return '\n'.join([
+        f"Sent {results['sent']}  received {results['received']}  lost {results['lost']} ({loss:.2f}%)  "
+        f"reordered {results['reordered']}  send errors {results['send_errors']}  "
+        f"detected corruption {results['corrupted']}",
+        f"Throughput {results['pkt_per_s']:,.1f} pkt/s  {results['mb_per_s']:.2f} MB/s "
+        f"over {results['elapsed']:.2f}s",
+        f"Latency (us) {latency}"
+    ])
+
+
+def main(argv=None):
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Load test the Client 1 -> Server -> Client 2 chain")
+    parser.add_argument('--senders', type=int, default=4, help="concurrent synthetic senders")
+    parser.add_argument('--rate', type=float, default=1000,
+                        help="target packets/s across all senders (0 = unlimited)")
+    parser.add_argument('--duration', type=float, default=5.0, help="seconds to send for")
+    parser.add_argument('--sizes', default='64',
+                        help="payload sizes: N, MIN-MAX (uniform) or A,B,C (choice)")
+    parser.add_argument('--methods', default='CRC',
+                        help="method mix, e.g. CRC:3,HAMMING:1")
+    parser.add_argument('--injection', default='NO_ERROR', type=str.upper,
+                        choices=list(config.ERROR_INJECTION_TYPES.values()))
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--base-port', type=int, default=None,
+                        help="use BASE and BASE+1 instead of the configured ports")
+    settings.add_arguments(parser)
+    args = parser.parse_args(argv)
+    settings.configure(args)
+
+    if args.base_port:
+        config.SERVER_TO_CLIENT1_PORT = args.base_port
+        config.SERVER_TO_CLIENT2_PORT = args.base_port + 1
+
+    results = run_load(args.senders, args.rate, args.duration, args.sizes, args.methods,
+                       args.injection, args.seed)
+    print(format_results(results))
+
+
+if __name__ == "__main__":
+    main()
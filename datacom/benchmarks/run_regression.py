@@ -0,0 +1,77 @@
+"""
+Benchmark regression runner
+Saves pytest-benchmark baselines under config.BENCHMARK_STORAGE and fails a
+later run when any benchmark's mean is slower than the latest baseline by
+more than config.BENCHMARK_TOLERANCE percent
+"""
+
+import argparse
+import sys
+import os
+
+import pytest
+
+from datacom import config
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SUITE = os.path.join(ROOT, 'benchmarks', 'bench_regression.py')
+
+
+def build_args(save=None, tolerance=None, select=None):
+    """
+    Build the pytest command line
+
+    Args:
+        save: Baseline name to save this run under (no comparison)
+        tolerance: Allowed slowdown of the mean in percent
+        select: Optional -k expression, e.g. "not 64KB"
+
+    Returns:
+        list of pytest arguments
+    """
+    if tolerance is None:
+        tolerance = config.BENCHMARK_TOLERANCE
+
+    storage = os.path.join(ROOT, config.BENCHMARK_STORAGE)
+    args = [SUITE, '-q', f"--benchmark-storage=file://{storage}",
+            '--benchmark-columns=mean,stddev,rounds', '--benchmark-sort=name']
+    if select:
+        args += ['-k', select]
+    if save:
+        args.append(f"--benchmark-save={save}")
+    else:
+        args += ['--benchmark-compare', f"--benchmark-compare-fail=mean:{tolerance:g}%"]
+    return args
+
+
+def has_baseline():
+    """True if a baseline has been saved under config.BENCHMARK_STORAGE"""
+    storage = os.path.join(ROOT, config.BENCHMARK_STORAGE)
+    return any(name.endswith('.json') for _, _, names in os.walk(storage) for name in names)
+
+
+def main(argv=None):
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Run the benchmark regression suite")
+    parser.add_argument('--save', metavar='NAME',
+                        help="save this run as a new baseline instead of comparing")
+    parser.add_argument('--tolerance', type=float, default=None,
+                        help="allowed slowdown of the mean in percent")
+    parser.add_argument('-k', dest='select', default=None,
+                        help="only run benchmarks matching this expression")
+    parser.add_argument('--large', action='store_true',
+                        help="also run config.BENCHMARK_LARGE_SIZES (native/NumPy detectors only)")
+    args = parser.parse_args(argv)
+
+    config.BENCHMARK_LARGE = args.large
+    if not args.save and not has_baseline():
+        print(f"No baseline in {config.BENCHMARK_STORAGE}; create one first with "
+              f"'python -m benchmarks.run_regression --save baseline'", file=sys.stderr)
+        return 2
+
+    return pytest.main(build_args(args.save, args.tolerance, args.select))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""
+Startup benchmark
+Measures cold-start import time of each entry point in fresh interpreters
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+ENTRY_MODULES = ['datacom.utils', 'datacom.client1.client1', 'datacom.client2.client2',
+                 'datacom.server.server']
+
+
+def measure(statement, runs):
+    """
+    Median wall time of running a statement in a fresh interpreter
+
+    Args:
+        statement: Python source passed to -c
+        runs: Number of interpreter launches
+
+    Returns:
+        Median seconds
+    """
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', statement], check=True)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def slowest_imports(module, count=8):
+    """
+    Largest cumulative import times reported by python -X importtime
+
+    Returns:
+        list of (cumulative microseconds, module name)
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            capture_output=True, text=True, check=True)
+    entries = []
+    for line in result.stderr.splitlines():
+        parts = line.split('|')
+        if len(parts) == 3 and parts[1].strip().isdigit():
+            entries.append((int(parts[1]), parts[2].strip()))
+    return sorted(entries, reverse=True)[1:count + 1]
+
+
+def main(argv=None):
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Measure entry point cold-start time")
+    parser.add_argument('--runs', type=int, default=15, help="interpreter launches per module")
+    parser.add_argument('--modules', nargs='+', default=ENTRY_MODULES)
+    parser.add_argument('--detail', action='store_true',
+                        help="list the slowest imports of each module")
+    args = parser.parse_args(argv)
+
+    baseline = measure('pass', args.runs)
+    print(f"Interpreter baseline: {baseline * 1000:.1f} ms (median of {args.runs})")
+    print(f"  {'module':<20}{'total ms':>10}{'import ms':>11}")
+    for module in args.modules:
+        total = measure(f'import {module}', args.runs)
+        print(f"  {module:<20}{total * 1000:>10.1f}{(total - baseline) * 1000:>11.1f}")
+        if args.detail:
+            for cumulative, name in slowest_imports(module):
+                print(f"      {cumulative / 1000:>8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Transport benchmark
+Measures framed packet throughput of each relay transport between two
+processes on this host
+"""
+
+import argparse
+import multiprocessing
+import os
+import socket
+import tempfile
+import time
+
+from datacom import config
+from datacom.utils import transport
+from datacom.utils.socket_utils import FrameReader, send_frame
+
+
+def _receive(kind, port, socket_dir, ring_size, ready, results):
+    """Reader process: count frames until the writer closes"""
+    config.UNIX_SOCKET_DIR = socket_dir
+    config.SHM_RING_SIZE = ring_size
+    listener = transport.create_listener('127.0.0.1', port, kind)
+    ready.set()
+    conn, _ = listener.accept()
+    packets = total = 0
+    for frame in FrameReader(conn):
+        packets += 1
+        total += len(frame)
+    conn.close()
+    listener.close()
+    results.put((packets, total))
+
+
+def measure(kind, size, count, port):
+    """
+    Send `count` frames of `size` bytes to a reader process
+
+    Returns:
+        tuple: (packets per second, MB per second)
+    """
+    context = multiprocessing.get_context('spawn')
+    ready, results = context.Event(), context.Queue()
+    reader = context.Process(target=_receive, args=(kind, port, config.UNIX_SOCKET_DIR,
+                                                     config.SHM_RING_SIZE, ready, results))
+    reader.start()
+    ready.wait(10)
+
+    payload = os.urandom(size)
+    start = time.perf_counter()
+    with transport.connect('127.0.0.1', port, kind) as conn:
+        for _ in range(count):
+            send_frame(conn, payload)
+    packets, total = results.get(timeout=60)
+    elapsed = time.perf_counter() - start
+    reader.join()
+
+    if packets != count:
+        raise RuntimeError(f"{kind}: reader saw {packets} of {count} packets")
+    return packets / elapsed, total / elapsed / 1e6
+
+
+def main(argv=None):
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Compare relay transports on this host")
+    parser.add_argument('--sizes', default='64,1024,16384',
+                        help="comma-separated payload sizes in bytes")
+    parser.add_argument('--count', type=int, default=100000, help="packets per measurement")
+    parser.add_argument('--transports', default=','.join(transport.TRANSPORTS))
+    parser.add_argument('--port', type=int, default=5901)
+    args = parser.parse_args(argv)
+
+    kinds = [kind.strip() for kind in args.transports.split(',')]
+    if not hasattr(socket, 'AF_UNIX'):
+        kinds = [kind for kind in kinds if kind == 'tcp']
+    config.UNIX_SOCKET_DIR = config.UNIX_SOCKET_DIR or tempfile.mkdtemp(prefix='datacom-')
+
+    print(f"  {'transport':<10}{'size':>8}{'pkt/s':>14}{'MB/s':>10}")
+    for size in (int(size) for size in args.sizes.split(',')):
+        for kind in kinds:
+            pkt_per_s, mb_per_s = measure(kind, size, args.count, args.port)
+            print(f"  {kind:<10}{size:>8}{pkt_per_s:>14,.0f}{mb_per_s:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,19 +3,16 @@ Client 1 - Data Sender
 Sends data with error detection codes to the server
 """
 
-import socket
-import sys
-import os
+import argparse
 
-# Add parent directory to path to import modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-import config
-from utils.error_detection import get_error_detector
-from utils.packet_handler import create_packet
-from utils.logger_utils import (
-    Logger, print_header, print_section, print_colored,
-    print_success, print_error, print_info, print_packet_info
+from datacom import config
+from datacom.utils import compression, metrics, settings, socket_utils, tracing, transport
+from datacom.utils.detector_cache import resolve_detector
+from datacom.utils.packet_handler import create_packet
+from datacom.utils.logger_utils import (
+    Logger, ThroughputReporter, print_header, print_section, print_colored,
+    print_success, print_error, print_info, print_packet_info,
+    set_quiet_mode
 )
 
 
@@ -25,13 +22,13 @@ class Client1:
     def __init__(self):
         """Initialize Client 1"""
         self.logger = Logger('Client1', 'client1.log')
+        self.reporter = ThroughputReporter('Client1')
         self.socket = None
         
     def connect_to_server(self):
         """Establish connection to server"""
         try:
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.connect((config.SERVER_HOST, config.SERVER_TO_CLIENT1_PORT))
+            self.socket = transport.connect(config.SERVER_HOST, config.SERVER_TO_CLIENT1_PORT)
             print_success(f"Connected to server at {config.SERVER_HOST}:{config.SERVER_TO_CLIENT1_PORT}")
             self.logger.info("Connected to server")
             return True
@@ -68,7 +65,7 @@ class Client1:
         
         # Display and select error detection method
         self.display_menu()
-        method_choice = input("Select method (1-5): ").strip()
+        method_choice = input(f"Select method (1-{len(config.ERROR_DETECTION_METHODS)}): ").strip()
         
         if method_choice not in config.ERROR_DETECTION_METHODS:
             print_error("Invalid method selection!")
@@ -89,12 +86,14 @@ class Client1:
             Control information string
         """
         try:
-            detector_class = get_error_detector(method_name)
+            detector_class = resolve_detector(method_name)
             if not detector_class:
                 raise ValueError(f"Unknown method: {method_name}")
             
-            control_info = detector_class.generate(data)
-            self.logger.info(f"Generated {method_name} control info: {control_info}")
+            with metrics.timer('client1_generate'):
+                control_info = detector_class.generate(data)
+            self.logger.info("Generated %s control info: %s", method_name, control_info,
+                             sample=config.LOG_SAMPLE_EVERY)
             return control_info
         except Exception as e:
             print_error(f"Failed to generate control info: {e}")
@@ -112,15 +111,18 @@ class Client1:
             True if successful, False otherwise
         """
         try:
-            packet_string = packet.to_string()
-            self.socket.sendall(packet_string.encode(config.ENCODING))
+            tracing.stamp(packet, tracing.SENT)
+            buffers = packet.to_buffers(config.ENCODING)
+            socket_utils.send_frames(self.socket, [buffers])
+            self.reporter.record(len(buffers[0]) + len(buffers[1]))
             
             print_success("Packet sent successfully!")
             print_packet_info(packet, "Sent Packet")
             
-            self.logger.info(f"Sent packet: {packet_string}")
+            self.logger.info("Sent packet: %s", packet, sample=config.LOG_SAMPLE_EVERY)
             return True
         except Exception as e:
+            self.reporter.record(0, error=True)
             print_error(f"Failed to send packet: {e}")
             self.logger.error(f"Send failed: {e}")
             return False
@@ -152,13 +154,20 @@ class Client1:
                     print_info("Exiting...")
                     break
                 
+                created_us = tracing.now_us()
+                
+                # Compress large payloads (control info then covers the compressed bytes)
+                data, codec = compression.compress(data)
+                
                 # Generate control information
                 control_info = self.generate_control_info(data, method_name)
                 if control_info is None:
                     continue
                 
                 # Create packet
-                packet = create_packet(data, method_name, control_info)
+                packet = create_packet(data, method_name, control_info, compression.headers_for(codec))
+                if config.TRACING_ENABLED:
+                    tracing.start_trace(packet, created_us)
                 
                 # Send packet
                 if not self.send_packet(packet):
@@ -172,11 +181,34 @@ class Client1:
             print_error(f"Error: {e}")
             self.logger.error(f"Runtime error: {e}")
         finally:
+            self.reporter.report()
+            metrics.dump_snapshot('Client1')
             self.close_connection()
 
 
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Data sender")
+    parser.add_argument('--quiet', action='store_true',
+                        help="throughput mode: periodic summary instead of per-packet output")
+    parser.add_argument('--trace', action='store_true',
+                        help="attach trace metadata to every packet")
+    parser.add_argument('--metrics-port', type=int, default=None,
+                        help="enable metrics and serve them on this local port")
+    settings.add_arguments(parser)
+    return parser.parse_args(argv)
+
+
 def main():
     """Main entry point"""
+    args = parse_args()
+    settings.configure(args)
+    if args.quiet:
+        set_quiet_mode(True)
+    if args.trace:
+        config.TRACING_ENABLED = True
+    metrics.configure(args.metrics_port)
+    
     client = Client1()
     client.run()
 
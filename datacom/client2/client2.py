@@ -0,0 +1,290 @@
+"""
+Client 2 - Data Receiver and Error Checker
+Receives data from server and verifies error detection codes
+"""
+
+import argparse
+
+from datacom import config
+from datacom.utils import compression, error_locator, metrics, settings, tracing, transport
+from datacom.utils.detector_cache import resolve_detector
+from datacom.utils.packet_handler import parse_packet
+from datacom.utils.logger_utils import (
+    Logger, ThroughputReporter, print_header, print_section, print_colored,
+    print_success, print_error, print_info, is_quiet, set_quiet_mode
+)
+
+
+class Client2:
+    """Client 2 - Data Receiver and Error Checker"""
+    
+    def __init__(self):
+        """Initialize Client 2"""
+        self.logger = Logger('Client2', 'client2.log')
+        self.reporter = ThroughputReporter('Client2')
+        self.tracker = tracing.LatencyTracker()
+        self.sequence = None  # SequenceTracker of the UDP transport
+        self.socket = None
+        self.server_socket = None
+        
+        # Totals and end-to-end latency for the metrics endpoint (read by the load generator)
+        metrics.REGISTRY.gauge('client2_ready', "1 once Client 2 is listening",
+                               func=lambda: int(self.server_socket is not None))
+        metrics.REGISTRY.gauge('client2_packets_received', "Packets verified",
+                               func=lambda: self.reporter.total_packets)
+        metrics.REGISTRY.gauge('client2_packets_corrupted', "Packets that failed verification",
+                               func=lambda: self.reporter.total_errors)
+        metrics.REGISTRY.gauge('client2_udp_reordered', "UDP datagrams that arrived out of order",
+                               func=lambda: self.sequence.reordered if self.sequence else 0)
+        for histogram in self.tracker.histograms.values():
+            metrics.REGISTRY.register(histogram)
+        
+    def start_server(self):
+        """Start listening for connections from server"""
+        try:
+            self.server_socket = transport.create_listener(config.SERVER_HOST,
+                                                           config.SERVER_TO_CLIENT2_PORT)
+            
+            print_success(f"Client 2 listening on port {config.SERVER_TO_CLIENT2_PORT} "
+                          f"({config.TRANSPORT})")
+            self.logger.info(f"Client 2 started on port {config.SERVER_TO_CLIENT2_PORT}")
+            return True
+        except Exception as e:
+            print_error(f"Failed to start Client 2: {e}")
+            self.logger.error(f"Start failed: {e}")
+            return False
+    
+    def verify_data(self, data, method, received_control_info):
+        """
+        Verify data using error detection method
+        
+        Args:
+            data: Received data
+            method: Error detection method name
+            received_control_info: Control info from sender
+            
+        Returns:
+            tuple: (calculated_control_info, is_valid, location), where location is
+            an ErrorLocation for failed 2D parity/Hamming checks and None otherwise
+        """
+        try:
+            # Get error detector
+            detector_class = resolve_detector(method)
+            if not detector_class:
+                print_error(f"Unknown method: {method}")
+                return None, False, None
+            
+            with metrics.timer('client2_verify'):
+                # Calculate control info from received data
+                calculated_control_info = detector_class.generate(data)
+                
+                # Verify against it (verify() would generate a second time)
+                is_valid = calculated_control_info == received_control_info
+            
+            # Localize from the parity mismatch already at hand (no rescan)
+            location = None
+            if not is_valid:
+                location = error_locator.locate_errors(method, data, received_control_info,
+                                                       calculated_control_info)
+                if location is not None:
+                    metrics.REGISTRY.counter('client2_errors_located').inc()
+                    if location.correctable:
+                        metrics.REGISTRY.counter('client2_errors_correctable').inc()
+                    self.logger.info("Error location - Method: %s, %s", method, location)
+            
+            self.logger.info("Verification - Method: %s, Valid: %s", method, is_valid,
+                             sample=config.LOG_SAMPLE_EVERY)
+            return calculated_control_info, is_valid, location
+            
+        except Exception as e:
+            print_error(f"Verification error: {e}")
+            self.logger.error(f"Verification failed: {e}")
+            return None, False, None
+    
+    def display_results(self, packet, calculated_control_info, is_valid, payload=None,
+                        location=None):
+        """
+        Display verification results
+        
+        Args:
+            packet: Received packet
+            calculated_control_info: Calculated control information
+            is_valid: Whether data is valid
+            payload: Decompressed data of a compressed packet
+            location: ErrorLocation of a failed 2D parity/Hamming check
+        """
+        if is_quiet():
+            return
+        
+        print_section("Packet Received")
+        codec = packet.headers.get(compression.HEADER)
+        if codec:
+            print(f"  Data:                 {payload if payload is not None else '(unreadable)'}")
+            print(f"  Compression:          {codec} ({len(packet.data)} characters on the wire)")
+        else:
+            print(f"  Data:                 {packet.data}")
+        print(f"  Method:               {packet.method}")
+        print(f"  Received Control:     {packet.control_info}")
+        print(f"  Calculated Control:   {calculated_control_info}")
+        
+        print_section("Verification Result")
+        if is_valid:
+            print_success("✓ NO CORRUPTION DETECTED - Data integrity verified")
+        else:
+            print_error("✗ CORRUPTION DETECTED - Data integrity compromised")
+        
+        # Display in binary for comparison (for debugging)
+        if packet.control_info != calculated_control_info:
+            print_section("Detailed Comparison")
+            print(f"  Expected: {packet.control_info}")
+            print(f"  Got:      {calculated_control_info}")
+        
+        if location is not None:
+            print_section("Error Location")
+            print(f"  Candidates:           {location}")
+            corrected = location.correct(packet.data)
+            if corrected is not None:
+                print(f"  Corrected (1 bit):    {corrected}")
+    
+    def handle_connection(self, conn, addr):
+        """
+        Handle incoming connection from server until it is closed
+        
+        Args:
+            conn: Socket connection
+            addr: Server address
+        """
+        reader = transport.frame_reader(conn)
+        if isinstance(reader, transport.DatagramReader):
+            self.sequence = reader.sequence
+        try:
+            while True:
+                # Receive one length-prefixed packet
+                data = reader.read_frame()
+                if data is None:
+                    break
+                self.handle_packet(data, addr, tracing.now_us())
+        except Exception as e:
+            print_error(f"Error handling connection: {e}")
+            self.logger.error(f"Connection handling error: {e}")
+        finally:
+            conn.close()
+            if self.sequence is not None:
+                print_info(self.sequence.format_report())
+                self.logger.info(self.sequence.format_report())
+    
+    def handle_packet(self, data, addr, received_us):
+        """
+        Parse, verify and report one packet
+        
+        Args:
+            data: Packet bytes (bytes or memoryview)
+            addr: Server address
+            received_us: Receive time in microseconds
+        """
+        try:
+            # Parse packet
+            packet_string = str(data, config.ENCODING)
+            with metrics.timer('client2_parse_packet'):
+                packet = parse_packet(packet_string)
+            
+            print_colored("\n" + "=" * 60, 'cyan', bold=True)
+            print_info(f"Received packet from server ({addr})")
+            
+            # Verify data
+            calculated_control_info, is_valid, location = self.verify_data(
+                packet.data, 
+                packet.method, 
+                packet.control_info
+            )
+            
+            # Control info covers the compressed form; restore the original afterwards
+            payload = None
+            if compression.HEADER in packet.headers:
+                try:
+                    payload = compression.packet_payload(packet)
+                except ValueError as e:
+                    is_valid = False
+                    print_error(str(e))
+                    self.logger.error(f"Decompression failed: {e}")
+            
+            self.reporter.record(len(data), error=not is_valid)
+            
+            if tracing.is_traced(packet):
+                self.tracker.record(packet, received_us, tracing.now_us())
+                self.tracker.maybe_report()
+            
+            # Display results
+            self.display_results(packet, calculated_control_info, is_valid, payload, location)
+            
+            print_colored("=" * 60 + "\n", 'cyan', bold=True)
+            
+        except Exception as e:
+            print_error(f"Error handling packet: {e}")
+            self.logger.error(f"Packet handling error: {e}")
+    
+    def run(self):
+        """Main execution loop for Client 2"""
+        print_header("Client 2 - Data Receiver & Error Checker")
+        
+        # Start server
+        if not self.start_server():
+            return
+        
+        print_info("Waiting for data from server...\n")
+        
+        try:
+            while True:
+                # Accept connection from server
+                conn, addr = self.server_socket.accept()
+                
+                # Handle connection
+                self.handle_connection(conn, addr)
+                
+        except KeyboardInterrupt:
+            print_info("\n\nInterrupted by user")
+        except Exception as e:
+            print_error(f"Error: {e}")
+            self.logger.error(f"Runtime error: {e}")
+        finally:
+            self.reporter.report()
+            if self.tracker.packets:
+                print(self.tracker.format_report())
+            metrics.dump_snapshot('Client2')
+            if self.server_socket:
+                self.server_socket.close()
+                self.logger.info("Server socket closed")
+    
+    def stop(self):
+        """Stop Client 2"""
+        if self.server_socket:
+            self.server_socket.close()
+        print_info("Client 2 stopped")
+        self.logger.info("Client 2 stopped")
+
+
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Data receiver and error checker")
+    parser.add_argument('--quiet', action='store_true',
+                        help="throughput mode: periodic summary instead of per-packet output")
+    parser.add_argument('--metrics-port', type=int, default=None,
+                        help="enable metrics and serve them on this local port")
+    settings.add_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def main():
+    """Main entry point"""
+    args = parse_args()
+    settings.configure(args)
+    if args.quiet:
+        set_quiet_mode(True)
+    metrics.configure(args.metrics_port)
+    
+    client = Client2()
+    client.run()
+
+
+if __name__ == "__main__":
+    main()
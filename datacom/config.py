@@ -0,0 +1,139 @@
+"""
+Configuration file for Socket Error Detection Project
+Contains network settings and project parameters
+"""
+
+# Network Configuration
+SERVER_HOST = 'localhost'
+SERVER_TO_CLIENT1_PORT = 5001  # Server listens for Client 1
+SERVER_TO_CLIENT2_PORT = 5002  # Server forwards to Client 2
+
+# Socket Configuration
+BUFFER_SIZE = 65536  # Initial per-connection receive buffer (grows for larger frames)
+MAX_FRAME_SIZE = 64 * 1024 * 1024  # Largest accepted length-prefixed packet
+LISTEN_BACKLOG = 128  # Pending connections queued by listening sockets
+SOCKET_TIMEOUT = 300  # Seconds a TCP connect may take (5 minutes)
+ENCODING = 'utf-8'
+TCP_NODELAY = True  # Disable Nagle's algorithm (small packets go out immediately)
+SOCKET_SNDBUF = 0  # SO_SNDBUF in bytes (0 = OS default)
+SOCKET_RCVBUF = 0  # SO_RCVBUF in bytes (0 = OS default)
+
+# Transport for the relay links (all components must agree):
+# 'tcp', 'unix' (Unix domain sockets), 'shm' (shared-memory ring buffer) or
+# 'udp' (one datagram per packet, no retransmission); 'unix' and 'shm' need
+# all components on one POSIX host
+TRANSPORT = 'tcp'
+UNIX_SOCKET_DIR = ''  # Directory for datacom-<port>.sock files ('' = system temp dir)
+SHM_RING_SIZE = 4 * 1024 * 1024  # Bytes per shared-memory ring
+UDP_REORDER_WINDOW = 1024  # Missing sequence numbers remembered per sender
+
+# Relay Pipeline Configuration (Server)
+PIPELINE_QUEUE_SIZE = 64  # Max packets queued between relay stages
+INJECT_WORKERS = 1  # Injector threads (more than 1 may reorder packets)
+# Forward batching: queued packets are sent to Client 2 together, flushed at
+# whichever limit is reached first. The wait adapts to load (none when idle)
+FORWARD_BATCH_PACKETS = 64  # Max packets per batch
+FORWARD_BATCH_BYTES = 256 * 1024  # Max payload bytes per batch
+FORWARD_BATCH_DELAY_US = 500  # Max microseconds to wait for a batch to fill (0 = never wait)
+
+# Payload Compression (Client 1; Client 2 follows the packet header)
+COMPRESSION = 'none'  # 'none', 'zlib' or 'lzma'
+COMPRESSION_THRESHOLD = 1024  # Payloads shorter than this (characters) are sent as-is
+COMPRESSION_LEVEL = 1  # zlib level / lzma preset (0-9, higher = smaller but slower)
+
+# Traffic Capture (Server --capture)
+CAPTURE_BUFFER_SIZE = 1024 * 1024  # Write buffer for capture files
+CAPTURE_FSYNC_INTERVAL = 1.0  # Seconds between fsync calls
+
+# Runtime overrides: every setting listed in utils/settings.py can be changed
+# without editing this file, from a JSON/TOML file (--config PATH or
+# $DATACOM_CONFIG), DATACOM_<NAME> environment variables or --set NAME=VALUE
+
+# Packet Format
+PACKET_DELIMITER = '|'
+PACKET_FORMAT = 'DATA|METHOD|CONTROL_INFO[|HEADER]'  # HEADER: key=value;key=value
+
+# Error Detection Methods
+ERROR_DETECTION_METHODS = {
+    '1': 'PARITY',
+    '2': '2D_PARITY',
+    '3': 'CRC',
+    '4': 'HAMMING',
+    '5': 'CHECKSUM',
+    '6': 'FLETCHER16',
+    '7': 'FLETCHER32',
+    '8': 'ADLER32',
+    '9': 'CRC32C'
+}
+
+# Error Injection Types (for Server)
+ERROR_INJECTION_TYPES = {
+    '1': 'BIT_FLIP',
+    '2': 'CHAR_SUBSTITUTION',
+    '3': 'CHAR_DELETION',
+    '4': 'CHAR_INSERTION',
+    '5': 'CHAR_SWAP',
+    '6': 'MULTIPLE_BIT_FLIPS',
+    '7': 'BURST_ERROR',
+    '8': 'NO_ERROR'  # For testing without corruption
+}
+
+# CRC Configuration
+CRC_POLYNOMIAL = 0x107  # CRC-8 polynomial (x^8 + x^2 + x + 1)
+CRC_POLYNOMIAL_16 = 0x11021  # CRC-16 CCITT
+CRC_POLYNOMIAL_32 = 0x104C11DB7  # CRC-32
+CRC32C_POLYNOMIAL = 0x82F63B78  # CRC-32C (Castagnoli), reflected
+
+# Detector backend: 'auto' uses the C library in utils/native when it has been
+# built (python -m utils.native_backend) and NumPy for 2D parity/Hamming on large
+# payloads; 'native' or 'numpy' selects one backend, 'python' the reference code
+DETECTOR_BACKEND = 'auto'
+NUMPY_THRESHOLD = 4096  # Minimum payload length (characters) for the NumPy backend
+# Split CRC, CRC-32C and CHECKSUM of huge payloads across worker processes
+PARALLEL_DETECTORS = False
+PARALLEL_THRESHOLD = 8 * 1024 * 1024  # Minimum payload length (characters) for parallel mode
+PARALLEL_WORKERS = 0  # Worker processes (0 = one per CPU; fewer than 2 stays serial)
+
+# Benchmark Regression Suite (benchmarks/bench_regression.py)
+BENCHMARK_SIZES = [16, 256, 4096, 65536]
+# Opt-in (run_regression.py --large); detectors only run them on native/NumPy backends
+BENCHMARK_LARGE_SIZES = [1024 * 1024, 16 * 1024 * 1024]
+BENCHMARK_LARGE = False
+BENCHMARK_LARGE_SIZE = 1024 * 1024  # From this size on, run a fixed number of rounds
+BENCHMARK_LARGE_ROUNDS = 3
+BENCHMARK_STORAGE = 'benchmarks/baselines'
+BENCHMARK_TOLERANCE = 15  # Percent slowdown of the mean that counts as a regression
+CROSSCHECK_HUGE_SIZE = 16 * 1024  # Large input added to benchmarks/crosscheck.py runs (keep runs quick)
+
+# Control Info Cache (repeated payloads)
+DETECTOR_CACHE_ENABLED = False
+DETECTOR_CACHE_MAX_ENTRIES = 4096
+DETECTOR_CACHE_MAX_BYTES = 8 * 1024 * 1024
+DETECTOR_CACHE_SMALL_PAYLOAD = 256  # Longer payloads are keyed by digest
+
+# 2D Parity Configuration
+PARITY_MATRIX_ROWS = 4
+PARITY_MATRIX_COLS = 8
+
+# Logging Configuration
+LOG_DIRECTORY = 'logs'
+LOG_LEVEL = 'INFO'
+ENABLE_FILE_LOGGING = True
+ENABLE_CONSOLE_LOGGING = True
+ASYNC_LOGGING = True  # Write log records from a background thread
+LOG_SAMPLE_EVERY = 1  # Log 1 in N per-packet messages (1 = log every packet)
+
+# Tracing Configuration
+TRACING_ENABLED = False  # Client 1 attaches trace id and timestamps to packets
+TRACE_REPORT_INTERVAL = 10.0  # Seconds between Client 2 per-hop latency reports
+
+# Metrics Configuration
+METRICS_ENABLED = False  # Record counters, gauges and latency histograms
+METRICS_PORT = 0  # Local Prometheus-text endpoint port (0 = no endpoint)
+
+# Colors for console output (using colorama)
+COLORS_ENABLED = True
+
+# Quiet/throughput mode: no per-packet console output, periodic summary instead
+QUIET_MODE = False
+SUMMARY_INTERVAL = 5.0  # Seconds between throughput summary lines
@@ -0,0 +1,331 @@
+"""
+Error injection methods for simulating transmission errors
+"""
+
+import random
+
+from datacom import config
+
+
+class ErrorInjector:
+    """Class containing various error injection methods"""
+    
+    @staticmethod
+    def bit_flip(data, num_flips=1, rng=None):
+        """
+        Flip random bits in the data
+        
+        Args:
+            data: Input string
+            num_flips: Number of bits to flip
+            rng: Random number source (default: global random module)
+            
+        Returns:
+            Corrupted data
+        """
+        rng = rng or random
+        
+        if not data:
+            return data
+        
+        # Convert to binary
+        binary = ''.join(format(ord(char), '08b') for char in data)
+        binary_list = list(binary)
+        
+        # Flip random bits
+        for _ in range(num_flips):
+            if len(binary_list) > 0:
+                pos = rng.randint(0, len(binary_list) - 1)
+                binary_list[pos] = '0' if binary_list[pos] == '1' else '1'
+        
+        # Convert back to string
+        binary_str = ''.join(binary_list)
+        chars = [binary_str[i:i+8] for i in range(0, len(binary_str), 8)]
+        
+        try:
+            result = ''.join(chr(int(char, 2)) for char in chars if len(char) == 8)
+            return result
+        except ValueError:
+            return data
+    
+    @staticmethod
+    def char_substitution(data, rng=None):
+        """
+        Replace a random character with another random character
+        
+        Args:
+            data: Input string
+            rng: Random number source (default: global random module)
+            
+        Returns:
+            Corrupted data
+        """
+        rng = rng or random
+        
+        if len(data) < 1:
+            return data
+        
+        data_list = list(data)
+        pos = rng.randint(0, len(data_list) - 1)
+        
+        # Random ASCII printable character
+        new_char = chr(rng.randint(33, 126))
+        data_list[pos] = new_char
+        
+        return ''.join(data_list)
+    
+    @staticmethod
+    def char_deletion(data, rng=None):
+        """
+        Delete a random character
+        
+        Args:
+            data: Input string
+            rng: Random number source (default: global random module)
+            
+        Returns:
+            Corrupted data
+        """
+        rng = rng or random
+        
+        if len(data) < 1:
+            return data
+        
+        pos = rng.randint(0, len(data) - 1)
+        return data[:pos] + data[pos+1:]
+    
+    @staticmethod
+    def char_insertion(data, rng=None):
+        """
+        Insert a random character at a random position
+        
+        Args:
+            data: Input string
+            rng: Random number source (default: global random module)
+            
+        Returns:
+            Corrupted data
+        """
+        rng = rng or random
+        
+        if not data:
+            return data
+        
+        pos = rng.randint(0, len(data))
+        new_char = chr(rng.randint(33, 126))
+        
+        return data[:pos] + new_char + data[pos:]
+    
+    @staticmethod
+    def char_swap(data, rng=None):
+        """
+        Swap two adjacent characters
+        
+        Args:
+            data: Input string
+            rng: Random number source (default: global random module)
+            
+        Returns:
+            Corrupted data
+        """
+        rng = rng or random
+        
+        if len(data) < 2:
+            return data
+        
+        pos = rng.randint(0, len(data) - 2)
+        data_list = list(data)
+        data_list[pos], data_list[pos + 1] = data_list[pos + 1], data_list[pos]
+        
+        return ''.join(data_list)
+    
+    @staticmethod
+    def multiple_bit_flips(data, num_flips=3, rng=None):
+        """
+        Flip multiple random bits
+        
+        Args:
+            data: Input string
+            num_flips: Number of bits to flip
+            rng: Random number source (default: global random module)
+            
+        Returns:
+            Corrupted data
+        """
+        return ErrorInjector.bit_flip(data, num_flips, rng)
+    
+    @staticmethod
+    def burst_error(data, burst_length=3, rng=None):
+        """
+        Introduce a burst error (consecutive bit flips)
+        
+        Args:
+            data: Input string
+            burst_length: Number of consecutive bits to flip
+            rng: Random number source (default: global random module)
+            
+        Returns:
+            Corrupted data
+        """
+        rng = rng or random
+        
+        if not data:
+            return data
+        
+        # Convert to binary
+        binary = ''.join(format(ord(char), '08b') for char in data)
+        binary_list = list(binary)
+        
+        if len(binary_list) < burst_length:
+            burst_length = len(binary_list)
+        
+        # Choose random starting position
+        start_pos = rng.randint(0, len(binary_list) - burst_length)
+        
+        # Flip consecutive bits
+        for i in range(start_pos, start_pos + burst_length):
+            binary_list[i] = '0' if binary_list[i] == '1' else '1'
+        
+        # Convert back to string
+        binary_str = ''.join(binary_list)
+        chars = [binary_str[i:i+8] for i in range(0, len(binary_str), 8)]
+        
+        try:
+            result = ''.join(chr(int(char, 2)) for char in chars if len(char) == 8)
+            return result
+        except ValueError:
+            return data
+    
+    @staticmethod
+    def no_error(data, rng=None):
+        """
+        Return data without any corruption (for testing)
+        
+        Args:
+            data: Input string
+            rng: Random number source (default: global random module)
+            
+        Returns:
+            Original data unchanged
+        """
+        return data
+
+
+# Injector registry: resolved once at registration, dispatched by integer id
+INJECTOR_PLUGIN_GROUP = 'datacom.error_injectors'
+INJECTORS = []
+INJECTOR_IDS = {}
+_plugins_loaded = False
+
+
+def register_injector(injection_type, injector_func, replace=False):
+    """
+    Register an error injection function
+    
+    Args:
+        injection_type: Injection type name (case-insensitive)
+        injector_func: Callable taking (data, rng=None) and returning corrupted
+            data; rng is the random.Random to draw positions from
+        replace: Replace an existing registration instead of raising
+        
+    Returns:
+        Integer injector id
+    """
+    name = injection_type.upper()
+    
+    if name in INJECTOR_IDS:
+        if not replace:
+            raise ValueError(f"Injector already registered: {name}")
+        injector_id = INJECTOR_IDS[name]
+        INJECTORS[injector_id] = injector_func
+        return injector_id
+    
+    INJECTORS.append(injector_func)
+    INJECTOR_IDS[name] = len(INJECTORS) - 1
+    return INJECTOR_IDS[name]
+
+
+def load_injector_plugins(group=INJECTOR_PLUGIN_GROUP):
+    """
+    Register injectors advertised by installed packages
+    
+    Each entry point in the group is named after the injection type and
+    loads the injection function.
+    
+    Returns:
+        List of registered injection type names
+    """
+    from importlib.metadata import entry_points
+    
+    eps = entry_points()
+    group_eps = eps.select(group=group) if hasattr(eps, 'select') else eps.get(group, [])
+    
+    registered = []
+    for ep in group_eps:
+        if ep.name.upper() not in INJECTOR_IDS:
+            register_injector(ep.name, ep.load())
+            registered.append(ep.name.upper())
+    return registered
+
+
+def get_injector_id(injection_type):
+    """
+    Resolve an injection type name to its integer injector id
+    
+    Installed plugins are loaded the first time an unknown name is looked up.
+    
+    Args:
+        injection_type: Name of error injection type
+        
+    Returns:
+        Integer id, or None if unknown
+    """
+    global _plugins_loaded
+    
+    injector_id = INJECTOR_IDS.get(injection_type)
+    if injector_id is None:
+        injector_id = INJECTOR_IDS.get(injection_type.upper())
+    
+    if injector_id is None and not _plugins_loaded:
+        _plugins_loaded = True
+        load_injector_plugins()
+        injector_id = INJECTOR_IDS.get(injection_type.upper())
+    
+    return injector_id
+
+
+def get_injector_by_id(injector_id):
+    """
+    Get error injection function by integer id
+    
+    Args:
+        injector_id: Id returned by register_injector/get_injector_id
+        
+    Returns:
+        Error injection function
+    """
+    return INJECTORS[injector_id]
+
+
+def get_error_injector(injection_type):
+    """
+    Get error injection function based on type
+    
+    Args:
+        injection_type: Name of error injection type
+        
+    Returns:
+        Error injection function
+    """
+    injector_id = get_injector_id(injection_type)
+    return INJECTORS[injector_id] if injector_id is not None else None
+
+
+register_injector('BIT_FLIP', ErrorInjector.bit_flip)
+register_injector('CHAR_SUBSTITUTION', ErrorInjector.char_substitution)
+register_injector('CHAR_DELETION', ErrorInjector.char_deletion)
+register_injector('CHAR_INSERTION', ErrorInjector.char_insertion)
+register_injector('CHAR_SWAP', ErrorInjector.char_swap)
+register_injector('MULTIPLE_BIT_FLIPS', ErrorInjector.multiple_bit_flips)
+register_injector('BURST_ERROR', ErrorInjector.burst_error)
+register_injector('NO_ERROR', ErrorInjector.no_error)
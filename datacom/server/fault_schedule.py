@@ -0,0 +1,223 @@
+"""
+Reproducible fault injection schedules
+Seeded per-stream random sources for the error injectors, plus a compact
+binary log of every injection applied so a schedule can be replayed
+exactly against the same traffic
+"""
+
+import random
+import struct
+import threading
+
+from datacom.server.error_injector import INJECTOR_IDS, get_error_injector
+
+# File layout: header, type-name table, then one record per injection
+#   header:  magic, version, seed flag, seed, name table length
+#   record:  injection type index, number of draws, payload length, draws
+# A record with type index NAME_RECORD instead appends one name (its length
+# in the draw count field, then the ASCII name) to the table, for injectors
+# registered after the file was created (version 2).
+MAGIC = b'DCFS'
+VERSION = 2
+_READABLE_VERSIONS = (1, 2)
+NAME_RECORD = 0xFF
+_HEADER = struct.Struct('<4sBBqH')
+_RECORD = struct.Struct('<BHI')
+_DRAW = struct.Struct('<I')
+
+
+class RecordingRandom(random.Random):
+    """random.Random that remembers every randint() result"""
+
+    def __init__(self, seed=None):
+        super().__init__(seed)
+        self.draws = []
+
+    def randint(self, a, b):
+        value = super().randint(a, b)
+        self.draws.append(value)
+        return value
+
+
+class ReplayRandom:
+    """Random source that returns previously recorded randint() results"""
+
+    def __init__(self, draws):
+        self.draws = list(draws)
+        self._index = 0
+
+    def randint(self, a, b):
+        if self._index >= len(self.draws):
+            raise ValueError("Fault schedule has fewer draws than the injector requested")
+
+        value = self.draws[self._index]
+        self._index += 1
+        if not a <= value <= b:
+            raise ValueError(f"Recorded draw {value} outside [{a}, {b}]: traffic does not match schedule")
+        return value
+
+
+class ScheduleWriter:
+    """Append injections to a binary fault schedule"""
+
+    def __init__(self, path, seed=None):
+        """
+        Create schedule file
+
+        Args:
+            path: Output file path
+            seed: Seed of the recorded stream (stored for reference)
+        """
+        self.names = list(INJECTOR_IDS)[:NAME_RECORD]
+        self._index = {name: i for i, name in enumerate(self.names)}
+        table = ';'.join(self.names).encode('ascii')
+
+        self.file = open(path, 'wb')
+        self.file.write(_HEADER.pack(MAGIC, VERSION, seed is not None, seed or 0, len(table)))
+        self.file.write(table)
+
+    def record(self, injection_type, data_length, draws):
+        """
+        Append one applied injection
+
+        Args:
+            injection_type: Injection type name
+            data_length: Length of the payload it was applied to
+            draws: Positions/characters drawn by the injector
+        """
+        self.file.write(_RECORD.pack(self._type_index(injection_type.upper()), len(draws), data_length))
+        self.file.write(b''.join(_DRAW.pack(draw) for draw in draws))
+
+    def _type_index(self, name):
+        """Index of a type name, appending it to the table if new"""
+        index = self._index.get(name)
+        if index is None:
+            if len(self.names) >= NAME_RECORD:
+                raise ValueError("Fault schedule name table is full")
+            encoded = name.encode('ascii')
+            self.file.write(_RECORD.pack(NAME_RECORD, len(encoded), 0))
+            self.file.write(encoded)
+            index = self._index[name] = len(self.names)
+            self.names.append(name)
+        return index
+
+    def close(self):
+        """Flush and close the file"""
+        self.file.close()
+
+
+class ScheduleReader:
+    """Read injections back from a binary fault schedule"""
+
+    def __init__(self, path):
+        """
+        Load schedule file
+
+        Args:
+            path: Schedule file path
+        """
+        with open(path, 'rb') as f:
+            content = f.read()
+
+        magic, version, has_seed, seed, table_length = _HEADER.unpack_from(content)
+        if magic != MAGIC or version not in _READABLE_VERSIONS:
+            raise ValueError(f"Not a fault schedule: {path}")
+
+        offset = _HEADER.size
+        self.seed = seed if has_seed else None
+        self.names = content[offset:offset + table_length].decode('ascii').split(';')
+        offset += table_length
+
+        self.events = []
+        while offset < len(content):
+            type_index, count, data_length = _RECORD.unpack_from(content, offset)
+            offset += _RECORD.size
+            if type_index == NAME_RECORD:
+                self.names.append(content[offset:offset + count].decode('ascii'))
+                offset += count
+                continue
+            draws = [_DRAW.unpack_from(content, offset + i * _DRAW.size)[0] for i in range(count)]
+            offset += count * _DRAW.size
+            self.events.append((self.names[type_index], data_length, draws))
+
+    def __iter__(self):
+        return iter(self.events)
+
+    def __len__(self):
+        return len(self.events)
+
+
+class InjectionStream:
+    """
+    Per-stream fault injection with an explicit seed
+
+    In record mode every applied injection is written to a schedule file;
+    in replay mode the recorded types and positions are applied instead of
+    drawing new ones. Injections are applied one at a time, so the draws
+    and records of concurrent callers never mix; the order still follows
+    the callers, so only a single caller gives a reproducible schedule.
+    """
+
+    def __init__(self, seed=None, record_path=None, replay_path=None):
+        """
+        Initialize stream
+
+        Args:
+            seed: Seed for this stream's random.Random (None: OS entropy)
+            record_path: Optional schedule file to record into
+            replay_path: Optional schedule file to replay
+        """
+        self.seed = seed
+        self.rng = RecordingRandom(seed)
+        self.writer = ScheduleWriter(record_path, seed) if record_path else None
+        self.replay_events = iter(ScheduleReader(replay_path)) if replay_path else None
+        self._lock = threading.Lock()
+
+    @property
+    def deterministic(self):
+        """True if the faults must follow a seed or schedule file"""
+        return self.seed is not None or self.writer is not None or self.replaying
+
+    @property
+    def replaying(self):
+        """True if injections come from a recorded schedule"""
+        return self.replay_events is not None
+
+    def apply(self, data, injection_type=None, injector_func=None):
+        """
+        Apply the next injection to a payload
+
+        Args:
+            data: Payload string
+            injection_type: Injection type name (ignored while replaying)
+            injector_func: Already resolved injector for injection_type
+
+        Returns:
+            tuple: (corrupted data, injection type applied)
+        """
+        if self.replaying:
+            with self._lock:
+                try:
+                    injection_type, data_length, draws = next(self.replay_events)
+                except StopIteration:
+                    raise ValueError("Fault schedule exhausted")
+            if data_length != len(data):
+                raise ValueError(f"Payload length {len(data)} does not match recorded {data_length}")
+            return get_error_injector(injection_type)(data, rng=ReplayRandom(draws)), injection_type
+
+        if injector_func is None:
+            injector_func = get_error_injector(injection_type)
+
+        with self._lock:
+            self.rng.draws = []
+            corrupted = injector_func(data, rng=self.rng)
+            if self.writer:
+                self.writer.record(injection_type, len(data), self.rng.draws)
+        return corrupted, injection_type
+
+    def close(self):
+        """Close the schedule file if recording"""
+        with self._lock:
+            if self.writer:
+                self.writer.close()
+                self.writer = None
@@ -0,0 +1,408 @@
+"""
+Relay pipeline for the Server
+Splits the relay into reader -> injector -> forwarder stages connected by
+bounded queues, so a slow Client 2 applies backpressure instead of
+blocking the receive loop directly
+"""
+
+import queue
+import threading
+import time
+
+from datacom import config
+from datacom.utils import metrics
+
+
+# Sentinel used to shut the stages down in order
+_STOP = object()
+
+# Seconds between checks of the stop event while blocked on a queue
+_POLL_INTERVAL = 0.05
+
+# Why a batch was handed to forward_batch_func
+FLUSH_REASONS = ('packets', 'bytes', 'timeout', 'idle')
+
+
+def _remaining(deadline):
+    """Seconds left until a time.monotonic() deadline (None: no deadline)"""
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+class BatchPolicy:
+    """
+    Adaptive flush policy for the batch forward stage
+
+    A batch is flushed once it holds max_packets packets or max_bytes bytes,
+    or when the queue runs dry. While the forwarder keeps finding packets
+    already waiting (high load), it also lingers for up to `linger` seconds
+    so more can join the batch; the linger doubles each time batches fill up
+    and halves each time waiting gained nothing, falling back to zero (send
+    immediately, like TCP_NODELAY) at low rates. max_delay_us caps it.
+
+    Only the linger adapts; the packet and byte limits stay fixed caps. At
+    low rates batches end when the queue runs dry, well below the caps, so
+    lowering them would change nothing, and raising them under load would
+    exceed the limits the operator configured.
+    """
+
+    def __init__(self, max_packets=None, max_bytes=None, max_delay_us=None):
+        """
+        Initialize policy
+
+        Args:
+            max_packets: Flush at this many packets (default: config.FORWARD_BATCH_PACKETS)
+            max_bytes: Flush at this many payload bytes (default: config.FORWARD_BATCH_BYTES)
+            max_delay_us: Longest linger in microseconds, 0 disables lingering
+                (default: config.FORWARD_BATCH_DELAY_US)
+        """
+        self.max_packets = max_packets or config.FORWARD_BATCH_PACKETS
+        self.max_bytes = max_bytes or config.FORWARD_BATCH_BYTES
+        if max_delay_us is None:
+            max_delay_us = config.FORWARD_BATCH_DELAY_US
+        self.max_delay = max_delay_us / 1e6
+        self.linger = 0.0
+
+    @property
+    def linger_us(self):
+        """Current linger in microseconds"""
+        return self.linger * 1e6
+
+    def update(self, reason, size, gained):
+        """
+        Adapt the linger after a flush
+
+        Args:
+            reason: Flush reason (one of FLUSH_REASONS)
+            size: Packets in the flushed batch
+            gained: Packets that arrived while lingering
+        """
+        if reason in ('packets', 'bytes') or (reason == 'idle' and size > 1):
+            # Backlog: waiting a little longer fills batches for free
+            self.linger = min(self.max_delay, max(self.linger * 2, self.max_delay / 8))
+        elif reason == 'timeout' and not gained:
+            # Waiting added latency without coalescing anything
+            self.linger /= 2
+            if self.linger < self.max_delay / 64:
+                self.linger = 0.0
+
+
+class RelayPipeline:
+    """Bounded, multi-stage relay pipeline (reader -> injector -> forwarder)"""
+
+    STAGES = ('inject', 'forward')
+
+    def __init__(self, inject_func, forward_func, queue_size=None, inject_workers=None,
+                 forward_batch_func=None, batch_policy=None, item_size=None):
+        """
+        Initialize pipeline
+
+        Args:
+            inject_func: Callable taking a packet and returning the packet to forward
+            forward_func: Callable taking a packet and sending it downstream; it
+                raises on failure so the packet is counted as a stage error
+            queue_size: Maximum depth of each stage queue
+            inject_workers: Number of injector threads (more than one may reorder packets)
+            forward_batch_func: Optional callable taking a list of packets; when set, the
+                forwarder coalesces queued packets into batches according to batch_policy
+                so they can be sent together, instead of calling forward_func per packet
+                (a failed batch counts every packet in it as an error)
+            batch_policy: BatchPolicy for the batch forwarder (default: from config)
+            item_size: Callable giving a packet's size in bytes for the byte limit
+                (default: length of its encoded data, which to_buffers() reuses)
+        """
+        if queue_size is None:
+            queue_size = config.PIPELINE_QUEUE_SIZE
+        if inject_workers is None:
+            inject_workers = config.INJECT_WORKERS
+
+        self.inject_workers = inject_workers
+        self.inject_func = inject_func
+        self.forward_func = forward_func
+        self.forward_batch_func = forward_batch_func
+        self.batch_policy = batch_policy or BatchPolicy()
+        self.item_size = item_size or (lambda packet: len(packet.encoded_data()))
+        self.queues = {stage: queue.Queue(maxsize=queue_size) for stage in self.STAGES}
+        self.running = False
+        self._threads = []
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._active_injectors = 0
+        self._stats = {
+            stage: {'processed': 0, 'blocked': 0, 'high_water': 0, 'errors': 0, 'dropped': 0}
+            for stage in self.STAGES
+        }
+        self._batch_stats = {'batches': 0, **{f'flush_{reason}': 0 for reason in FLUSH_REASONS}}
+
+    def start(self):
+        """Start the injector and forwarder threads"""
+        if self.running:
+            return
+
+        self.running = True
+        self._stopping.clear()
+        self._active_injectors = self.inject_workers
+        self._threads = [
+            threading.Thread(target=self._run_stage,
+                             args=('inject', self.inject_func, 'forward'),
+                             name=f'relay-injector-{i}', daemon=True)
+            for i in range(self.inject_workers)
+        ]
+        if self.forward_batch_func is not None:
+            forwarder = threading.Thread(target=self._run_batch_stage,
+                                         args=('forward', self.forward_batch_func),
+                                         name='relay-forwarder', daemon=True)
+        else:
+            forwarder = threading.Thread(target=self._run_stage,
+                                         args=('forward', self.forward_func, None),
+                                         name='relay-forwarder', daemon=True)
+        self._threads.append(forwarder)
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, packet, timeout=None):
+        """
+        Hand a parsed packet from the reader stage to the injector stage
+
+        Blocks while the injector queue is full (backpressure).
+
+        Args:
+            packet: Packet object received from Client 1
+            timeout: Optional maximum time to wait for queue space
+
+        Returns:
+            True if queued, False if the timeout expired or the pipeline was
+            stopped while waiting
+        """
+        try:
+            self._put('inject', packet, timeout)
+            return True
+        except queue.Full:
+            return False
+
+    def stop(self, timeout=None):
+        """
+        Stop the pipeline after draining packets already queued
+
+        If the stages cannot drain in time (e.g. Client 2 stalls and both
+        queues are full), the stop event makes them give up on queued
+        packets instead, and stop() returns at the deadline; a stage stuck
+        inside its own function is left to finish as a daemon thread.
+
+        Args:
+            timeout: Optional total time to wait for the stages (None: drain fully)
+        """
+        if not self.running:
+            return
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for _ in range(self.inject_workers):
+            if not self._put_until_stopped(self.queues['inject'], _STOP, _remaining(deadline)):
+                break
+        for thread in self._threads:
+            thread.join(_remaining(deadline))
+        # Abandon whatever is still queued; stages exit at their next poll
+        self._stopping.set()
+        self._threads = []
+        self.running = False
+
+    def queue_depths(self):
+        """
+        Get current depth of each stage queue
+
+        Returns:
+            dict mapping stage name to number of queued packets
+        """
+        return {stage: q.qsize() for stage, q in self.queues.items()}
+
+    def get_metrics(self):
+        """
+        Get per-stage queue metrics
+
+        Returns:
+            dict mapping stage name to depth, capacity, high-water mark,
+            processed, blocked, error and dropped counts; with a batch forwarder the
+            forward stage also reports batch and flush-reason counts and the
+            current linger in microseconds
+        """
+        with self._lock:
+            stage_metrics = {stage: dict(stats) for stage, stats in self._stats.items()}
+            if self.forward_batch_func is not None:
+                stage_metrics['forward'].update(self._batch_stats)
+                stage_metrics['forward']['linger_us'] = self.batch_policy.linger_us
+
+        for stage, q in self.queues.items():
+            stage_metrics[stage]['depth'] = q.qsize()
+            stage_metrics[stage]['capacity'] = q.maxsize
+
+        return stage_metrics
+
+    def _put_until_stopped(self, q, item, timeout=None):
+        """
+        Put item on a queue, waiting for space until the timeout or stop
+
+        Returns:
+            True if queued, False if the timeout expired or the pipeline is stopping
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self._stopping.is_set():
+            remaining = _remaining(deadline)
+            if remaining == 0:
+                return False
+            try:
+                q.put(item, timeout=min(_POLL_INTERVAL, remaining or _POLL_INTERVAL))
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _get_until_stopped(self, q):
+        """Take the next item off a queue, or _STOP once the pipeline is stopping"""
+        while not self._stopping.is_set():
+            try:
+                return q.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                pass
+        return _STOP
+
+    def _put(self, stage, item, timeout=None):
+        """
+        Put item on a stage queue, recording backpressure
+
+        Raises:
+            queue.Full: If the timeout expired or the pipeline is stopping
+        """
+        q = self.queues[stage]
+        try:
+            q.put_nowait(item)
+        except queue.Full:
+            with self._lock:
+                self._stats[stage]['blocked'] += 1
+            if not self._put_until_stopped(q, item, timeout):
+                raise queue.Full
+
+        depth = q.qsize()
+        with self._lock:
+            if depth > self._stats[stage]['high_water']:
+                self._stats[stage]['high_water'] = depth
+
+    def _stage_finished(self, stage):
+        """Record a worker exiting; True once the stage's last worker is done"""
+        if stage != 'inject':
+            return True
+        with self._lock:
+            self._active_injectors -= 1
+            return self._active_injectors == 0
+
+    def _run_stage(self, stage, func, next_stage):
+        """Worker loop for a single stage"""
+        q = self.queues[stage]
+
+        while True:
+            item = self._get_until_stopped(q)
+
+            if item is _STOP:
+                if next_stage and self._stage_finished(stage):
+                    self._put_until_stopped(self.queues[next_stage], _STOP)
+                break
+
+            try:
+                result = func(item)
+            except Exception:
+                with self._lock:
+                    self._stats[stage]['errors'] += 1
+                continue
+
+            with self._lock:
+                self._stats[stage]['processed'] += 1
+
+            if next_stage and result is not None:
+                try:
+                    self._put(next_stage, result)
+                except queue.Full:
+                    # Stopped while the next stage was full
+                    with self._lock:
+                        self._stats[next_stage]['dropped'] += 1
+
+    def _collect_batch(self, q):
+        """
+        Take the next batch off a queue according to the batch policy
+
+        Returns:
+            tuple: (packets, flush reason (None if stopped with nothing queued),
+            packets gained while lingering, seconds since the first packet, stop seen)
+        """
+        policy = self.batch_policy
+        item = self._get_until_stopped(q)
+        if item is _STOP:
+            return [], None, 0, 0.0, True
+
+        started = time.perf_counter()
+        batch = [item]
+        size = self.item_size(item)
+        backlog = None
+        reason = stop = None
+        while True:
+            if len(batch) >= policy.max_packets:
+                reason = 'packets'
+                break
+            if size >= policy.max_bytes:
+                reason = 'bytes'
+                break
+            try:
+                item = q.get_nowait()
+            except queue.Empty:
+                if backlog is None:
+                    backlog = len(batch)
+                remaining = started + policy.linger - time.perf_counter()
+                if remaining <= 0:
+                    reason = 'timeout' if policy.linger else 'idle'
+                    break
+                try:
+                    item = q.get(timeout=remaining)
+                except queue.Empty:
+                    reason = 'timeout'
+                    break
+            if item is _STOP:
+                reason, stop = 'idle', True
+                break
+            batch.append(item)
+            size += self.item_size(item)
+
+        gained = len(batch) - backlog if backlog is not None else 0
+        return batch, reason, gained, time.perf_counter() - started, stop
+
+    def _run_batch_stage(self, stage, func):
+        """Worker loop for a final stage that sends packets in adaptive batches"""
+        q = self.queues[stage]
+
+        while True:
+            batch, reason, gained, waited, stop = self._collect_batch(q)
+
+            if reason is not None:
+                self.batch_policy.update(reason, len(batch), gained)
+                with self._lock:
+                    self._batch_stats['batches'] += 1
+                    self._batch_stats[f'flush_{reason}'] += 1
+                if metrics.REGISTRY.enabled:
+                    metrics.REGISTRY.counter(f'server_forward_flush_{reason}',
+                                             f"Forward batches flushed by {reason}").inc()
+                    metrics.REGISTRY.histogram('server_forward_batch_packets',
+                                               "Packets per forwarded batch").record(len(batch))
+                    metrics.REGISTRY.histogram('server_forward_batch_wait',
+                                               "Time the first packet of a batch waited for "
+                                               "the batch to fill").record(int(waited * 1e9))
+
+            if batch:
+                try:
+                    func(batch)
+                except Exception:
+                    with self._lock:
+                        self._stats[stage]['errors'] += len(batch)
+                else:
+                    with self._lock:
+                        self._stats[stage]['processed'] += len(batch)
+
+            if stop:
+                break
@@ -0,0 +1,390 @@
+"""
+Server - Intermediate Node and Data Corruptor
+Receives data from Client 1, corrupts it, and forwards to Client 2
+"""
+
+import argparse
+import sys
+import threading
+
+from datacom import config
+from datacom.utils import metrics, settings, socket_utils, tracing, transport
+from datacom.utils.capture import CaptureWriter, PRE_CORRUPTION, POST_CORRUPTION
+from datacom.utils.packet_handler import parse_packet, create_packet
+from datacom.utils.logger_utils import (
+    Logger, ThroughputReporter, print_header, print_section, print_colored,
+    print_success, print_error, print_info, print_packet_info,
+    is_quiet, set_quiet_mode
+)
+from datacom.server.error_injector import get_error_injector
+from datacom.server.pipeline import RelayPipeline
+from datacom.server.fault_schedule import InjectionStream
+
+
+def check_fault_stream(fault_stream):
+    """
+    Reject settings that would make seeded, recorded or replayed faults
+    depend on thread scheduling
+    
+    Args:
+        fault_stream: InjectionStream the injector workers will share
+        
+    Raises:
+        settings.ConfigError: If INJECT_WORKERS > 1 and the stream is deterministic
+            (--seed, --record-faults or --replay-faults)
+    """
+    if config.INJECT_WORKERS > 1 and fault_stream.deterministic:
+        raise settings.ConfigError("INJECT_WORKERS must be 1 with --seed, --record-faults "
+                                   "or --replay-faults (workers would take faults in any order)")
+
+
+class Server:
+    """Server - Intermediate Node with Error Injection"""
+    
+    def __init__(self, injection_type=None, seed=None, record_path=None, replay_path=None,
+                 capture_path=None):
+        """
+        Initialize Server
+        
+        Args:
+            injection_type: Fixed error injection type; prompt per packet if None
+            seed: Seed for the fault injection random stream
+            record_path: Optional file to record the applied fault schedule into
+            replay_path: Optional recorded fault schedule to re-apply
+            capture_path: Optional capture file to tee packets into
+            
+        Raises:
+            settings.ConfigError: If the fault stream cannot be reproduced with
+                config.INJECT_WORKERS injector threads
+        """
+        self.logger = Logger('Server', 'server.log')
+        self.injection_type = injection_type
+        self.injector_func = get_error_injector(injection_type) if injection_type else None
+        self._prompt_lock = threading.Lock()
+        self.reporter = ThroughputReporter('Server')
+        self.fault_stream = InjectionStream(seed, record_path, replay_path)
+        try:
+            check_fault_stream(self.fault_stream)
+        except settings.ConfigError:
+            self.fault_stream.close()
+            raise
+        self.capture = CaptureWriter(capture_path) if capture_path else None
+        self.client1_socket = None
+        self.client2_socket = None
+        self.running = False
+        self.pipeline = RelayPipeline(self.inject_stage, self.forward_to_client2,
+                                      forward_batch_func=self.forward_batch)
+        
+        for stage, stage_queue in self.pipeline.queues.items():
+            metrics.REGISTRY.gauge(f"server_queue_depth_{stage}",
+                                   f"Packets waiting for the {stage} stage",
+                                   func=stage_queue.qsize)
+        metrics.REGISTRY.gauge('server_ready', "1 while the server accepts Client 1",
+                               func=lambda: int(self.running))
+        metrics.REGISTRY.gauge('server_forward_linger_us',
+                               "Current forward batching linger in microseconds",
+                               func=lambda: self.pipeline.batch_policy.linger_us)
+        
+    def start(self):
+        """Start the server"""
+        print_header("Server - Intermediate Node & Data Corruptor")
+        
+        try:
+            # Create socket for Client 1
+            self.client1_socket = transport.create_listener(config.SERVER_HOST,
+                                                            config.SERVER_TO_CLIENT1_PORT)
+            
+            print_success(f"Server listening for Client 1 on port {config.SERVER_TO_CLIENT1_PORT} "
+                          f"({config.TRANSPORT})")
+            self.logger.info(f"Server started on port {config.SERVER_TO_CLIENT1_PORT}")
+            
+            self.running = True
+            self.pipeline.start()
+            self.accept_connections()
+            
+        except Exception as e:
+            print_error(f"Failed to start server: {e}")
+            self.logger.error(f"Server start failed: {e}")
+    
+    def accept_connections(self):
+        """Accept connections from Client 1"""
+        print_info("Waiting for Client 1 to connect...")
+        
+        while self.running:
+            try:
+                conn, addr = self.client1_socket.accept()
+                print_success(f"Client 1 connected from {addr}")
+                self.logger.info(f"Client 1 connected: {addr}")
+                
+                # Handle client in a separate thread
+                client_thread = threading.Thread(target=self.handle_client, args=(conn, addr))
+                client_thread.start()
+                
+            except Exception as e:
+                if self.running:
+                    print_error(f"Error accepting connection: {e}")
+                    self.logger.error(f"Connection accept error: {e}")
+    
+    def select_error_injection(self):
+        """
+        Select error injection method
+        
+        Returns:
+            Error injection function
+        """
+        if self.injector_func:
+            return self.injector_func, self.injection_type
+        
+        # Injector workers prompt on the shared stdin one at a time
+        with self._prompt_lock:
+            print_section("Select Error Injection Method")
+            for key, value in config.ERROR_INJECTION_TYPES.items():
+                print(f"  {key}. {value}")
+            print()
+            
+            choice = input("Select injection method (1-8) [default: 1]: ").strip()
+            
+            if not choice:
+                choice = '1'
+            
+            if choice not in config.ERROR_INJECTION_TYPES:
+                print_error("Invalid choice, using BIT_FLIP")
+                choice = '1'
+            
+            injection_type = config.ERROR_INJECTION_TYPES[choice]
+            print_info(f"Selected: {injection_type}")
+        
+        return get_error_injector(injection_type), injection_type
+    
+    def corrupt_data(self, data, injector_func, injection_type):
+        """
+        Apply error injection to data
+        
+        Args:
+            data: Original data
+            injector_func: Error injection function (None to resolve from type)
+            injection_type: Name of injection type
+            
+        Returns:
+            Corrupted data
+        """
+        try:
+            corrupted, injection_type = self.fault_stream.apply(data, injection_type, injector_func)
+            
+            if not is_quiet():
+                print_section("Data Corruption")
+                print(f"  Original:  {data}")
+                print(f"  Corrupted: {corrupted}")
+                print(f"  Method:    {injection_type}")
+            
+            self.logger.info("Applied %s: '%s' -> '%s'", injection_type, data, corrupted,
+                             sample=config.LOG_SAMPLE_EVERY)
+            return corrupted
+        except Exception as e:
+            print_error(f"Error during corruption: {e}")
+            self.logger.error(f"Corruption failed: {e}")
+            return data
+    
+    def inject_stage(self, packet):
+        """
+        Injector stage of the relay pipeline
+        
+        Args:
+            packet: Packet received from Client 1
+            
+        Returns:
+            Corrupted packet to forward
+        """
+        # Select error injection method (recorded schedule decides when replaying)
+        if self.fault_stream.replaying:
+            injector_func, injection_type = None, None
+        else:
+            injector_func, injection_type = self.select_error_injection()
+        
+        # Corrupt data
+        with metrics.timer('server_corrupt_data'):
+            corrupted_data = self.corrupt_data(packet.data, injector_func, injection_type)
+        
+        # Create new packet with corrupted data
+        corrupted_packet = create_packet(corrupted_data, packet.method, packet.control_info,
+                                         packet.headers)
+        
+        print_packet_info(corrupted_packet, "Packet to Forward")
+        return corrupted_packet
+    
+    def forward_to_client2(self, packet):
+        """
+        Forward packet to Client 2
+        
+        Args:
+            packet: Packet object to forward
+            
+        Raises:
+            Exception: If sending failed (the pipeline counts it as a stage error)
+        """
+        self.forward_batch([packet])
+    
+    def forward_batch(self, packets):
+        """
+        Forward packets to Client 2 in one scatter-gather write
+        
+        Args:
+            packets: Packet objects queued for forwarding, in order
+            
+        Raises:
+            Exception: If sending failed, after dropping the connection so the
+                next batch reconnects (the pipeline counts it as a stage error)
+        """
+        try:
+            with metrics.timer('server_forward_to_client2'):
+                # Connect to Client 2 once and keep the connection for later packets
+                if self.client2_socket is None:
+                    self.client2_socket = transport.connect(config.SERVER_HOST,
+                                                            config.SERVER_TO_CLIENT2_PORT)
+                
+                # Send packets (payload and trailer stay separate buffers)
+                frames = []
+                for packet in packets:
+                    tracing.stamp(packet, tracing.EGRESS)
+                    frames.append(packet.to_buffers(config.ENCODING))
+                socket_utils.send_frames(self.client2_socket, frames)
+            
+            for packet, buffers in zip(packets, frames):
+                if self.capture:
+                    self.capture.write(POST_CORRUPTION, buffers)
+                self.reporter.record(len(buffers[0]) + len(buffers[1]))
+                
+                print_success("Packet forwarded to Client 2")
+                self.logger.info("Forwarded to Client 2: %s", packet,
+                                 sample=config.LOG_SAMPLE_EVERY)
+                
+                print_colored("\n" + "-" * 60 + "\n", 'cyan')
+            
+        except Exception as e:
+            # Reconnect on the next packet
+            self.close_client2_connection()
+            for _ in packets:
+                self.reporter.record(0, error=True)
+            metrics.REGISTRY.counter('server_forward_errors').inc(len(packets))
+            print_error(f"Failed to forward to Client 2: {e}")
+            self.logger.error(f"Forward failed: {e}")
+            raise
+    
+    def close_client2_connection(self):
+        """Close the connection to Client 2 (if open)"""
+        if self.client2_socket is not None:
+            try:
+                self.client2_socket.close()
+            except OSError:
+                pass
+            self.client2_socket = None
+    
+    def handle_client(self, conn, addr):
+        """
+        Handle communication with Client 1
+        
+        Args:
+            conn: Socket connection
+            addr: Client address
+        """
+        reader = transport.frame_reader(conn)
+        try:
+            while True:
+                # Receive one length-prefixed packet
+                data = reader.read_frame()
+                ingress_us = tracing.now_us()
+                
+                if data is None:
+                    print_info("Client 1 disconnected")
+                    break
+                
+                if self.capture:
+                    self.capture.write(PRE_CORRUPTION, data, ingress_us)
+                
+                # Parse packet
+                packet_string = str(data, config.ENCODING)
+                print_packet_info({'data': packet_string, 'method': 'RAW', 'control_info': 'N/A'}, 
+                                "Received from Client 1")
+                
+                with metrics.timer('server_parse_packet'):
+                    packet = parse_packet(packet_string)
+                tracing.stamp(packet, tracing.INGRESS, ingress_us)
+                
+                # Hand off to the injector stage (blocks when the pipeline is full)
+                self.pipeline.submit(packet)
+                
+        except Exception as e:
+            print_error(f"Error handling client: {e}")
+            self.logger.error(f"Client handling error: {e}")
+        finally:
+            conn.close()
+            self.logger.info("Pipeline metrics: %s", self.pipeline.get_metrics())
+            if isinstance(reader, transport.DatagramReader):
+                print_info(reader.sequence.format_report())
+                self.logger.info(reader.sequence.format_report())
+    
+    def stop(self):
+        """Stop the server"""
+        self.running = False
+        if self.client1_socket:
+            self.client1_socket.close()
+        self.pipeline.stop(timeout=1)
+        self.close_client2_connection()
+        self.fault_stream.close()
+        if self.capture:
+            self.capture.close()
+        self.reporter.report()
+        metrics.dump_snapshot('Server')
+        print_info("Server stopped")
+        self.logger.info("Server stopped")
+        self.logger.close()
+
+
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Intermediate node and data corruptor")
+    parser.add_argument('--quiet', action='store_true',
+                        help="throughput mode: periodic summary instead of per-packet output")
+    parser.add_argument('--injection', choices=list(config.ERROR_INJECTION_TYPES.values()),
+                        type=str.upper,
+                        help="apply this injection type to every packet instead of prompting")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="seed for the fault injection random stream")
+    parser.add_argument('--record-faults', metavar='PATH',
+                        help="record every applied injection into a binary schedule file")
+    parser.add_argument('--replay-faults', metavar='PATH',
+                        help="re-apply a recorded fault schedule instead of drawing new faults")
+    parser.add_argument('--capture', metavar='PATH',
+                        help="append every packet (pre- and post-corruption) to a capture file")
+    parser.add_argument('--metrics-port', type=int, default=None,
+                        help="enable metrics and serve them on this local port")
+    settings.add_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def main():
+    """Main entry point"""
+    args = parse_args()
+    settings.configure(args)
+    if args.quiet:
+        set_quiet_mode(True)
+    
+    try:
+        server = Server(injection_type=args.injection, seed=args.seed,
+                        record_path=args.record_faults, replay_path=args.replay_faults,
+                        capture_path=args.capture)
+    except settings.ConfigError as e:
+        print(e, file=sys.stderr)
+        raise SystemExit(2)
+    metrics.configure(args.metrics_port)
+    try:
+        server.start()
+    except KeyboardInterrupt:
+        print_info("\n\nServer interrupted by user")
+        server.stop()
+    except Exception as e:
+        print_error(f"Server error: {e}")
+
+
+if __name__ == "__main__":
+    main()
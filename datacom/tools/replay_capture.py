@@ -0,0 +1,145 @@
+"""
+Capture replay tool
+Streams a relay capture back into Client 2, or straight into the error
+detectors, at maximum speed or at the original pacing
+"""
+
+import argparse
+import time
+
+from datacom import config
+from datacom.utils import socket_utils, transport
+from datacom.utils.capture import CaptureReader, PRE_CORRUPTION, POST_CORRUPTION
+from datacom.utils.detector_cache import resolve_detector
+from datacom.utils.packet_handler import parse_packet
+
+
+class Pacer:
+    """Sleeps so records are replayed with their original spacing"""
+
+    def __init__(self, speed=1.0):
+        """
+        Initialize pacer
+
+        Args:
+            speed: Replay speed factor (2.0 = twice as fast); 0 disables pacing
+        """
+        self.speed = speed
+        self._first_capture_us = None
+        self._start = None
+
+    def wait(self, timestamp_us):
+        """Sleep until the record's relative capture time"""
+        if not self.speed:
+            return
+        if self._first_capture_us is None:
+            self._first_capture_us = timestamp_us
+            self._start = time.monotonic()
+            return
+
+        due = self._start + (timestamp_us - self._first_capture_us) / 1e6 / self.speed
+        delay = due - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+
+def replay_to_detectors(reader, kind=POST_CORRUPTION, speed=0):
+    """
+    Verify every captured packet with its error detector
+
+    Args:
+        reader: CaptureReader
+        kind: Record kind to replay
+        speed: Pacing factor (0 = as fast as possible)
+
+    Returns:
+        dict with packets, bytes, valid, corrupted, malformed and elapsed seconds
+    """
+    stats = {'packets': 0, 'bytes': 0, 'valid': 0, 'corrupted': 0, 'malformed': 0}
+    pacer = Pacer(speed)
+    start = time.perf_counter()
+
+    for _, timestamp_us, payload in reader.records(kind):
+        pacer.wait(timestamp_us)
+        stats['packets'] += 1
+        stats['bytes'] += len(payload)
+        try:
+            packet = parse_packet(str(payload, config.ENCODING))
+            detector = resolve_detector(packet.method)
+            if detector is None:
+                raise ValueError(f"Unknown method: {packet.method}")
+        except ValueError:
+            stats['malformed'] += 1
+            continue
+
+        if detector.verify(packet.data, packet.control_info):
+            stats['valid'] += 1
+        else:
+            stats['corrupted'] += 1
+
+    stats['elapsed'] = time.perf_counter() - start
+    return stats
+
+
+def replay_to_client2(reader, host, port, kind=POST_CORRUPTION, speed=1.0, link=None):
+    """
+    Send captured packets to a running Client 2
+
+    Args:
+        reader: CaptureReader
+        host: Client 2 host
+        port: Client 2 port
+        kind: Record kind to replay
+        speed: Pacing factor (0 = as fast as possible)
+        link: Transport to Client 2 (default: config.TRANSPORT)
+
+    Returns:
+        dict with packets, bytes and elapsed seconds
+    """
+    stats = {'packets': 0, 'bytes': 0}
+    pacer = Pacer(speed)
+    start = time.perf_counter()
+
+    with transport.connect(host, port, link) as sock:
+        for _, timestamp_us, payload in reader.records(kind):
+            pacer.wait(timestamp_us)
+            socket_utils.send_frame(sock, payload)
+            stats['packets'] += 1
+            stats['bytes'] += len(payload)
+
+    stats['elapsed'] = time.perf_counter() - start
+    return stats
+
+
+def main(argv=None):
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Replay a relay capture file")
+    parser.add_argument('capture', help="capture file written by the server (--capture)")
+    parser.add_argument('--target', choices=['detectors', 'client2'], default='detectors')
+    parser.add_argument('--kind', choices=['pre', 'post'], default='post',
+                        help="replay packets as received (pre) or as forwarded (post)")
+    parser.add_argument('--speed', type=float, default=0,
+                        help="pacing factor relative to capture time (0 = max speed)")
+    parser.add_argument('--host', default=config.SERVER_HOST)
+    parser.add_argument('--port', type=int, default=config.SERVER_TO_CLIENT2_PORT)
+    parser.add_argument('--transport', choices=transport.TRANSPORTS, default=None,
+                        help="transport to Client 2 (default: config.TRANSPORT)")
+    args = parser.parse_args(argv)
+
+    kind = PRE_CORRUPTION if args.kind == 'pre' else POST_CORRUPTION
+    with CaptureReader(args.capture) as reader:
+        if args.target == 'detectors':
+            stats = replay_to_detectors(reader, kind, args.speed)
+        else:
+            stats = replay_to_client2(reader, args.host, args.port, kind, args.speed,
+                                      args.transport)
+
+    elapsed = max(stats['elapsed'], 1e-9)
+    print(f"Replayed {stats['packets']} packets ({stats['bytes'] / 1e6:.2f} MB) in {elapsed:.3f}s: "
+          f"{stats['packets'] / elapsed:,.0f} pkt/s, {stats['bytes'] / elapsed / 1e6:.2f} MB/s")
+    if args.target == 'detectors':
+        print(f"  valid {stats['valid']}  corrupted {stats['corrupted']}  malformed {stats['malformed']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+# Utils package initialization
+# Public names are loaded on first access (PEP 562), so importing one
+# submodule does not pull in the detectors, packet handler and logger
+import importlib
+
+_LAZY_ATTRIBUTES = {
+    'ParityBit': 'error_detection',
+    'TwoDParity': 'error_detection',
+    'CRC': 'error_detection',
+    'HammingCode': 'error_detection',
+    'InternetChecksum': 'error_detection',
+    'Fletcher16': 'error_detection',
+    'Fletcher32': 'error_detection',
+    'Adler32': 'error_detection',
+    'CRC32C': 'error_detection',
+    'get_error_detector': 'error_detection',
+    'Packet': 'packet_handler',
+    'create_packet': 'packet_handler',
+    'parse_packet': 'packet_handler',
+    'validate_packet': 'packet_handler',
+    'Logger': 'logger_utils',
+    'print_colored': 'logger_utils',
+    'print_header': 'logger_utils',
+    'print_success': 'logger_utils',
+    'print_error': 'logger_utils'
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
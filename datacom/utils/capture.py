@@ -0,0 +1,163 @@
+"""
+Relay traffic capture
+Append-only, length-prefixed capture files written with buffered I/O and
+periodic fsync, read back through mmap without copying payloads
+"""
+
+import mmap
+import os
+import struct
+import threading
+import time
+
+from datacom import config
+
+# File layout: header once, then records
+#   header: magic, version
+#   record: payload length, kind, timestamp (microseconds), payload bytes
+MAGIC = b'DCCP'
+VERSION = 1
+_HEADER = struct.Struct('<4sB')
+_RECORD = struct.Struct('<IBQ')
+
+# Record kinds
+PRE_CORRUPTION = 0   # As received from Client 1
+POST_CORRUPTION = 1  # As forwarded to Client 2
+KIND_NAMES = {PRE_CORRUPTION: 'pre', POST_CORRUPTION: 'post'}
+
+
+class CaptureWriter:
+    """Thread-safe appender for capture files"""
+
+    def __init__(self, path, fsync_interval=None, buffer_size=None):
+        """
+        Open capture file for appending
+
+        Args:
+            path: Capture file path (created with a header if new)
+            fsync_interval: Seconds between fsync calls (default: config.CAPTURE_FSYNC_INTERVAL)
+            buffer_size: Write buffer size (default: config.CAPTURE_BUFFER_SIZE)
+        """
+        self.path = path
+        self.fsync_interval = (fsync_interval if fsync_interval is not None
+                               else config.CAPTURE_FSYNC_INTERVAL)
+        self.records = 0
+        self._lock = threading.Lock()
+        self._last_sync = time.monotonic()
+
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self.file = open(path, 'ab', buffering=buffer_size or config.CAPTURE_BUFFER_SIZE)
+        if self.file.tell() == 0:
+            self.file.write(_HEADER.pack(MAGIC, VERSION))
+
+    def write(self, kind, payload, timestamp_us=None):
+        """
+        Append one record
+
+        Args:
+            kind: PRE_CORRUPTION or POST_CORRUPTION
+            payload: Packet bytes as sent on the wire, or a list of buffers
+                     that make them up (e.g. Packet.to_buffers())
+            timestamp_us: Capture time in microseconds (default: now)
+        """
+        if timestamp_us is None:
+            timestamp_us = time.time_ns() // 1000
+
+        buffers = payload if isinstance(payload, (list, tuple)) else (payload,)
+        length = sum(len(buffer) for buffer in buffers)
+
+        with self._lock:
+            self.file.write(_RECORD.pack(length, kind, timestamp_us))
+            for buffer in buffers:
+                self.file.write(buffer)
+            self.records += 1
+
+            now = time.monotonic()
+            if now - self._last_sync >= self.fsync_interval:
+                self._sync()
+                self._last_sync = now
+
+    def _sync(self):
+        """Flush buffered records and fsync them to disk"""
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def close(self):
+        """Flush, fsync and close the file"""
+        with self._lock:
+            if not self.file.closed:
+                self._sync()
+                self.file.close()
+
+
+class CaptureReader:
+    """Zero-copy reader over a memory-mapped capture file"""
+
+    def __init__(self, path):
+        """
+        Map capture file
+
+        Args:
+            path: Capture file path
+        """
+        self.path = path
+        self._file = open(path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        if size < _HEADER.size:
+            self._file.close()
+            raise ValueError(f"Not a capture file: {path}")
+
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+
+        magic, version = _HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Not a capture file: {path}")
+
+    def __iter__(self):
+        """
+        Iterate over records
+
+        Yields:
+            tuple: (kind, timestamp_us, payload memoryview)
+        """
+        view = self._view
+        offset = _HEADER.size
+        end = len(view)
+        record_size = _RECORD.size
+
+        while offset + record_size <= end:
+            length, kind, timestamp_us = _RECORD.unpack_from(view, offset)
+            offset += record_size
+            if offset + length > end:
+                break  # Truncated final record (writer still running or crashed)
+            yield kind, timestamp_us, view[offset:offset + length]
+            offset += length
+
+    def records(self, kind=None):
+        """
+        Iterate over records of one kind
+
+        Args:
+            kind: PRE_CORRUPTION, POST_CORRUPTION or None for all
+        """
+        for record in self:
+            if kind is None or record[0] == kind:
+                yield record
+
+    def close(self):
+        """Unmap and close the file"""
+        self._view.release()
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
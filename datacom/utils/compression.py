@@ -0,0 +1,133 @@
+"""
+Optional payload compression for the relay
+Client 1 compresses large payloads before computing control info, so the
+Server corrupts and Client 2 verifies the compressed form; Client 2
+decompresses afterwards. Compressed payloads travel as base64 text (the
+packet format is delimited text) and are marked by the 'z' header.
+"""
+
+import base64
+import binascii
+import lzma
+import zlib
+
+from datacom import config
+
+# Header field naming the codec of a compressed payload
+HEADER = 'z'
+
+CODECS = ('zlib', 'lzma')
+
+
+def _compress(codec, raw, level):
+    """Compress bytes with a codec"""
+    if codec == 'zlib':
+        return zlib.compress(raw, level)
+    if codec == 'lzma':
+        return lzma.compress(raw, preset=level)
+    raise ValueError(f"Unknown compression codec: {codec}")
+
+
+def _decompressor(codec):
+    """Create an incremental decompressor supporting max_length"""
+    if codec == 'zlib':
+        return zlib.decompressobj()
+    if codec == 'lzma':
+        return lzma.LZMADecompressor()
+    raise ValueError(f"Unknown compression codec: {codec}")
+
+
+def compress(data, codec=None, threshold=None, level=None):
+    """
+    Compress a payload if it is large enough and actually shrinks
+
+    Args:
+        data: Payload string
+        codec: 'zlib', 'lzma' or 'none' (default: config.COMPRESSION)
+        threshold: Payloads shorter than this are left alone
+            (default: config.COMPRESSION_THRESHOLD)
+        level: zlib level / lzma preset 0-9 (default: config.COMPRESSION_LEVEL)
+
+    Returns:
+        tuple: (payload to send, codec used or None if sent uncompressed)
+    """
+    codec = codec or config.COMPRESSION
+    threshold = config.COMPRESSION_THRESHOLD if threshold is None else threshold
+    level = config.COMPRESSION_LEVEL if level is None else level
+
+    if codec == 'none' or len(data) < threshold:
+        return data, None
+
+    raw = data.encode(config.ENCODING)
+    encoded = base64.b64encode(_compress(codec, raw, level))
+    if len(encoded) >= len(raw):
+        # Incompressible (random or already compressed) data
+        return data, None
+    return encoded.decode('ascii'), codec
+
+
+def decompress(data, codec, max_size=None):
+    """
+    Restore a payload produced by compress()
+
+    Args:
+        data: Compressed payload string (base64)
+        codec: Codec named in the packet header
+        max_size: Largest decompressed size accepted in bytes (default: config.MAX_FRAME_SIZE)
+
+    Returns:
+        Original payload string
+
+    Raises:
+        ValueError: If the payload is corrupted, too large or uses an unknown codec
+    """
+    max_size = max_size or config.MAX_FRAME_SIZE
+    decompressor = _decompressor(codec)
+    try:
+        compressed = base64.b64decode(data, validate=True)
+        raw = decompressor.decompress(compressed, max_size)
+    except (binascii.Error, zlib.error, lzma.LZMAError) as e:
+        raise ValueError(f"Failed to decompress {codec} payload: {e}")
+
+    if not decompressor.eof:
+        if len(raw) >= max_size:
+            raise ValueError(f"Decompressed {codec} payload exceeds {max_size} bytes")
+        raise ValueError(f"Truncated {codec} payload")
+    if decompressor.unused_data:
+        raise ValueError(f"Trailing data after {codec} payload")
+    try:
+        return raw.decode(config.ENCODING)
+    except UnicodeError as e:
+        raise ValueError(f"Failed to decompress {codec} payload: {e}")
+
+
+def headers_for(codec):
+    """
+    Packet headers marking a payload returned by compress()
+
+    Args:
+        codec: Codec used, or None
+
+    Returns:
+        dict of header fields, or None if uncompressed
+    """
+    return {HEADER: codec} if codec else None
+
+
+def packet_payload(packet):
+    """
+    Get a packet's original payload, decompressing if it is marked compressed
+
+    Args:
+        packet: Packet object
+
+    Returns:
+        Payload string
+
+    Raises:
+        ValueError: If a compressed payload cannot be restored
+    """
+    codec = packet.headers.get(HEADER)
+    if codec is None:
+        return packet.data
+    return decompress(packet.data, codec)
@@ -0,0 +1,237 @@
+"""
+Memoized control info for repeated payloads
+A bounded LRU cache keyed by (method, polynomial, payload) that wraps the
+detectors in utils/error_detection.py
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+from datacom import config
+from datacom.utils import metrics
+from datacom.utils.error_detection import get_error_detector, get_detector_id, get_detector_by_id
+
+# Approximate per-entry bookkeeping overhead counted against the byte limit
+_ENTRY_OVERHEAD = 64
+
+
+class ControlInfoCache:
+    """Bounded LRU cache of generated control information"""
+
+    def __init__(self, max_entries=None, max_bytes=None, small_payload=None):
+        """
+        Initialize cache
+
+        Args:
+            max_entries: Maximum number of cached entries
+            max_bytes: Approximate maximum memory used by keys and values
+            small_payload: Payloads up to this many characters are used as
+                keys directly; larger ones are keyed by a digest
+
+        Limits left as None follow the current config values, so settings
+        applied after import (--set, DATACOM_*, config file) take effect.
+        """
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._small_payload = small_payload
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.current_bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def max_entries(self):
+        """Effective entry limit"""
+        if self._max_entries is not None:
+            return self._max_entries
+        return config.DETECTOR_CACHE_MAX_ENTRIES
+
+    @property
+    def max_bytes(self):
+        """Effective byte limit"""
+        if self._max_bytes is not None:
+            return self._max_bytes
+        return config.DETECTOR_CACHE_MAX_BYTES
+
+    @property
+    def small_payload(self):
+        """Effective direct-key payload size"""
+        if self._small_payload is not None:
+            return self._small_payload
+        return config.DETECTOR_CACHE_SMALL_PAYLOAD
+
+    def make_key(self, method, polynomial, data):
+        """
+        Build cache key for a payload
+
+        Args:
+            method: Error detection method name
+            polynomial: CRC polynomial (None for other methods)
+            data: Payload string
+
+        Returns:
+            Hashable key
+        """
+        if len(data) <= self.small_payload:
+            return (method, polynomial, data)
+
+        digest = hashlib.blake2b(data.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        return (method, polynomial, len(data), digest)
+
+    @staticmethod
+    def _entry_size(key, value):
+        """Approximate size of an entry in bytes"""
+        return len(key[-1]) + len(value) + _ENTRY_OVERHEAD
+
+    def get(self, key):
+        """
+        Look up a key, marking it most recently used
+
+        Returns:
+            Cached control info or None
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """Store control info, evicting least recently used entries over the limits"""
+        size = self._entry_size(key, value)
+        max_entries, max_bytes = self.max_entries, self.max_bytes
+        if size > max_bytes:
+            return
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.current_bytes -= self._entry_size(key, old)
+
+            self._entries[key] = value
+            self.current_bytes += size
+
+            while (len(self._entries) > max_entries or
+                   self.current_bytes > max_bytes):
+                old_key, old_value = self._entries.popitem(last=False)
+                self.current_bytes -= self._entry_size(old_key, old_value)
+                self.evictions += 1
+
+    def clear(self):
+        """Remove all entries and reset counters"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        """
+        Get cache statistics
+
+        Returns:
+            dict with entries, bytes, hits, misses, evictions and hit rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'bytes': self.current_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': (self.hits / lookups) if lookups else 0.0
+        }
+
+
+class CachedDetector:
+    """Detector wrapper that serves generate() from a ControlInfoCache"""
+
+    def __init__(self, detector, method, cache):
+        """
+        Initialize wrapper
+
+        Args:
+            detector: Error detection class from utils.error_detection
+            method: Method name used in cache keys
+            cache: ControlInfoCache instance
+        """
+        self.detector = detector
+        self.method = method
+        self.cache = cache
+
+    def generate(self, data, polynomial=None):
+        """Generate control info, reusing cached results for repeated payloads"""
+        key = self.cache.make_key(self.method, polynomial, data)
+        control_info = self.cache.get(key)
+
+        if control_info is None:
+            if polynomial is None:
+                control_info = self.detector.generate(data)
+            else:
+                control_info = self.detector.generate(data, polynomial)
+            self.cache.put(key, control_info)
+
+        return control_info
+
+    def verify(self, data, received_control_info, polynomial=None):
+        """Verify control info using the cached generate()"""
+        return self.generate(data, polynomial) == received_control_info
+
+
+# Process-wide cache shared by all cached detectors
+CACHE = ControlInfoCache()
+
+# Detector id -> CachedDetector wrapping CACHE, built once per method
+_cached_detectors = {}
+
+for _name in ('hits', 'misses', 'evictions', 'entries', 'bytes'):
+    metrics.REGISTRY.gauge(f"detector_cache_{_name}", f"Control info cache {_name}",
+                           func=lambda name=_name: CACHE.stats()[name])
+
+
+def get_cached_detector(method_name, cache=None):
+    """
+    Get a cached wrapper around an error detection class
+
+    Args:
+        method_name: Name of error detection method
+        cache: Optional ControlInfoCache (default: process-wide CACHE)
+
+    Returns:
+        CachedDetector, or None for an unknown method
+    """
+    detector = get_error_detector(method_name)
+    if detector is None:
+        return None
+    return CachedDetector(detector, method_name.upper(), cache if cache is not None else CACHE)
+
+
+def resolve_detector(method_name):
+    """
+    Get the detector the clients should use for a method
+
+    Returns a cached wrapper when config.DETECTOR_CACHE_ENABLED is set,
+    otherwise the plain error detection class.
+    """
+    if not config.DETECTOR_CACHE_ENABLED:
+        return get_error_detector(method_name)
+
+    detector_id = get_detector_id(method_name)
+    if detector_id is None:
+        return None
+
+    detector = get_detector_by_id(detector_id)
+    wrapper = _cached_detectors.get(detector_id)
+    if wrapper is None or wrapper.detector is not detector:
+        wrapper = CachedDetector(detector, method_name.upper(), CACHE)
+        _cached_detectors[detector_id] = wrapper
+    return wrapper
@@ -0,0 +1,510 @@
+"""
+Utility module for error detection algorithms
+Implements: Parity, 2D Parity, CRC, Hamming Code, Internet Checksum,
+Fletcher-16/32, Adler-32, CRC-32C
+"""
+
+import sys
+import zlib
+from array import array
+from itertools import accumulate
+
+from datacom import config
+
+
+class ErrorDetection:
+    """Base class for all error detection methods"""
+    
+    @staticmethod
+    def string_to_binary(text):
+        """Convert string to binary representation"""
+        return ''.join(format(ord(char), '08b') for char in text)
+    
+    @staticmethod
+    def binary_to_string(binary):
+        """Convert binary representation back to string"""
+        chars = [binary[i:i+8] for i in range(0, len(binary), 8)]
+        return ''.join(chr(int(char, 2)) for char in chars if len(char) == 8)
+
+
+class ParityBit(ErrorDetection):
+    """Parity Bit Error Detection (Even Parity)"""
+    
+    @staticmethod
+    def generate(data):
+        """
+        Generate parity bit for data
+        Returns: parity bit as string '0' or '1'
+        """
+        binary = ErrorDetection.string_to_binary(data)
+        ones_count = binary.count('1')
+        # Even parity: parity bit makes total number of 1s even
+        parity = '0' if ones_count % 2 == 0 else '1'
+        return parity
+    
+    @staticmethod
+    def verify(data, received_parity):
+        """
+        Verify parity bit
+        Returns: True if no error detected, False otherwise
+        """
+        calculated_parity = ParityBit.generate(data)
+        return calculated_parity == received_parity
+
+
+class TwoDParity(ErrorDetection):
+    """2D Parity (Matrix Parity) Error Detection"""
+    
+    @staticmethod
+    def generate(data):
+        """
+        Generate 2D parity for data
+        Returns: parity string containing row and column parities
+        """
+        binary = ErrorDetection.string_to_binary(data)
+        
+        # Pad binary to fit matrix
+        rows = config.PARITY_MATRIX_ROWS
+        cols = config.PARITY_MATRIX_COLS
+        total_bits = rows * cols
+        
+        if len(binary) < total_bits:
+            binary = binary.ljust(total_bits, '0')
+        else:
+            binary = binary[:total_bits]
+        
+        # Create matrix
+        matrix = [binary[i*cols:(i+1)*cols] for i in range(rows)]
+        
+        # Calculate row parities
+        row_parities = ''.join('1' if row.count('1') % 2 == 1 else '0' for row in matrix)
+        
+        # Calculate column parities
+        col_parities = ''
+        for col_idx in range(cols):
+            col = ''.join(matrix[row_idx][col_idx] for row_idx in range(rows))
+            col_parities += '1' if col.count('1') % 2 == 1 else '0'
+        
+        return row_parities + col_parities
+    
+    @staticmethod
+    def verify(data, received_parity):
+        """
+        Verify 2D parity
+        Returns: True if no error detected, False otherwise
+        """
+        calculated_parity = TwoDParity.generate(data)
+        return calculated_parity == received_parity
+
+
+class CRC(ErrorDetection):
+    """Cyclic Redundancy Check Error Detection"""
+    
+    @staticmethod
+    def generate(data, polynomial=None):
+        """
+        Generate CRC for data using polynomial division
+        Returns: CRC value as binary string
+        """
+        if polynomial is None:
+            polynomial = config.CRC_POLYNOMIAL
+        
+        # Convert data to binary
+        binary = ErrorDetection.string_to_binary(data)
+        
+        # Polynomial degree
+        poly_bin = bin(polynomial)[2:]
+        degree = len(poly_bin) - 1
+        
+        # Append zeros
+        padded = binary + '0' * degree
+        
+        # Perform polynomial division
+        padded = list(padded)
+        divisor = list(poly_bin)
+        
+        for i in range(len(binary)):
+            if padded[i] == '1':
+                for j in range(len(divisor)):
+                    padded[i + j] = str(int(padded[i + j]) ^ int(divisor[j]))
+        
+        # CRC is the remainder
+        crc = ''.join(padded[-degree:])
+        return crc
+    
+    @staticmethod
+    def verify(data, received_crc, polynomial=None):
+        """
+        Verify CRC
+        Returns: True if no error detected, False otherwise
+        """
+        calculated_crc = CRC.generate(data, polynomial)
+        return calculated_crc == received_crc
+
+
+class HammingCode(ErrorDetection):
+    """Hamming Code Error Detection and Correction"""
+    
+    @staticmethod
+    def generate(data):
+        """
+        Generate Hamming code for data
+        Returns: redundancy bits as string
+        """
+        binary = ErrorDetection.string_to_binary(data)
+        
+        # Calculate number of parity bits needed
+        m = len(binary)
+        r = 0
+        while (2 ** r) < (m + r + 1):
+            r += 1
+        
+        # Create hamming code array
+        hamming = []
+        j = 0
+        k = 0
+        
+        for i in range(1, m + r + 1):
+            if i == 2 ** j:
+                hamming.append('0')  # Placeholder for parity bit
+                j += 1
+            else:
+                hamming.append(binary[k])
+                k += 1
+        
+        # Calculate parity bits
+        for i in range(r):
+            parity_pos = 2 ** i
+            parity = 0
+            for j in range(1, len(hamming) + 1):
+                if j & parity_pos:
+                    parity ^= int(hamming[j - 1])
+            hamming[parity_pos - 1] = str(parity)
+        
+        # Return only parity bits for transmission
+        parity_bits = ''.join(hamming[2**i - 1] for i in range(r))
+        return parity_bits
+    
+    @staticmethod
+    def verify(data, received_parity):
+        """
+        Verify Hamming code
+        Returns: True if no error detected, False otherwise
+        """
+        calculated_parity = HammingCode.generate(data)
+        return calculated_parity == received_parity
+
+
+class InternetChecksum(ErrorDetection):
+    """Internet Checksum Error Detection"""
+    
+    @staticmethod
+    def generate(data):
+        """
+        Generate Internet Checksum
+        Returns: checksum as hexadecimal string
+        """
+        # Convert data to bytes
+        data_bytes = data.encode(config.ENCODING)
+        
+        # Calculate checksum
+        checksum = 0
+        
+        # Process 16-bit words
+        for i in range(0, len(data_bytes), 2):
+            if i + 1 < len(data_bytes):
+                word = (data_bytes[i] << 8) + data_bytes[i + 1]
+            else:
+                word = data_bytes[i] << 8
+            
+            checksum += word
+            
+            # Handle overflow (wrap around)
+            if checksum > 0xFFFF:
+                checksum = (checksum & 0xFFFF) + (checksum >> 16)
+        
+        # One's complement
+        checksum = ~checksum & 0xFFFF
+        
+        return format(checksum, '04x')
+    
+    @staticmethod
+    def verify(data, received_checksum):
+        """
+        Verify Internet Checksum
+        Returns: True if no error detected, False otherwise
+        """
+        calculated_checksum = InternetChecksum.generate(data)
+        return calculated_checksum == received_checksum
+
+
+class Fletcher16(ErrorDetection):
+    """Fletcher-16 Checksum Error Detection"""
+    
+    @staticmethod
+    def generate(data):
+        """
+        Generate Fletcher-16 checksum over the encoded bytes
+        Returns: checksum as hexadecimal string
+        """
+        data_bytes = data.encode(config.ENCODING)
+        
+        # sum1 is the byte sum, sum2 the sum of the running sums
+        sum1 = sum(data_bytes) % 255
+        sum2 = sum(accumulate(data_bytes)) % 255
+        
+        return format((sum2 << 8) | sum1, '04x')
+    
+    @staticmethod
+    def verify(data, received_checksum):
+        """
+        Verify Fletcher-16 checksum
+        Returns: True if no error detected, False otherwise
+        """
+        return Fletcher16.generate(data) == received_checksum
+
+
+class Fletcher32(ErrorDetection):
+    """Fletcher-32 Checksum Error Detection (16-bit little-endian words)"""
+    
+    @staticmethod
+    def generate(data):
+        """
+        Generate Fletcher-32 checksum over the encoded bytes
+        Returns: checksum as hexadecimal string
+        """
+        data_bytes = data.encode(config.ENCODING)
+        if len(data_bytes) % 2:
+            data_bytes += b'\x00'
+        
+        words = array('H', data_bytes)
+        if sys.byteorder == 'big':
+            words.byteswap()
+        
+        sum1 = sum(words) % 65535
+        sum2 = sum(accumulate(words)) % 65535
+        
+        return format((sum2 << 16) | sum1, '08x')
+    
+    @staticmethod
+    def verify(data, received_checksum):
+        """
+        Verify Fletcher-32 checksum
+        Returns: True if no error detected, False otherwise
+        """
+        return Fletcher32.generate(data) == received_checksum
+
+
+class Adler32(ErrorDetection):
+    """Adler-32 Checksum Error Detection (zlib implementation)"""
+    
+    @staticmethod
+    def generate(data):
+        """
+        Generate Adler-32 checksum over the encoded bytes
+        Returns: checksum as hexadecimal string
+        """
+        return format(zlib.adler32(data.encode(config.ENCODING)), '08x')
+    
+    @staticmethod
+    def verify(data, received_checksum):
+        """
+        Verify Adler-32 checksum
+        Returns: True if no error detected, False otherwise
+        """
+        return Adler32.generate(data) == received_checksum
+
+
+def _build_crc32c_table():
+    """Build the 256-entry lookup table for reflected CRC-32C"""
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ config.CRC32C_POLYNOMIAL if crc & 1 else crc >> 1
+        table.append(crc)
+    return table
+
+
+class CRC32C(ErrorDetection):
+    """CRC-32C (Castagnoli) Error Detection, table-driven"""
+    
+    TABLE = _build_crc32c_table()
+    
+    @staticmethod
+    def generate(data):
+        """
+        Generate CRC-32C over the encoded bytes
+        Returns: CRC as hexadecimal string
+        """
+        table = CRC32C.TABLE
+        crc = 0xFFFFFFFF
+        
+        for byte in data.encode(config.ENCODING):
+            crc = table[(crc ^ byte) & 0xFF] ^ (crc >> 8)
+        
+        return format(crc ^ 0xFFFFFFFF, '08x')
+    
+    @staticmethod
+    def verify(data, received_crc):
+        """
+        Verify CRC-32C
+        Returns: True if no error detected, False otherwise
+        """
+        return CRC32C.generate(data) == received_crc
+
+
+# Detector registry: resolved once at registration, dispatched by integer id
+DETECTOR_PLUGIN_GROUP = 'datacom.error_detectors'
+DETECTORS = []
+DETECTOR_IDS = {}
+_plugins_loaded = False
+_backends_installed = False
+
+
+def register_detector(method_name, detector_class, replace=False):
+    """
+    Register an error detection class
+    
+    Args:
+        method_name: Method name carried in packets (case-insensitive)
+        detector_class: Class providing generate(data) and verify(data, control_info)
+        replace: Replace an existing registration instead of raising
+        
+    Returns:
+        Integer detector id
+    """
+    name = method_name.upper()
+    
+    if name in DETECTOR_IDS:
+        if not replace:
+            raise ValueError(f"Detector already registered: {name}")
+        detector_id = DETECTOR_IDS[name]
+        DETECTORS[detector_id] = detector_class
+        return detector_id
+    
+    DETECTORS.append(detector_class)
+    DETECTOR_IDS[name] = len(DETECTORS) - 1
+    return DETECTOR_IDS[name]
+
+
+def load_detector_plugins(group=DETECTOR_PLUGIN_GROUP):
+    """
+    Register detectors advertised by installed packages
+    
+    Each entry point in the group is named after the method and loads the
+    detector class, e.g. in a plugin's pyproject.toml:
+    
+        [project.entry-points."datacom.error_detectors"]
+        ADLER32 = "my_plugin:Adler32"
+    
+    Returns:
+        List of registered method names
+    """
+    from importlib.metadata import entry_points
+    
+    eps = entry_points()
+    group_eps = eps.select(group=group) if hasattr(eps, 'select') else eps.get(group, [])
+    
+    registered = []
+    for ep in group_eps:
+        if ep.name.upper() not in DETECTOR_IDS:
+            register_detector(ep.name, ep.load())
+            registered.append(ep.name.upper())
+    return registered
+
+
+def get_detector_id(method_name):
+    """
+    Resolve a method name to its integer detector id
+    
+    Accelerated backends are installed on the first lookup and installed
+    plugins the first time an unknown name is looked up.
+    
+    Args:
+        method_name: Name of error detection method
+        
+    Returns:
+        Integer id, or None if unknown
+    """
+    global _plugins_loaded
+    
+    if not _backends_installed:
+        _install_accelerated_backends()
+    
+    detector_id = DETECTOR_IDS.get(method_name)
+    if detector_id is None:
+        detector_id = DETECTOR_IDS.get(method_name.upper())
+    
+    if detector_id is None and not _plugins_loaded:
+        _plugins_loaded = True
+        load_detector_plugins()
+        detector_id = DETECTOR_IDS.get(method_name.upper())
+    
+    return detector_id
+
+
+def get_detector_by_id(detector_id):
+    """
+    Get error detection class by integer id
+    
+    Args:
+        detector_id: Id returned by register_detector/get_detector_id
+        
+    Returns:
+        Error detection class
+    """
+    return DETECTORS[detector_id]
+
+
+# Factory function to get error detection instance
+def get_error_detector(method_name):
+    """
+    Get error detection class based on method name
+    
+    Args:
+        method_name: Name of error detection method
+        
+    Returns:
+        Error detection class
+    """
+    detector_id = get_detector_id(method_name)
+    return DETECTORS[detector_id] if detector_id is not None else None
+
+
+register_detector('PARITY', ParityBit)
+register_detector('2D_PARITY', TwoDParity)
+register_detector('CRC', CRC)
+register_detector('HAMMING', HammingCode)
+register_detector('CHECKSUM', InternetChecksum)
+register_detector('FLETCHER16', Fletcher16)
+register_detector('FLETCHER32', Fletcher32)
+register_detector('ADLER32', Adler32)
+register_detector('CRC32C', CRC32C)
+
+
+def _install_accelerated_backends():
+    """
+    Replace reference classes with accelerated backends per config.DETECTOR_BACKEND
+    
+    'auto' installs the C backend (when built) and then NumPy for the
+    methods it does not cover; 'native' or 'numpy' installs only that
+    backend; 'python' keeps the reference classes. Runs on the first
+    registry lookup rather than at import, so the backend modules can be
+    imported on their own and startup does not pay for ctypes/NumPy.
+    """
+    global _backends_installed
+    _backends_installed = True
+    backend = config.DETECTOR_BACKEND
+    
+    if backend in ('auto', 'native'):
+        from datacom.utils import native_backend
+        native_backend.install()
+    
+    if backend in ('auto', 'numpy'):
+        from datacom.utils import numpy_backend
+        numpy_backend.install()
+    
+    if config.PARALLEL_DETECTORS:
+        from datacom.utils import parallel_detectors
+        parallel_detectors.install()
@@ -0,0 +1,188 @@
+"""
+Error localization for failed 2D parity and Hamming checks
+Turns the row/column parity mismatch or the Hamming syndrome, which the
+receiver already has after verification, into candidate corrupted bit and
+byte positions without rescanning the payload, and corrects single-bit
+errors.
+
+Bit positions index the string_to_binary() form of the payload (8 bits
+per character); payloads with characters above U+00FF are not localized.
+"""
+
+from datacom import config
+
+
+class ErrorLocation:
+    """Candidate positions of the corruption behind a failed check"""
+
+    def __init__(self, method, bit_positions, rows=(), cols=(), syndrome=None, note=''):
+        """
+        Initialize location
+
+        Args:
+            method: Error detection method name
+            bit_positions: Candidate corrupted bit positions, sorted
+            rows: Mismatched 2D parity rows
+            cols: Mismatched 2D parity columns
+            syndrome: Hamming syndrome (codeword position of a single-bit error)
+            note: Why no data bit could be singled out, if so
+        """
+        self.method = method
+        self.bit_positions = list(bit_positions)
+        self.rows = list(rows)
+        self.cols = list(cols)
+        self.syndrome = syndrome
+        self.note = note
+
+    @property
+    def byte_positions(self):
+        """Candidate corrupted character indexes, sorted"""
+        return sorted({position // 8 for position in self.bit_positions})
+
+    @property
+    def correctable(self):
+        """True if the check points at exactly one data bit"""
+        return len(self.bit_positions) == 1
+
+    def correct(self, data):
+        """
+        Flip the single candidate bit
+
+        Only a single-bit error is repaired exactly; a larger error that
+        happens to produce the same mismatch is "corrected" wrongly, as with
+        any single-error-correcting code.
+
+        Args:
+            data: Received payload string
+
+        Returns:
+            Corrected payload string, or None if not correctable
+        """
+        if not self.correctable:
+            return None
+        index, bit = divmod(self.bit_positions[0], 8)
+        if index >= len(data):
+            return None
+        char = chr(ord(data[index]) ^ (0x80 >> bit))
+        return data[:index] + char + data[index + 1:]
+
+    def __str__(self):
+        """Short description for logs and display"""
+        if not self.bit_positions:
+            return self.note or "no candidate positions"
+        bits, chars = self.bit_positions, self.byte_positions
+        more = f" (+{len(bits) - 16} more)" if len(bits) > 16 else ''
+        return (f"{'bit' if len(bits) == 1 else 'bits'} {', '.join(map(str, bits[:16]))}{more} "
+                f"in {'byte' if len(chars) == 1 else 'bytes'} {', '.join(map(str, chars[:16]))}")
+
+
+def _one_byte_per_char(data):
+    """True if string_to_binary() uses exactly 8 bits per character"""
+    if data.isascii():
+        return True
+    try:
+        data.encode('latin-1')
+        return True
+    except UnicodeEncodeError:
+        return False
+
+
+def _bit_mismatches(received, calculated):
+    """Indexes where two equal-length bit strings differ, or None if malformed"""
+    if len(received) != len(calculated) or set(received) - {'0', '1'}:
+        return None
+    return [i for i, (a, b) in enumerate(zip(received, calculated)) if a != b]
+
+
+def locate_2d_parity(data, received_parity, calculated_parity, rows=None, cols=None):
+    """
+    Locate errors from mismatched 2D parity rows and columns
+
+    Every bit at a mismatched row and column is a candidate; a mismatch on
+    one axis only (an even number of errors on the other) leaves that
+    whole row or column as candidates. One row and one column give a single,
+    correctable bit. Only the first rows * cols bits are covered by the check.
+
+    Args:
+        data: Received payload string
+        received_parity: Parity string from the sender
+        calculated_parity: TwoDParity.generate(data)
+        rows: Matrix rows (default: config.PARITY_MATRIX_ROWS)
+        cols: Matrix columns (default: config.PARITY_MATRIX_COLS)
+
+    Returns:
+        ErrorLocation, or None if the parities match or cannot be compared
+    """
+    rows = rows or config.PARITY_MATRIX_ROWS
+    cols = cols or config.PARITY_MATRIX_COLS
+    mismatches = _bit_mismatches(received_parity, calculated_parity)
+    if not mismatches or len(received_parity) != rows + cols or not _one_byte_per_char(data):
+        return None
+
+    bad_rows = [i for i in mismatches if i < rows]
+    bad_cols = [i - rows for i in mismatches if i >= rows]
+    covered = min(rows * cols, 8 * len(data))
+    positions = sorted(row * cols + col
+                       for row in (bad_rows or range(rows))
+                       for col in (bad_cols or range(cols))
+                       if row * cols + col < covered)
+    note = '' if positions else "mismatch outside the payload (parity corrupted)"
+    return ErrorLocation('2D_PARITY', positions, bad_rows, bad_cols, note=note)
+
+
+def locate_hamming(data, received_parity, calculated_parity):
+    """
+    Locate a single-bit error from the Hamming syndrome
+
+    The syndrome (received XOR calculated parity bits, bit i for parity
+    position 2^i) is the 1-based codeword position of a single flipped bit.
+
+    Args:
+        data: Received payload string
+        received_parity: Parity bits from the sender
+        calculated_parity: HammingCode.generate(data)
+
+    Returns:
+        ErrorLocation, or None if the parities match or cannot be compared
+        (e.g. the payload length changed)
+    """
+    mismatches = _bit_mismatches(received_parity, calculated_parity)
+    if not mismatches or not _one_byte_per_char(data):
+        return None
+
+    syndrome = sum(1 << i for i in mismatches)
+    data_bits = 8 * len(data)
+    if syndrome & (syndrome - 1) == 0:
+        return ErrorLocation('HAMMING', [], syndrome=syndrome,
+                             note=f"parity bit {syndrome} corrupted")
+    if syndrome > data_bits + len(calculated_parity):
+        return ErrorLocation('HAMMING', [], syndrome=syndrome,
+                             note="multiple-bit error (syndrome past the codeword)")
+
+    # Codeword position -> data bit: skip the parity positions 1, 2, 4, ... below it
+    return ErrorLocation('HAMMING', [syndrome - syndrome.bit_length() - 1], syndrome=syndrome)
+
+
+LOCATORS = {
+    '2D_PARITY': locate_2d_parity,
+    'HAMMING': locate_hamming
+}
+
+
+def locate_errors(method, data, received_control_info, calculated_control_info):
+    """
+    Locate errors for methods that support it
+
+    Args:
+        method: Error detection method name
+        data: Received payload string
+        received_control_info: Control info from the sender
+        calculated_control_info: Control info calculated from data
+
+    Returns:
+        ErrorLocation, or None if the method cannot localize or nothing differs
+    """
+    locator = LOCATORS.get(method.upper()) if method else None
+    if locator is None or received_control_info is None or calculated_control_info is None:
+        return None
+    return locator(data, received_control_info, calculated_control_info)
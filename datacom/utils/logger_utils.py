@@ -0,0 +1,358 @@
+"""
+Logging utilities for the socket error detection project
+"""
+
+import os
+import sys
+import time
+import atexit
+import queue
+import logging
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from datetime import datetime
+from datacom import config
+
+# colorama is imported on first colored print, so quiet mode never loads it
+_colorama = None
+
+
+def _load_colorama():
+    """
+    Import and initialize colorama on first use
+    
+    Returns:
+        (Fore, Style) tuple, or None if colorama is not installed
+    """
+    global _colorama
+    
+    if _colorama is None:
+        try:
+            from colorama import init, Fore, Style
+            init(autoreset=True)
+            _colorama = (Fore, Style)
+        except ImportError:
+            _colorama = False
+    
+    return _colorama or None
+
+
+def is_quiet():
+    """Check whether quiet/throughput mode is enabled"""
+    return config.QUIET_MODE
+
+
+def set_quiet_mode(enabled=True):
+    """
+    Enable or disable quiet/throughput mode
+    
+    Args:
+        enabled: True to replace per-packet output with periodic summaries
+    """
+    config.QUIET_MODE = enabled
+
+
+# Loggers with a running background listener, flushed once at exit
+_async_loggers = set()
+_async_loggers_lock = threading.Lock()
+
+
+@atexit.register
+def _close_async_loggers():
+    """Flush and stop every background log listener still running"""
+    with _async_loggers_lock:
+        loggers = list(_async_loggers)
+    for logger in loggers:
+        logger.close()
+
+
+class Logger:
+    """Custom logger for the project
+    
+    Records are handed to a QueueHandler and written to the console and
+    log file by a background QueueListener, so handler I/O stays off the
+    packet path. Messages use lazy %-style arguments and can be sampled.
+    """
+    
+    def __init__(self, name, log_file=None):
+        """
+        Initialize logger
+        
+        Args:
+            name: Logger name (typically module name)
+            log_file: Optional log file name
+        """
+        self.logger = logging.getLogger(name)
+        self.logger.setLevel(getattr(logging, config.LOG_LEVEL))
+        self._listener = None
+        self._sample_counts = {}
+        self._sample_lock = threading.Lock()
+        
+        # Remove existing handlers
+        self.logger.handlers = []
+        handlers = []
+        
+        # Console handler
+        if config.ENABLE_CONSOLE_LOGGING:
+            console_handler = logging.StreamHandler()
+            # Quiet mode keeps per-packet records out of the console
+            console_handler.setLevel(logging.WARNING if config.QUIET_MODE else logging.DEBUG)
+            console_formatter = logging.Formatter(
+                '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                datefmt='%H:%M:%S'
+            )
+            console_handler.setFormatter(console_formatter)
+            handlers.append(console_handler)
+        
+        # File handler
+        if config.ENABLE_FILE_LOGGING and log_file:
+            # Create logs directory if it doesn't exist
+            if not os.path.exists(config.LOG_DIRECTORY):
+                os.makedirs(config.LOG_DIRECTORY)
+            
+            log_path = os.path.join(config.LOG_DIRECTORY, log_file)
+            file_handler = logging.FileHandler(log_path)
+            file_handler.setLevel(logging.DEBUG)
+            file_formatter = logging.Formatter(
+                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            )
+            file_handler.setFormatter(file_formatter)
+            handlers.append(file_handler)
+        
+        if handlers and config.ASYNC_LOGGING:
+            # Hand records to a background thread that owns the real handlers
+            log_queue = queue.SimpleQueue()
+            self.logger.addHandler(QueueHandler(log_queue))
+            self._listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+            self._listener.start()
+            with _async_loggers_lock:
+                _async_loggers.add(self)
+        else:
+            for handler in handlers:
+                self.logger.addHandler(handler)
+    
+    def _log(self, level, message, args, sample=None):
+        """
+        Log message if level is enabled and the message is not sampled out
+        
+        Args:
+            level: Logging level
+            message: Message or %-style format string
+            args: Arguments for the format string (formatted lazily)
+            sample: Only emit one in every `sample` calls with this message
+        """
+        if not self.logger.isEnabledFor(level):
+            return
+        
+        if sample and sample > 1:
+            # Several pipeline threads may log the same message
+            with self._sample_lock:
+                count = self._sample_counts.get(message, 0)
+                self._sample_counts[message] = count + 1
+            if count % sample:
+                return
+        
+        self.logger.log(level, message, *args)
+    
+    def info(self, message, *args, sample=None):
+        """Log info message"""
+        self._log(logging.INFO, message, args, sample)
+    
+    def error(self, message, *args, sample=None):
+        """Log error message"""
+        self._log(logging.ERROR, message, args, sample)
+    
+    def warning(self, message, *args, sample=None):
+        """Log warning message"""
+        self._log(logging.WARNING, message, args, sample)
+    
+    def debug(self, message, *args, sample=None):
+        """Log debug message"""
+        self._log(logging.DEBUG, message, args, sample)
+    
+    def close(self):
+        """Flush queued records and stop the background listener"""
+        with _async_loggers_lock:
+            _async_loggers.discard(self)
+        listener, self._listener = self._listener, None
+        if listener:
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+
+
+def print_colored(message, color='white', bold=False):
+    """
+    Print colored message to console
+    
+    Args:
+        message: Message to print
+        color: Color name (red, green, yellow, blue, magenta, cyan, white)
+        bold: Whether to print in bold
+    """
+    if config.QUIET_MODE:
+        return
+    
+    colorama = _load_colorama() if config.COLORS_ENABLED else None
+    if not colorama:
+        print(message)
+        return
+    
+    Fore, Style = colorama
+    color_map = {
+        'red': Fore.RED,
+        'green': Fore.GREEN,
+        'yellow': Fore.YELLOW,
+        'blue': Fore.BLUE,
+        'magenta': Fore.MAGENTA,
+        'cyan': Fore.CYAN,
+        'white': Fore.WHITE
+    }
+    
+    color_code = color_map.get(color.lower(), Fore.WHITE)
+    style = Style.BRIGHT if bold else ''
+    
+    print(f"{style}{color_code}{message}{Style.RESET_ALL}")
+
+
+def print_header(title):
+    """Print a formatted header"""
+    print_colored("\n" + "=" * 60, 'cyan', bold=True)
+    print_colored(f"  {title}", 'cyan', bold=True)
+    print_colored("=" * 60 + "\n", 'cyan', bold=True)
+
+
+def print_section(title):
+    """Print a section separator"""
+    print_colored(f"\n--- {title} ---", 'yellow', bold=True)
+
+
+def print_success(message):
+    """Print success message"""
+    print_colored(f"✓ {message}", 'green', bold=True)
+
+
+def print_error(message):
+    """Print error message (still shown in quiet mode, uncolored)"""
+    if config.QUIET_MODE:
+        print(f"✗ {message}", file=sys.stderr)
+        return
+    print_colored(f"✗ {message}", 'red', bold=True)
+
+
+def print_info(message):
+    """Print info message"""
+    print_colored(f"ℹ {message}", 'blue')
+
+
+def print_packet_info(packet, title="Packet Information"):
+    """
+    Print formatted packet information
+    
+    Args:
+        packet: Packet object or dict with data, method, control_info
+        title: Title for the packet info
+    """
+    if config.QUIET_MODE:
+        return
+    
+    print_section(title)
+    
+    if hasattr(packet, 'data'):
+        print(f"  Data:         {packet.data}")
+        print(f"  Method:       {packet.method}")
+        print(f"  Control Info: {packet.control_info}")
+    else:
+        print(f"  Data:         {packet.get('data', 'N/A')}")
+        print(f"  Method:       {packet.get('method', 'N/A')}")
+        print(f"  Control Info: {packet.get('control_info', 'N/A')}")
+
+
+def log_transmission(source, destination, data, method, control_info):
+    """
+    Log transmission details
+    
+    Args:
+        source: Source of transmission
+        destination: Destination of transmission
+        data: Transmitted data
+        method: Error detection method
+        control_info: Control information
+    """
+    if config.QUIET_MODE:
+        return
+    
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    print(f"\n[{timestamp}] Transmission: {source} -> {destination}")
+    print(f"  Data:         {data}")
+    print(f"  Method:       {method}")
+    print(f"  Control Info: {control_info}")
+
+
+class ThroughputReporter:
+    """Periodic one-line throughput summary used in quiet mode"""
+    
+    def __init__(self, label, interval=None):
+        """
+        Initialize reporter
+        
+        Args:
+            label: Component name shown in the summary line
+            interval: Seconds between summaries (default: config.SUMMARY_INTERVAL)
+        """
+        self.label = label
+        self.interval = interval if interval is not None else config.SUMMARY_INTERVAL
+        self.total_packets = 0
+        self.total_errors = 0
+        self._lock = threading.Lock()
+        self._reset_window(time.monotonic())
+    
+    def _reset_window(self, now):
+        """Start a new reporting window"""
+        self._window_start = now
+        self._packets = 0
+        self._bytes = 0
+        self._errors = 0
+    
+    def record(self, nbytes, error=False):
+        """
+        Record one packet and print a summary when the interval has elapsed
+        
+        Args:
+            nbytes: Packet size in bytes
+            error: Whether the packet failed (send failure or detected corruption)
+        """
+        line = None
+        with self._lock:
+            self._packets += 1
+            self._bytes += nbytes
+            self.total_packets += 1
+            if error:
+                self._errors += 1
+                self.total_errors += 1
+            
+            now = time.monotonic()
+            if now - self._window_start >= self.interval:
+                line = self._summary(now)
+                self._reset_window(now)
+        
+        if line and config.QUIET_MODE:
+            print(line, flush=True)
+    
+    def report(self):
+        """Print a summary of the current window immediately (quiet mode only)"""
+        with self._lock:
+            now = time.monotonic()
+            line = self._summary(now)
+            self._reset_window(now)
+        
+        if config.QUIET_MODE:
+            print(line, flush=True)
+    
+    def _summary(self, now):
+        """Build the summary line for the current window"""
+        elapsed = max(now - self._window_start, 1e-9)
+        error_rate = (self._errors / self._packets * 100) if self._packets else 0.0
+        return (f"[{self.label}] {self._packets / elapsed:,.1f} pkt/s | "
+                f"{self._bytes / elapsed / 1e6:.2f} MB/s | "
+                f"errors {error_rate:.1f}% | total {self.total_packets}")
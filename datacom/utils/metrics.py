@@ -0,0 +1,381 @@
+"""
+Lightweight metrics registry
+Counters, gauges and HDR-style latency histograms, exported as a JSON
+snapshot or as Prometheus text on a local HTTP endpoint
+"""
+
+import json
+import os
+import re
+import threading
+import time
+
+from datacom import config
+
+
+class Counter:
+    """Monotonically increasing counter"""
+
+    kind = 'counter'
+
+    def __init__(self, name, help_text=''):
+        self.name = name
+        self.help_text = help_text
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1):
+        """Increase counter by amount"""
+        with self._lock:
+            self.value += amount
+
+    def snapshot(self):
+        """Get counter value"""
+        return self.value
+
+
+class Gauge:
+    """Value that can go up and down, or be read from a callback"""
+
+    kind = 'gauge'
+
+    def __init__(self, name, help_text='', func=None):
+        """
+        Initialize gauge
+
+        Args:
+            name: Metric name
+            help_text: Description for the Prometheus HELP line
+            func: Optional callable returning the current value on snapshot
+        """
+        self.name = name
+        self.help_text = help_text
+        self.func = func
+        self.value = 0
+
+    def set(self, value):
+        """Set gauge value"""
+        self.value = value
+
+    def snapshot(self):
+        """Get current gauge value"""
+        if self.func is not None:
+            return self.func()
+        return self.value
+
+
+class Histogram:
+    """
+    HDR-style latency histogram
+
+    Values (nanoseconds) are stored in log-linear buckets: each power of two
+    is split into 2**SUB_BUCKET_BITS sub-buckets, so any recorded value is
+    reproduced within a fixed relative error (<1% with the default 7 bits).
+    """
+
+    kind = 'histogram'
+    SUB_BUCKET_BITS = 7
+    QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+    def __init__(self, name, help_text=''):
+        self.name = name
+        self.help_text = help_text
+        self.counts = {}
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+        self._lock = threading.Lock()
+
+    def _bucket(self, value):
+        """Map a value to its (shift, sub-bucket) key"""
+        shift = max(value.bit_length() - self.SUB_BUCKET_BITS, 0)
+        return shift, value >> shift
+
+    def record(self, value):
+        """
+        Record a value
+
+        Args:
+            value: Non-negative integer (nanoseconds for latencies)
+        """
+        key = self._bucket(value)
+        with self._lock:
+            self.counts[key] = self.counts.get(key, 0) + 1
+            self.count += 1
+            self.total += value
+            if self.min is None or value < self.min:
+                self.min = value
+            if self.max is None or value > self.max:
+                self.max = value
+
+    def percentile(self, percent):
+        """
+        Get value at a percentile
+
+        Args:
+            percent: Percentile between 0 and 100
+
+        Returns:
+            Value at the percentile (midpoint of its bucket), or 0 if empty
+        """
+        with self._lock:
+            if not self.count:
+                return 0
+            target = max(1, int(round(self.count * percent / 100.0)))
+            seen = 0
+            for shift, sub in sorted(self.counts):
+                seen += self.counts[(shift, sub)]
+                if seen >= target:
+                    low = sub << shift
+                    value = low + ((1 << shift) >> 1)
+                    return min(max(value, self.min), self.max)
+            return self.max
+
+    def snapshot(self):
+        """Get summary statistics"""
+        summary = {
+            'count': self.count,
+            'sum': self.total,
+            'min': self.min or 0,
+            'max': self.max or 0,
+            'mean': (self.total / self.count) if self.count else 0
+        }
+        for quantile in self.QUANTILES:
+            summary[f"p{quantile * 100:g}"] = self.percentile(quantile * 100)
+        return summary
+
+
+class _Timer:
+    """Context manager recording elapsed nanoseconds into a histogram"""
+
+    __slots__ = ('histogram', 'start')
+
+    def __init__(self, histogram):
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.histogram.record(time.perf_counter_ns() - self.start)
+        return False
+
+
+class _NullTimer:
+    """Shared no-op timer used while metrics are disabled"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class MetricsRegistry:
+    """Registry of named counters, gauges and histograms"""
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.metrics = {}
+        self._lock = threading.Lock()
+        self._http_server = None
+
+    def _get_or_create(self, cls, name, help_text, **kwargs):
+        """Get existing metric or register a new one"""
+        metric = self.metrics.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self.metrics.get(name)
+                if metric is None:
+                    metric = cls(name, help_text, **kwargs)
+                    self.metrics[name] = metric
+        return metric
+
+    def counter(self, name, help_text=''):
+        """Get or create a counter"""
+        return self._get_or_create(Counter, name, help_text)
+
+    def gauge(self, name, help_text='', func=None):
+        """Get or create a gauge (optionally backed by a callback)"""
+        gauge = self._get_or_create(Gauge, name, help_text)
+        if func is not None:
+            gauge.func = func
+        return gauge
+
+    def histogram(self, name, help_text=''):
+        """Get or create a latency histogram"""
+        return self._get_or_create(Histogram, name, help_text)
+
+    def register(self, metric):
+        """Add an existing metric under its name, replacing any previous one"""
+        with self._lock:
+            self.metrics[metric.name] = metric
+        return metric
+
+    def timer(self, name):
+        """
+        Time a block of code into a histogram
+
+        Returns a shared no-op context manager while the registry is
+        disabled, so instrumented hot paths cost almost nothing.
+
+        Args:
+            name: Histogram name
+        """
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self.histogram(name))
+
+    def snapshot(self):
+        """
+        Get a snapshot of all metrics
+
+        Returns:
+            dict with 'counters', 'gauges' and 'histograms' sections
+        """
+        snapshot = {'counters': {}, 'gauges': {}, 'histograms': {}}
+        for name, metric in list(self.metrics.items()):
+            snapshot[metric.kind + 's'][name] = metric.snapshot()
+        return snapshot
+
+    def to_json(self, indent=2):
+        """Serialize snapshot as JSON"""
+        return json.dumps(self.snapshot(), indent=indent, sort_keys=True)
+
+    def to_prometheus(self):
+        """
+        Render all metrics in Prometheus text exposition format
+
+        Histograms are exposed as summaries with quantiles in seconds.
+        """
+        lines = []
+        for name, metric in sorted(self.metrics.items()):
+            prom_name = re.sub(r'[^a-zA-Z0-9_]', '_', name)
+
+            if metric.kind == 'histogram':
+                prom_name += '_seconds'
+                lines.append(f"# HELP {prom_name} {metric.help_text or name}")
+                lines.append(f"# TYPE {prom_name} summary")
+                for quantile in Histogram.QUANTILES:
+                    value = metric.percentile(quantile * 100) / 1e9
+                    lines.append(f'{prom_name}{{quantile="{quantile}"}} {value:.9f}')
+                lines.append(f"{prom_name}_sum {metric.total / 1e9:.9f}")
+                lines.append(f"{prom_name}_count {metric.count}")
+            else:
+                lines.append(f"# HELP {prom_name} {metric.help_text or name}")
+                lines.append(f"# TYPE {prom_name} {metric.kind}")
+                lines.append(f"{prom_name} {metric.snapshot()}")
+
+        return '\n'.join(lines) + '\n'
+
+    def dump(self, path):
+        """
+        Write JSON snapshot to a file
+
+        Args:
+            path: Output file path
+        """
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        with open(path, 'w') as f:
+            f.write(self.to_json())
+
+    def serve(self, port, host='127.0.0.1'):
+        """
+        Expose metrics on a local HTTP endpoint in a background thread
+
+        GET /metrics returns Prometheus text, GET /metrics.json the JSON snapshot.
+
+        Args:
+            port: TCP port (0 picks a free port)
+            host: Interface to bind (localhost by default)
+
+        Returns:
+            The running HTTP server
+        """
+        # Imported here: http.server is a large import most runs never need
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        registry = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.startswith('/metrics.json'):
+                    body, content_type = registry.to_json(), 'application/json'
+                elif self.path.startswith('/metrics'):
+                    body, content_type = registry.to_prometheus(), 'text/plain; version=0.0.4'
+                else:
+                    self.send_error(404)
+                    return
+
+                payload = body.encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._http_server = ThreadingHTTPServer((host, port), MetricsHandler)
+        thread = threading.Thread(target=self._http_server.serve_forever,
+                                  name='metrics-http', daemon=True)
+        thread.start()
+        return self._http_server
+
+    def close(self):
+        """Stop the HTTP endpoint if running"""
+        if self._http_server:
+            self._http_server.shutdown()
+            self._http_server.server_close()
+            self._http_server = None
+
+    def reset(self):
+        """Remove all registered metrics"""
+        with self._lock:
+            self.metrics = {}
+
+
+# Process-wide registry used by server and clients
+REGISTRY = MetricsRegistry(enabled=config.METRICS_ENABLED)
+
+
+def timer(name):
+    """Time a block of code on the process-wide registry"""
+    return REGISTRY.timer(name)
+
+
+def configure(port=None):
+    """
+    Apply metrics settings from config and start the endpoint if requested
+
+    Args:
+        port: Optional endpoint port overriding config.METRICS_PORT (enables metrics)
+    """
+    if port is not None:
+        config.METRICS_ENABLED = True
+        config.METRICS_PORT = port
+
+    REGISTRY.enabled = config.METRICS_ENABLED
+    if REGISTRY.enabled and config.METRICS_PORT:
+        REGISTRY.serve(config.METRICS_PORT)
+
+
+def dump_snapshot(component):
+    """
+    Write the registry snapshot to the log directory if metrics are enabled
+
+    Args:
+        component: Component name used for the file name
+    """
+    if REGISTRY.enabled:
+        REGISTRY.dump(os.path.join(config.LOG_DIRECTORY, f"{component.lower()}_metrics.json"))
@@ -0,0 +1,139 @@
+/*
+ * Native error detection kernels for utils/native_backend.py
+ *
+ * Every function works on a byte buffer and reproduces the bit-level
+ * result of the pure-Python reference classes in utils/error_detection.py.
+ * Build: cc -O2 -shared -fPIC -o _detectors.so detectors.c
+ */
+
+#include <stddef.h>
+#include <stdint.h>
+
+#if defined(_WIN32)
+#define DC_EXPORT __declspec(dllexport)
+#else
+#define DC_EXPORT
+#endif
+
+/* Even parity of all bits in the buffer (1 if the number of ones is odd) */
+DC_EXPORT int dc_parity(const unsigned char *buf, size_t len)
+{
+    unsigned char acc = 0;
+    size_t i;
+
+    for (i = 0; i < len; i++)
+        acc ^= buf[i];
+
+    acc ^= acc >> 4;
+    acc ^= acc >> 2;
+    acc ^= acc >> 1;
+    return acc & 1;
+}
+
+/*
+ * Remainder of M(x) * x^degree mod P(x), MSB first, zero initial value.
+ * poly holds P(x) without its leading x^degree term; 1 <= degree <= 63.
+ */
+DC_EXPORT uint64_t dc_crc(const unsigned char *buf, size_t len, uint64_t poly, int degree)
+{
+    uint64_t mask = (1ULL << degree) - 1;
+    uint64_t top = 1ULL << (degree - 1);
+    uint64_t crc = 0;
+    size_t i;
+    int bit;
+
+    poly &= mask;
+
+    if (degree < 8) {
+        for (i = 0; i < len; i++) {
+            for (bit = 7; bit >= 0; bit--) {
+                uint64_t feedback = ((crc & top) != 0) ^ ((buf[i] >> bit) & 1);
+                crc = (crc << 1) & mask;
+                if (feedback)
+                    crc ^= poly;
+            }
+        }
+        return crc;
+    }
+
+    {
+        uint64_t table[256];
+        int shift = degree - 8;
+        int byte;
+
+        for (byte = 0; byte < 256; byte++) {
+            uint64_t value = (uint64_t)byte << shift;
+            for (bit = 0; bit < 8; bit++)
+                value = (value & top) ? ((value << 1) ^ poly) & mask : (value << 1) & mask;
+            table[byte] = value;
+        }
+
+        for (i = 0; i < len; i++)
+            crc = (table[((crc >> shift) ^ buf[i]) & 0xFF] ^ (crc << 8)) & mask;
+    }
+
+    return crc;
+}
+
+/* Reflected CRC-32C (Castagnoli) with standard init and final XOR */
+DC_EXPORT uint32_t dc_crc32c(const unsigned char *buf, size_t len, uint32_t poly)
+{
+    uint32_t table[256];
+    uint32_t crc = 0xFFFFFFFFu;
+    size_t i;
+    int byte, bit;
+
+    for (byte = 0; byte < 256; byte++) {
+        uint32_t value = (uint32_t)byte;
+        for (bit = 0; bit < 8; bit++)
+            value = (value & 1) ? (value >> 1) ^ poly : value >> 1;
+        table[byte] = value;
+    }
+
+    for (i = 0; i < len; i++)
+        crc = table[(crc ^ buf[i]) & 0xFF] ^ (crc >> 8);
+
+    return crc ^ 0xFFFFFFFFu;
+}
+
+/* Ones' complement sum of big-endian 16-bit words, complemented */
+DC_EXPORT uint32_t dc_internet_checksum(const unsigned char *buf, size_t len)
+{
+    uint64_t sum = 0;
+    size_t i;
+
+    for (i = 0; i + 1 < len; i += 2)
+        sum += ((uint32_t)buf[i] << 8) | buf[i + 1];
+    if (len & 1)
+        sum += (uint32_t)buf[len - 1] << 8;
+
+    while (sum >> 16)
+        sum = (sum & 0xFFFF) + (sum >> 16);
+
+    return (uint32_t)(~sum & 0xFFFF);
+}
+
+/*
+ * XOR of the Hamming code positions (1-based, parity positions skipped)
+ * of every set data bit. Bit i of the result is Hamming parity bit 2^i.
+ */
+DC_EXPORT uint64_t dc_hamming_syndrome(const unsigned char *buf, size_t len)
+{
+    uint64_t syndrome = 0;
+    uint64_t position = 1;
+    size_t i;
+    int bit;
+
+    for (i = 0; i < len; i++) {
+        for (bit = 7; bit >= 0; bit--) {
+            /* Skip parity positions (powers of two) */
+            while ((position & (position - 1)) == 0)
+                position++;
+            if ((buf[i] >> bit) & 1)
+                syndrome ^= position;
+            position++;
+        }
+    }
+
+    return syndrome;
+}
@@ -0,0 +1,232 @@
+"""
+Optional C-accelerated error detection backend
+Loads utils/native/_detectors (built from the bundled detectors.c with any
+C compiler) through ctypes. Results are bit-identical to the pure-Python
+reference classes, which are used whenever the library is not built or a
+payload cannot be represented as one byte per character.
+
+Build with:  python -m utils.native_backend
+"""
+
+import ctypes
+import os
+import shutil
+import subprocess
+import sys
+
+from datacom import config
+from datacom.utils import error_detection
+from datacom.utils.error_detection import (
+    ParityBit, CRC, HammingCode, InternetChecksum, CRC32C, register_detector
+)
+
+NATIVE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'native')
+SOURCE_PATH = os.path.join(NATIVE_DIR, 'detectors.c')
+LIBRARY_NAME = '_detectors.dll' if sys.platform == 'win32' else '_detectors.so'
+
+_lib = None
+NATIVE_AVAILABLE = False
+
+
+def build(output_dir=None, compiler=None):
+    """
+    Compile the bundled C source into a shared library
+
+    Args:
+        output_dir: Directory for the library (default: utils/native)
+        compiler: Compiler command (default: $CC, then cc/gcc/clang)
+
+    Returns:
+        Path of the built library
+    """
+    compiler = compiler or os.environ.get('CC')
+    if not compiler:
+        compiler = next((cc for cc in ('cc', 'gcc', 'clang') if shutil.which(cc)), None)
+    if not compiler:
+        raise RuntimeError("No C compiler found (set CC)")
+
+    output_path = os.path.join(output_dir or NATIVE_DIR, LIBRARY_NAME)
+    command = [compiler, '-O2', '-shared', SOURCE_PATH, '-o', output_path]
+    if sys.platform != 'win32':
+        command.insert(2, '-fPIC')
+
+    subprocess.run(command, check=True)
+    return output_path
+
+
+def load(path=None):
+    """
+    Load the shared library
+
+    Args:
+        path: Library path (default: utils/native/_detectors)
+
+    Returns:
+        True if loaded, False if the library is missing or unusable
+    """
+    global _lib, NATIVE_AVAILABLE
+
+    path = path or os.path.join(NATIVE_DIR, LIBRARY_NAME)
+    try:
+        lib = ctypes.CDLL(path)
+    except OSError:
+        return False
+
+    size_t = ctypes.c_size_t
+    lib.dc_parity.argtypes = [ctypes.c_char_p, size_t]
+    lib.dc_parity.restype = ctypes.c_int
+    lib.dc_crc.argtypes = [ctypes.c_char_p, size_t, ctypes.c_uint64, ctypes.c_int]
+    lib.dc_crc.restype = ctypes.c_uint64
+    lib.dc_crc32c.argtypes = [ctypes.c_char_p, size_t, ctypes.c_uint32]
+    lib.dc_crc32c.restype = ctypes.c_uint32
+    lib.dc_internet_checksum.argtypes = [ctypes.c_char_p, size_t]
+    lib.dc_internet_checksum.restype = ctypes.c_uint32
+    lib.dc_hamming_syndrome.argtypes = [ctypes.c_char_p, size_t]
+    lib.dc_hamming_syndrome.restype = ctypes.c_uint64
+
+    _lib = lib
+    NATIVE_AVAILABLE = True
+    return True
+
+
+def _char_bytes(data):
+    """
+    Get one byte per character, as used by string_to_binary
+
+    Returns:
+        bytes, or None if a character is outside 0-255 (reference
+        implementation must be used)
+    """
+    try:
+        return data.encode('latin-1')
+    except UnicodeEncodeError:
+        return None
+
+
+class NativeParityBit(ParityBit):
+    """Parity Bit backed by the native library"""
+
+    @staticmethod
+    def generate(data):
+        buf = _char_bytes(data)
+        if buf is None:
+            return ParityBit.generate(data)
+        return '1' if _lib.dc_parity(buf, len(buf)) else '0'
+
+    @staticmethod
+    def verify(data, received_parity):
+        return NativeParityBit.generate(data) == received_parity
+
+
+class NativeCRC(CRC):
+    """CRC backed by the native library (degrees 1-63)"""
+
+    @staticmethod
+    def generate(data, polynomial=None):
+        if polynomial is None:
+            polynomial = config.CRC_POLYNOMIAL
+
+        degree = polynomial.bit_length() - 1
+        buf = _char_bytes(data)
+        if buf is None or not 1 <= degree <= 63:
+            return CRC.generate(data, polynomial)
+
+        crc = _lib.dc_crc(buf, len(buf), polynomial & ((1 << degree) - 1), degree)
+        return format(crc, f'0{degree}b')
+
+    @staticmethod
+    def verify(data, received_crc, polynomial=None):
+        return NativeCRC.generate(data, polynomial) == received_crc
+
+
+class NativeHammingCode(HammingCode):
+    """Hamming Code backed by the native library"""
+
+    @staticmethod
+    def generate(data):
+        buf = _char_bytes(data)
+        if buf is None:
+            return HammingCode.generate(data)
+
+        m = len(buf) * 8
+        r = 0
+        while (2 ** r) < (m + r + 1):
+            r += 1
+
+        syndrome = _lib.dc_hamming_syndrome(buf, len(buf))
+        return ''.join('1' if (syndrome >> i) & 1 else '0' for i in range(r))
+
+    @staticmethod
+    def verify(data, received_parity):
+        return NativeHammingCode.generate(data) == received_parity
+
+
+class NativeInternetChecksum(InternetChecksum):
+    """Internet Checksum backed by the native library"""
+
+    @staticmethod
+    def generate(data):
+        data_bytes = data.encode(config.ENCODING)
+        return format(_lib.dc_internet_checksum(data_bytes, len(data_bytes)), '04x')
+
+    @staticmethod
+    def verify(data, received_checksum):
+        return NativeInternetChecksum.generate(data) == received_checksum
+
+
+class NativeCRC32C(CRC32C):
+    """CRC-32C backed by the native library"""
+
+    @staticmethod
+    def generate(data):
+        data_bytes = data.encode(config.ENCODING)
+        crc = _lib.dc_crc32c(data_bytes, len(data_bytes), config.CRC32C_POLYNOMIAL)
+        return format(crc, '08x')
+
+    @staticmethod
+    def verify(data, received_crc):
+        return NativeCRC32C.generate(data) == received_crc
+
+
+NATIVE_DETECTORS = {
+    'PARITY': NativeParityBit,
+    'CRC': NativeCRC,
+    'HAMMING': NativeHammingCode,
+    'CHECKSUM': NativeInternetChecksum,
+    'CRC32C': NativeCRC32C
+}
+
+
+def install():
+    """
+    Register the native detectors in place of the reference classes
+
+    Returns:
+        True if the native library is loaded and installed
+    """
+    if not NATIVE_AVAILABLE and not load():
+        return False
+
+    for method, detector in NATIVE_DETECTORS.items():
+        if method in error_detection.DETECTOR_IDS:
+            register_detector(method, detector, replace=True)
+    return True
+
+
+def main():
+    """Build the native library and check it against the reference classes"""
+    path = build()
+    if not load(path):
+        print(f"Built {path} but could not load it")
+        sys.exit(1)
+
+    sample = "The quick brown fox jumps over the lazy dog"
+    for method, detector in NATIVE_DETECTORS.items():
+        reference = detector.__mro__[1]
+        status = 'ok' if detector.generate(sample) == reference.generate(sample) else 'MISMATCH'
+        print(f"  {method:<10} {status}")
+    print(f"Built {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""
+Packet Handler utility for creating and parsing packets
+Packet Format: DATA|METHOD|CONTROL_INFO[|HEADER]
+The optional HEADER field carries key=value pairs separated by ';'
+"""
+
+from datacom import config
+
+
+class Packet:
+    """Packet class for handling data transmission"""
+    
+    def __init__(self, data=None, method=None, control_info=None, headers=None):
+        """Initialize packet with data, method, control information and optional headers"""
+        self.data = data
+        self.method = method
+        self.control_info = control_info
+        self.headers = dict(headers) if headers else {}
+        self._encoded = None
+    
+    def encoded_data(self, encoding=None):
+        """
+        Encode the payload, reusing the last result while data is unchanged
+        
+        Args:
+            encoding: Text encoding (default: config.ENCODING)
+            
+        Returns:
+            Payload bytes
+        """
+        encoding = encoding or config.ENCODING
+        cached = self._encoded
+        if cached is None or cached[0] is not self.data or cached[1] != encoding:
+            cached = self._encoded = (self.data, encoding, self.data.encode(encoding))
+        return cached[2]
+    
+    def to_string(self):
+        """
+        Convert packet to string format for transmission
+        
+        Returns:
+            String in format: DATA|METHOD|CONTROL_INFO, followed by |HEADER
+            when the packet has headers
+        """
+        delimiter = config.PACKET_DELIMITER
+        packet_string = f"{self.data}{delimiter}{self.method}{delimiter}{self.control_info}"
+        if self.headers:
+            packet_string += delimiter + encode_headers(self.headers)
+        return packet_string
+    
+    def to_buffers(self, encoding=None):
+        """
+        Encode packet for transmission as separate buffers
+        
+        The payload is encoded once and kept apart from the short
+        METHOD|CONTROL_INFO[|HEADER] trailer, so writers can hand both to
+        sendmsg without joining them into one string first.
+        
+        Args:
+            encoding: Text encoding (default: config.ENCODING)
+            
+        Returns:
+            list: [data bytes, trailer bytes], which joined equal to_string() encoded
+        """
+        encoding = encoding or config.ENCODING
+        delimiter = config.PACKET_DELIMITER
+        trailer = f"{delimiter}{self.method}{delimiter}{self.control_info}"
+        if self.headers:
+            trailer += delimiter + encode_headers(self.headers)
+        return [self.encoded_data(encoding), trailer.encode(encoding)]
+    
+    @classmethod
+    def from_string(cls, packet_string):
+        """
+        Parse packet string into Packet object
+        
+        Args:
+            packet_string: String in format DATA|METHOD|CONTROL_INFO[|HEADER]
+            
+        Returns:
+            Packet object
+        """
+        try:
+            parts = packet_string.split(config.PACKET_DELIMITER)
+            if len(parts) not in (3, 4):
+                raise ValueError("Invalid packet format")
+            
+            headers = decode_headers(parts[3]) if len(parts) == 4 else None
+            return cls(data=parts[0], method=parts[1], control_info=parts[2], headers=headers)
+        except Exception as e:
+            raise ValueError(f"Failed to parse packet: {e}")
+    
+    def __str__(self):
+        """String representation of packet"""
+        return (f"Packet(data='{self.data}', method='{self.method}', "
+                f"control_info='{self.control_info}')")
+    
+    def is_valid(self):
+        """
+        Check if packet has all required fields
+        
+        Returns:
+            True if valid, False otherwise
+        """
+        return (self.data is not None and 
+                self.method is not None and 
+                self.control_info is not None)
+
+
+def encode_headers(headers):
+    """
+    Encode header dict as key=value pairs
+    
+    Args:
+        headers: dict of header fields
+        
+    Returns:
+        String in format key=value;key=value
+    """
+    return ';'.join(f"{key}={value}" for key, value in headers.items())
+
+
+def decode_headers(header_string):
+    """
+    Decode key=value header string
+    
+    Args:
+        header_string: String in format key=value;key=value
+        
+    Returns:
+        dict of header fields (values as strings)
+    """
+    headers = {}
+    for field in header_string.split(';'):
+        if not field:
+            continue
+        key, sep, value = field.partition('=')
+        if not sep:
+            raise ValueError(f"Invalid header field: {field}")
+        headers[key] = value
+    return headers
+
+
+def create_packet(data, method, control_info, headers=None):
+    """
+    Create a packet object
+    
+    Args:
+        data: Data to transmit
+        method: Error detection method
+        control_info: Control information (parity, CRC, etc.)
+        headers: Optional header fields (trace metadata, flags)
+        
+    Returns:
+        Packet object
+    """
+    return Packet(data, method, control_info, headers)
+
+
+def parse_packet(packet_string):
+    """
+    Parse packet string into components
+    
+    Args:
+        packet_string: String in format DATA|METHOD|CONTROL_INFO[|HEADER]
+        
+    Returns:
+        Packet object
+    """
+    return Packet.from_string(packet_string)
+
+
+def validate_packet(packet):
+    """
+    Validate packet structure
+    
+    Args:
+        packet: Packet object or string
+        
+    Returns:
+        True if valid, False otherwise
+    """
+    if isinstance(packet, str):
+        try:
+            packet = Packet.from_string(packet)
+        except ValueError:
+            return False
+    
+    return packet.is_valid()
@@ -0,0 +1,445 @@
+"""
+Parallel chunked detectors for single huge payloads
+CRC, CRC-32C and the Internet checksum are combinable: the payload is
+copied once into shared memory, worker processes compute each chunk's
+partial result from the segment (only its name and offsets are pickled),
+and the partials are merged into exactly the value the serial classes
+produce. CRC chunks are merged with GF(2) shift math (remainder of
+A * x^len(B) mod P, as zlib's crc32_combine), checksum chunks by adding
+their ones' complement sums.
+
+Enable with PARALLEL_DETECTORS = True; payloads shorter than
+PARALLEL_THRESHOLD characters stay on the serial path.
+"""
+
+import atexit
+import os
+import sys
+from array import array
+
+from datacom import config
+from datacom.utils import error_detection
+from datacom.utils.error_detection import CRC, CRC32C, InternetChecksum, register_detector
+
+_pool = None
+_pool_workers = 0
+
+
+def _gf2_mulmod(a, b, polynomial, degree):
+    """Multiply two remainders modulo P(x) (MSB-first, bit i = x^i)"""
+    result = 0
+    while b:
+        if b & 1:
+            result ^= a
+        b >>= 1
+        a <<= 1
+        if (a >> degree) & 1:
+            a ^= polynomial
+    return result
+
+
+def _x_pow_mod(n, polynomial, degree):
+    """x^n mod P(x) by square-and-multiply"""
+    result = 1
+    base = 2 ^ polynomial if degree == 1 else 2
+    while n:
+        if n & 1:
+            result = _gf2_mulmod(result, base, polynomial, degree)
+        base = _gf2_mulmod(base, base, polynomial, degree)
+        n >>= 1
+    return result
+
+
+def crc_combine(crc_a, crc_b, length_b, polynomial):
+    """
+    Combine CRC.generate() remainders of two adjacent chunks
+
+    Args:
+        crc_a: Remainder of the first chunk (int)
+        crc_b: Remainder of the second chunk (int)
+        length_b: Length of the second chunk in bits
+        polynomial: Generator polynomial including its leading term
+
+    Returns:
+        Remainder of the concatenation (int)
+    """
+    degree = polynomial.bit_length() - 1
+    return _gf2_mulmod(crc_a, _x_pow_mod(length_b, polynomial, degree),
+                       polynomial, degree) ^ crc_b
+
+
+def _reflected_mulmod(a, b, polynomial):
+    """Multiply two reflected 32-bit remainders modulo P(x) (bit 31 = x^0)"""
+    result = 0
+    mask = 1 << 31
+    while a:
+        if a & mask:
+            result ^= b
+            a ^= mask
+        mask >>= 1
+        b = (b >> 1) ^ polynomial if b & 1 else b >> 1
+    return result
+
+
+def crc32_combine(crc_a, crc_b, length_b, polynomial=None):
+    """
+    Combine reflected 32-bit CRCs (CRC-32C, zlib CRC-32) of two adjacent chunks
+
+    Args:
+        crc_a: CRC of the first chunk
+        crc_b: CRC of the second chunk
+        length_b: Length of the second chunk in bytes
+        polynomial: Reflected polynomial (default: config.CRC32C_POLYNOMIAL)
+
+    Returns:
+        CRC of the concatenation
+    """
+    if polynomial is None:
+        polynomial = config.CRC32C_POLYNOMIAL
+
+    # x^(8 * length_b) mod P, starting from x^0 with x^1 as the base
+    shift, base, n = 1 << 31, 1 << 30, 8 * length_b
+    while n:
+        if n & 1:
+            shift = _reflected_mulmod(shift, base, polynomial)
+        base = _reflected_mulmod(base, base, polynomial)
+        n >>= 1
+    return _reflected_mulmod(shift, crc_a, polynomial) ^ crc_b
+
+
+def checksum_combine(sum_a, sum_b):
+    """
+    Add two ones' complement 16-bit sums (chunks must start on even offsets)
+
+    Returns:
+        Folded 16-bit sum
+    """
+    total = sum_a + sum_b
+    while total >> 16:
+        total = (total & 0xFFFF) + (total >> 16)
+    return total
+
+
+def _native_lib(use_native):
+    """The native library in this process, or None"""
+    if not use_native:
+        return None
+    from datacom.utils import native_backend
+    if not native_backend.NATIVE_AVAILABLE:
+        native_backend.load()
+    return native_backend._lib
+
+
+def _attach(name):
+    """Attach to the caller's segment without taking ownership of it"""
+    from multiprocessing import resource_tracker, shared_memory
+
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    # Before 3.13 attaching registers the segment with this process's
+    # resource tracker, which would unlink it again at exit
+    shm = shared_memory.SharedMemory(name=name)
+    resource_tracker.unregister(shm._name, 'shared_memory')
+    return shm
+
+
+def _c_buffer(view):
+    """Pass a shared-memory slice to the native library without copying it"""
+    import ctypes
+    return (ctypes.c_char * len(view)).from_buffer(view)
+
+
+def _chunk_crc(lib, view, polynomial):
+    """CRC.generate() remainder of one chunk"""
+    degree = polynomial.bit_length() - 1
+    if lib is not None and degree <= 63:
+        return lib.dc_crc(_c_buffer(view), len(view), polynomial & ((1 << degree) - 1), degree)
+    return int(CRC.generate(str(view, 'latin-1'), polynomial), 2)
+
+
+def _chunk_crc32c(lib, view, polynomial):
+    """CRC-32C of one chunk"""
+    if lib is not None:
+        return lib.dc_crc32c(_c_buffer(view), len(view), polynomial)
+    table = CRC32C.TABLE
+    crc = 0xFFFFFFFF
+    for byte in view:
+        crc = table[(crc ^ byte) & 0xFF] ^ (crc >> 8)
+    return crc ^ 0xFFFFFFFF
+
+
+def _chunk_checksum(lib, view, polynomial):
+    """Folded ones' complement sum of one chunk (not complemented)"""
+    if lib is not None:
+        return ~lib.dc_internet_checksum(_c_buffer(view), len(view)) & 0xFFFF
+    words = array('H')
+    words.frombytes(view[:len(view) & ~1])
+    if sys.byteorder == 'little':
+        words.byteswap()
+    total = sum(words)
+    if len(view) & 1:
+        total += view[-1] << 8
+    return checksum_combine(total, 0)
+
+
+_CHUNK_FUNCS = {
+    'crc': _chunk_crc,
+    'crc32c': _chunk_crc32c,
+    'checksum': _chunk_checksum,
+}
+
+
+def _chunk_task(kind, name, start, end, polynomial, use_native):
+    """Worker: partial result of one chunk of the shared segment"""
+    shm = _attach(name)
+    view = shm.buf[start:end]
+    try:
+        return _CHUNK_FUNCS[kind](_native_lib(use_native), view, polynomial)
+    finally:
+        view.release()
+        shm.close()
+
+
+def worker_count():
+    """Configured worker processes (PARALLEL_WORKERS, 0 = one per CPU)"""
+    return config.PARALLEL_WORKERS or os.cpu_count() or 1
+
+
+def _get_pool(workers):
+    """Process pool with at least `workers` processes, created on first use"""
+    global _pool, _pool_workers
+    if _pool is None or _pool_workers < workers:
+        from concurrent.futures import ProcessPoolExecutor
+        import multiprocessing
+
+        shutdown()
+        # spawn: the relay processes run threads, which fork does not copy safely
+        _pool = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('spawn'))
+        _pool_workers = workers
+    return _pool
+
+
+def shutdown():
+    """Stop the worker pool (a later call starts a new one)"""
+    global _pool, _pool_workers
+    if _pool is not None:
+        _pool.shutdown()
+        _pool, _pool_workers = None, 0
+
+
+atexit.register(shutdown)
+
+
+def _chunk_bounds(length, chunks, align):
+    """Split [0, length) into `chunks` ranges starting on multiples of align"""
+    step = -(-length // chunks)
+    step += -step % align
+    return [(start, min(start + step, length)) for start in range(0, length, max(step, align))]
+
+
+def _partials(kind, buf, workers, polynomial=0, align=1):
+    """
+    Compute per-chunk partial results in the worker pool
+
+    Returns:
+        list of (partial result, chunk length in bytes), in order
+    """
+    from multiprocessing import resource_tracker, shared_memory
+
+    bounds = _chunk_bounds(len(buf), workers, align)
+    use_native = config.DETECTOR_BACKEND in ('auto', 'native')
+    shm = shared_memory.SharedMemory(create=True, size=len(buf))
+    try:
+        shm.buf[:len(buf)] = buf
+        pool = _get_pool(workers)
+        futures = [pool.submit(_chunk_task, kind, shm.name, start, end, polynomial, use_native)
+                   for start, end in bounds]
+        return [(future.result(), end - start)
+                for future, (start, end) in zip(futures, bounds)]
+    finally:
+        shm.close()
+        # Workers dropped their tracker entries (see _attach); re-add it so
+        # unlink() works whether or not they share this process's tracker
+        resource_tracker.register(shm._name, 'shared_memory')
+        shm.unlink()
+
+
+def crc(data, polynomial=None, workers=None):
+    """
+    CRC.generate() computed in parallel chunks
+
+    Args:
+        data: Payload string
+        polynomial: Generator polynomial (default: config.CRC_POLYNOMIAL)
+        workers: Number of chunks/processes (default: worker_count())
+
+    Returns:
+        CRC as binary string, identical to CRC.generate(data, polynomial)
+    """
+    if polynomial is None:
+        polynomial = config.CRC_POLYNOMIAL
+    workers = workers or worker_count()
+
+    degree = polynomial.bit_length() - 1
+    try:
+        # The reference CRC runs over one byte per character
+        buf = data.encode('latin-1')
+    except UnicodeEncodeError:
+        buf = None
+    if buf is None or degree < 1 or workers < 2 or len(buf) < workers:
+        return CRC.generate(data, polynomial)
+
+    partials = _partials('crc', buf, workers, polynomial)
+    result = partials[0][0]
+    for partial, length in partials[1:]:
+        result = crc_combine(result, partial, 8 * length, polynomial)
+    return format(result, f'0{degree}b')
+
+
+def crc32c(data, workers=None):
+    """
+    CRC32C.generate() computed in parallel chunks
+
+    Returns:
+        CRC as hexadecimal string, identical to CRC32C.generate(data)
+    """
+    workers = workers or worker_count()
+    buf = data.encode(config.ENCODING)
+    if workers < 2 or len(buf) < workers:
+        return CRC32C.generate(data)
+
+    partials = _partials('crc32c', buf, workers, config.CRC32C_POLYNOMIAL)
+    result = partials[0][0]
+    for partial, length in partials[1:]:
+        result = crc32_combine(result, partial, length)
+    return format(result, '08x')
+
+
+def internet_checksum(data, workers=None):
+    """
+    InternetChecksum.generate() computed in parallel chunks
+
+    Returns:
+        Checksum as hexadecimal string, identical to InternetChecksum.generate(data)
+    """
+    workers = workers or worker_count()
+    buf = data.encode(config.ENCODING)
+    if workers < 2 or len(buf) < 2 * workers:
+        return InternetChecksum.generate(data)
+
+    total = 0
+    for partial, _ in _partials('checksum', buf, workers, align=2):
+        total = checksum_combine(total, partial)
+    return format(~total & 0xFFFF, '04x')
+
+
+class ParallelCRC(CRC):
+    """CRC split across worker processes for payloads over PARALLEL_THRESHOLD"""
+
+    serial = CRC
+
+    @staticmethod
+    def generate(data, polynomial=None):
+        if len(data) >= config.PARALLEL_THRESHOLD and worker_count() > 1:
+            return crc(data, polynomial)
+        return ParallelCRC.serial.generate(data, polynomial)
+
+    @staticmethod
+    def verify(data, received_crc, polynomial=None):
+        return ParallelCRC.generate(data, polynomial) == received_crc
+
+
+class ParallelCRC32C(CRC32C):
+    """CRC-32C split across worker processes for payloads over PARALLEL_THRESHOLD"""
+
+    serial = CRC32C
+
+    @staticmethod
+    def generate(data):
+        if len(data) >= config.PARALLEL_THRESHOLD and worker_count() > 1:
+            return crc32c(data)
+        return ParallelCRC32C.serial.generate(data)
+
+    @staticmethod
+    def verify(data, received_crc):
+        return ParallelCRC32C.generate(data) == received_crc
+
+
+class ParallelInternetChecksum(InternetChecksum):
+    """Internet Checksum split across worker processes for payloads over PARALLEL_THRESHOLD"""
+
+    serial = InternetChecksum
+
+    @staticmethod
+    def generate(data):
+        if len(data) >= config.PARALLEL_THRESHOLD and worker_count() > 1:
+            return internet_checksum(data)
+        return ParallelInternetChecksum.serial.generate(data)
+
+    @staticmethod
+    def verify(data, received_checksum):
+        return ParallelInternetChecksum.generate(data) == received_checksum
+
+
+PARALLEL_DETECTORS = {
+    'CRC': ParallelCRC,
+    'CRC32C': ParallelCRC32C,
+    'CHECKSUM': ParallelInternetChecksum
+}
+
+
+def install():
+    """
+    Wrap the registered CRC, CRC-32C and checksum detectors with the parallel ones
+
+    Payloads below the threshold keep using whichever class (reference or
+    accelerated) was registered before.
+
+    Returns:
+        True once installed
+    """
+    for method, detector in PARALLEL_DETECTORS.items():
+        current = error_detection.get_error_detector(method)
+        if current is not detector:
+            detector.serial = current
+            register_detector(method, detector, replace=True)
+    return True
+
+
+def main():
+    """Compare serial and parallel results and timings on one large payload"""
+    import argparse
+    import random
+    import time
+
+    parser = argparse.ArgumentParser(description="Benchmark parallel chunked detectors")
+    parser.add_argument('--size', type=int, default=32 * 1024 * 1024, help="payload bytes")
+    parser.add_argument('--workers', type=int, default=worker_count())
+    args = parser.parse_args()
+
+    # Random printable ASCII
+    printable = bytes(33 + byte % 94 for byte in range(256))
+    data = random.Random(1).randbytes(args.size).translate(printable).decode('ascii')
+
+    print(f"{args.size:,} bytes, {args.workers} workers (host has {os.cpu_count()} CPUs)")
+    cases = [
+        ('CRC', lambda: crc(data, workers=args.workers)),
+        ('CRC32C', lambda: crc32c(data, workers=args.workers)),
+        ('CHECKSUM', lambda: internet_checksum(data, workers=args.workers)),
+    ]
+    for method, parallel in cases:
+        serial = error_detection.get_error_detector(method)
+        parallel()  # warm up the workers
+        start = time.perf_counter()
+        expected = serial.generate(data)
+        serial_time = time.perf_counter() - start
+        start = time.perf_counter()
+        result = parallel()
+        parallel_time = time.perf_counter() - start
+        status = 'ok' if result == expected else 'MISMATCH'
+        print(f"  {method:<10} serial {serial_time * 1e3:9.1f} ms  parallel "
+              f"{parallel_time * 1e3:9.1f} ms  {serial_time / parallel_time:5.2f}x  {status}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+"""
+Runtime configuration
+Typed, validated overrides for the constants in config.py, loaded from a
+file, DATACOM_* environment variables and --set NAME=VALUE flags (in that
+order of precedence) and applied to the config module at startup
+"""
+
+import json
+import os
+import sys
+
+from datacom import config
+
+ENV_PREFIX = 'DATACOM_'
+CONFIG_FILE_ENV = 'DATACOM_CONFIG'
+
+
+class ConfigError(ValueError):
+    """Raised when runtime configuration fails validation"""
+
+
+def _port(value):
+    return 1 <= value <= 65535
+
+
+def _port_or_zero(value):
+    return value == 0 or _port(value)
+
+
+def _positive(value):
+    return value > 0
+
+
+def _non_negative(value):
+    return value >= 0
+
+
+class Setting:
+    """Schema entry for one overridable config constant"""
+
+    def __init__(self, name, type_, check=None, choices=None):
+        """
+        Initialize setting
+
+        Args:
+            name: Name of the constant in config.py
+            type_: int, float, bool or str
+            check: Optional predicate the converted value must satisfy
+            choices: Optional allowed values
+        """
+        self.name = name
+        self.type = type_
+        self.check = check
+        self.choices = choices
+
+    def convert(self, value):
+        """
+        Convert a raw value (string from env/CLI, or file value) and validate it
+
+        Raises:
+            ConfigError: If the value has the wrong type or is out of range
+        """
+        try:
+            if self.type is bool:
+                value = _to_bool(value)
+            elif self.type is int:
+                if isinstance(value, bool) or isinstance(value, float):
+                    raise ValueError
+                value = int(value, 0) if isinstance(value, str) else int(value)
+            elif self.type is float:
+                value = float(value)
+            else:
+                value = str(value)
+        except (TypeError, ValueError):
+            raise ConfigError(f"{self.name}: expected {self.type.__name__}, got {value!r}")
+
+        if self.choices is not None and value not in self.choices:
+            raise ConfigError(f"{self.name}: {value!r} is not one of {', '.join(map(str, self.choices))}")
+        if self.check is not None and not self.check(value):
+            raise ConfigError(f"{self.name}: {value!r} is out of range ({self.check.__name__.strip('_')})")
+        return value
+
+
+def _to_bool(value):
+    """Parse booleans from files (true/false) and env/CLI strings (1/0, yes/no, on/off)"""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in ('1', 'true', 'yes', 'on'):
+            return True
+        if lowered in ('0', 'false', 'no', 'off'):
+            return False
+    raise ValueError(value)
+
+
+SCHEMA = {setting.name: setting for setting in [
+    # Network
+    Setting('SERVER_HOST', str),
+    Setting('SERVER_TO_CLIENT1_PORT', int, _port),
+    Setting('SERVER_TO_CLIENT2_PORT', int, _port),
+
+    # Sockets
+    Setting('BUFFER_SIZE', int, _positive),
+    Setting('MAX_FRAME_SIZE', int, _positive),
+    Setting('LISTEN_BACKLOG', int, _positive),
+    Setting('SOCKET_TIMEOUT', float, _positive),
+    Setting('TCP_NODELAY', bool),
+    Setting('SOCKET_SNDBUF', int, _non_negative),
+    Setting('SOCKET_RCVBUF', int, _non_negative),
+    Setting('TRANSPORT', str, choices=('tcp', 'unix', 'shm', 'udp')),
+    Setting('UNIX_SOCKET_DIR', str),
+    Setting('SHM_RING_SIZE', int, _positive),
+    Setting('UDP_REORDER_WINDOW', int, _positive),
+
+    # Relay pipeline
+    Setting('PIPELINE_QUEUE_SIZE', int, _positive),
+    Setting('INJECT_WORKERS', int, _positive),
+    Setting('FORWARD_BATCH_PACKETS', int, _positive),
+    Setting('FORWARD_BATCH_BYTES', int, _positive),
+    Setting('FORWARD_BATCH_DELAY_US', int, _non_negative),
+
+    # Compression
+    Setting('COMPRESSION', str, choices=('none', 'zlib', 'lzma')),
+    Setting('COMPRESSION_THRESHOLD', int, _non_negative),
+    Setting('COMPRESSION_LEVEL', int, choices=tuple(range(10))),
+
+    # Capture
+    Setting('CAPTURE_BUFFER_SIZE', int, _positive),
+    Setting('CAPTURE_FSYNC_INTERVAL', float, _non_negative),
+
+    # Detectors
+    Setting('CRC_POLYNOMIAL', int, _positive),
+    Setting('DETECTOR_BACKEND', str, choices=('auto', 'native', 'numpy', 'python')),
+    Setting('NUMPY_THRESHOLD', int, _non_negative),
+    Setting('PARALLEL_DETECTORS', bool),
+    Setting('PARALLEL_THRESHOLD', int, _non_negative),
+    Setting('PARALLEL_WORKERS', int, _non_negative),
+    Setting('PARITY_MATRIX_ROWS', int, _positive),
+    Setting('PARITY_MATRIX_COLS', int, _positive),
+    Setting('DETECTOR_CACHE_ENABLED', bool),
+    Setting('DETECTOR_CACHE_MAX_ENTRIES', int, _positive),
+    Setting('DETECTOR_CACHE_MAX_BYTES', int, _positive),
+    Setting('DETECTOR_CACHE_SMALL_PAYLOAD', int, _non_negative),
+
+    # Logging, tracing, metrics and console output
+    Setting('LOG_DIRECTORY', str),
+    Setting('LOG_LEVEL', str, choices=('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')),
+    Setting('ENABLE_FILE_LOGGING', bool),
+    Setting('ENABLE_CONSOLE_LOGGING', bool),
+    Setting('ASYNC_LOGGING', bool),
+    Setting('LOG_SAMPLE_EVERY', int, _positive),
+    Setting('TRACING_ENABLED', bool),
+    Setting('TRACE_REPORT_INTERVAL', float, _positive),
+    Setting('METRICS_ENABLED', bool),
+    Setting('METRICS_PORT', int, _port_or_zero),
+    Setting('COLORS_ENABLED', bool),
+    Setting('QUIET_MODE', bool),
+    Setting('SUMMARY_INTERVAL', float, _positive),
+]}
+
+
+class Settings:
+    """Validated configuration values and where each one came from"""
+
+    def __init__(self, values, sources):
+        self._values = values
+        self.sources = sources
+
+    def __getattr__(self, name):
+        try:
+            return self._values[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def as_dict(self):
+        """Get all values keyed by config name"""
+        return dict(self._values)
+
+    def apply(self):
+        """Write the values onto the config module"""
+        for name, value in self._values.items():
+            setattr(config, name, value)
+
+    def format(self):
+        """Format values and their sources, one per line"""
+        width = max(len(name) for name in self._values)
+        return '\n'.join(f"{name:<{width}}  {self._values[name]!r:<24} ({self.sources[name]})"
+                         for name in sorted(self._values))
+
+
+def read_file(path):
+    """
+    Read overrides from a JSON or (Python 3.11+) TOML file
+
+    Returns:
+        dict of config name -> raw value
+    """
+    try:
+        with open(path, 'rb') as f:
+            raw = f.read()
+    except OSError as e:
+        raise ConfigError(f"Cannot read config file {path}: {e}")
+
+    try:
+        if path.endswith('.toml'):
+            import tomllib
+            data = tomllib.loads(raw.decode('utf-8'))
+        else:
+            data = json.loads(raw)
+    except ImportError:
+        raise ConfigError("TOML config files need Python 3.11+; use JSON instead")
+    except ValueError as e:
+        raise ConfigError(f"Invalid config file {path}: {e}")
+
+    if not isinstance(data, dict):
+        raise ConfigError(f"Config file {path} must contain a table/object of settings")
+    return {str(key).upper(): value for key, value in data.items()}
+
+
+def _parse_assignments(assignments):
+    """Split NAME=VALUE strings from --set"""
+    values = {}
+    for assignment in assignments or []:
+        name, sep, value = assignment.partition('=')
+        if not sep:
+            raise ConfigError(f"--set expects NAME=VALUE, got {assignment!r}")
+        values[name.strip().upper()] = value.strip()
+    return values
+
+
+def load(path=None, environ=None, assignments=None):
+    """
+    Build validated settings from defaults, file, environment and CLI
+
+    Args:
+        path: Optional JSON/TOML file (default: $DATACOM_CONFIG)
+        environ: Environment mapping (default: os.environ)
+        assignments: NAME=VALUE strings from --set
+
+    Returns:
+        Settings
+
+    Raises:
+        ConfigError: Listing every unknown name and invalid value
+    """
+    environ = os.environ if environ is None else environ
+    path = path or environ.get(CONFIG_FILE_ENV)
+
+    layers = []
+    if path:
+        layers.append((f"file {path}", read_file(path)))
+    layers.append(('env', {name[len(ENV_PREFIX):]: value for name, value in environ.items()
+                           if name.startswith(ENV_PREFIX) and name != CONFIG_FILE_ENV}))
+    layers.append(('cli', _parse_assignments(assignments)))
+
+    values = {name: getattr(config, name) for name in SCHEMA if hasattr(config, name)}
+    sources = {name: 'default' for name in values}
+    errors = []
+
+    for source, layer in layers:
+        for name, raw in layer.items():
+            setting = SCHEMA.get(name)
+            if setting is None:
+                errors.append(f"{name}: unknown setting ({source})")
+                continue
+            try:
+                values[name] = setting.convert(raw)
+                sources[name] = source
+            except ConfigError as e:
+                errors.append(f"{e} ({source})")
+
+    if values.get('SERVER_TO_CLIENT1_PORT') == values.get('SERVER_TO_CLIENT2_PORT'):
+        errors.append("SERVER_TO_CLIENT1_PORT and SERVER_TO_CLIENT2_PORT must differ")
+
+    if errors:
+        raise ConfigError("Invalid configuration:\n  " + '\n  '.join(errors))
+    return Settings(values, sources)
+
+
+def add_arguments(parser):
+    """Add --config, --set and --show-config to an argparse parser"""
+    parser.add_argument('--config', metavar='PATH',
+                        help=f"JSON/TOML settings file (default: ${CONFIG_FILE_ENV})")
+    parser.add_argument('--set', metavar='NAME=VALUE', action='append', dest='overrides',
+                        help="override one setting, e.g. --set BUFFER_SIZE=65536 (repeatable)")
+    parser.add_argument('--show-config', action='store_true',
+                        help="print the effective settings and their sources, then exit")
+
+
+def configure(args):
+    """
+    Load, validate and apply settings for an entry point
+
+    Exits with status 2 on invalid configuration, or 0 after --show-config.
+
+    Args:
+        args: Parsed arguments from a parser set up with add_arguments()
+
+    Returns:
+        Settings
+    """
+    try:
+        settings = load(args.config, assignments=args.overrides)
+    except ConfigError as e:
+        print(e, file=sys.stderr)
+        raise SystemExit(2)
+
+    settings.apply()
+    if args.show_config:
+        print(settings.format())
+        raise SystemExit(0)
+    return settings
@@ -0,0 +1,271 @@
+"""
+Socket helpers shared by Client 1, the Server and Client 2
+Applies the configured socket options and frames packets on the stream
+(4-byte big-endian length prefix), sending with scatter-gather sendmsg and
+receiving with recv_into into one reusable buffer per connection
+"""
+
+import os
+import socket
+import struct
+
+from datacom import config
+
+_LENGTH = struct.Struct('!I')
+FRAME_HEADER_SIZE = _LENGTH.size
+
+# Buffers per sendmsg call (the kernel rejects more than IOV_MAX)
+try:
+    _IOV_MAX = min(os.sysconf('SC_IOV_MAX'), 1024)
+except (AttributeError, OSError, ValueError):
+    _IOV_MAX = 16
+
+
+def tune_socket(sock):
+    """
+    Apply TCP_NODELAY and SO_SNDBUF/SO_RCVBUF from config
+
+    Args:
+        sock: Socket to configure (TCP_NODELAY is skipped for non-TCP sockets)
+
+    Returns:
+        The same socket
+    """
+    if config.TCP_NODELAY and sock.family in (socket.AF_INET, socket.AF_INET6) \
+            and sock.type == socket.SOCK_STREAM:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    if config.SOCKET_SNDBUF:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, config.SOCKET_SNDBUF)
+    if config.SOCKET_RCVBUF:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, config.SOCKET_RCVBUF)
+    return sock
+
+
+def create_listener(host, port, backlog=None):
+    """
+    Create a tuned, bound and listening TCP socket
+
+    Buffer sizes are set before listen() so accepted connections inherit
+    them (and the TCP window is negotiated with them).
+
+    Args:
+        host: Interface to bind
+        port: Port to bind
+        backlog: Pending connection queue length (default: config.LISTEN_BACKLOG)
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    tune_socket(sock)
+    sock.bind((host, port))
+    sock.listen(backlog if backlog is not None else config.LISTEN_BACKLOG)
+    return sock
+
+
+def connect(host, port, timeout=None):
+    """
+    Open a tuned TCP connection
+
+    The timeout only bounds connect(); the returned socket blocks.
+
+    Args:
+        host: Remote host
+        port: Remote port
+        timeout: Connect timeout in seconds (default: config.SOCKET_TIMEOUT)
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    tune_socket(sock)
+    sock.settimeout(timeout if timeout is not None else config.SOCKET_TIMEOUT)
+    try:
+        sock.connect((host, port))
+    except BaseException:
+        sock.close()
+        raise
+    sock.settimeout(None)
+    return sock
+
+
+def send_frame(sock, payload):
+    """
+    Send one length-prefixed packet
+
+    Header and payload go out in a single call so TCP_NODELAY does not
+    split them into two segments.
+
+    Args:
+        sock: Connected socket
+        payload: Packet bytes
+    """
+    send_frames(sock, [[payload]])
+
+
+def send_frames(sock, frames):
+    """
+    Send length-prefixed packets, each given as a list of buffers
+
+    On stream connections every header and buffer of every packet goes into
+    one scatter-gather sendmsg call (more only past IOV_MAX buffers or after
+    a partial write), so nothing is joined and back-to-back packets share a
+    system call. Message-oriented connections (UDP) get one message per
+    packet.
+
+    Args:
+        sock: Connected socket or transport connection
+        frames: Sequence of buffer lists, e.g. Packet.to_buffers() results
+    """
+    if getattr(sock, 'message_oriented', False):
+        for buffers in frames:
+            sock.sendmsg([_LENGTH.pack(sum(map(len, buffers))), *buffers])
+        return
+
+    iov = []
+    total = 0
+    for buffers in frames:
+        size = sum(map(len, buffers))
+        total += FRAME_HEADER_SIZE + size
+        iov.append(_LENGTH.pack(size))
+        iov.extend(buffers)
+    sendmsg_all(sock, iov, total)
+
+
+def sendmsg_all(sock, buffers, total=None):
+    """
+    Write every buffer in order, resuming after partial writes
+
+    Falls back to one joined sendall() where sendmsg is unavailable
+    (Windows).
+
+    Args:
+        sock: Connected stream socket or transport connection
+        buffers: List of bytes-like objects
+        total: Their combined length, if already known
+    """
+    sendmsg = getattr(sock, 'sendmsg', None)
+    if sendmsg is None:
+        sock.sendall(b''.join(buffers))
+        return
+
+    count = len(buffers)
+    if count <= _IOV_MAX:
+        # Common case: everything goes out in one call
+        sent = sendmsg(buffers)
+        if sent == (total if total is not None else sum(map(len, buffers))):
+            return
+    else:
+        sent = sendmsg(buffers[:_IOV_MAX])
+
+    buffers = list(buffers)
+    start = 0
+    while True:
+        while start < count and sent >= len(buffers[start]):
+            sent -= len(buffers[start])
+            start += 1
+        if start == count:
+            return
+        if sent:
+            buffers[start] = memoryview(buffers[start])[sent:]
+        sent = sendmsg(buffers[start:start + _IOV_MAX])
+
+
+class FrameReader:
+    """
+    Reads length-prefixed packets from a stream socket
+
+    Bytes are received with recv_into straight into one preallocated
+    bytearray that is reused for the life of the connection: frames are
+    consumed from the front, and the unread tail is moved back to the start
+    only when the free space at the end runs out. The buffer grows (and
+    stays grown) only when a single frame is larger than its capacity.
+    """
+
+    def __init__(self, sock, capacity=None, max_frame_size=None):
+        """
+        Initialize reader
+
+        Args:
+            sock: Connected stream socket
+            capacity: Initial buffer size in bytes (default: config.BUFFER_SIZE)
+            max_frame_size: Largest accepted frame (default: config.MAX_FRAME_SIZE)
+        """
+        self.sock = sock
+        self.max_frame_size = max_frame_size or config.MAX_FRAME_SIZE
+        self._buffer = bytearray(max(capacity or config.BUFFER_SIZE, FRAME_HEADER_SIZE))
+        self._view = memoryview(self._buffer)
+        self._start = 0  # First unread byte
+        self._end = 0    # One past the last received byte
+        self.recv_calls = 0
+
+    @property
+    def capacity(self):
+        """Current buffer size in bytes"""
+        return len(self._buffer)
+
+    def _make_room(self, needed):
+        """Ensure `needed` bytes fit from the current read position"""
+        unread = self._end - self._start
+        if self._start + needed <= len(self._buffer):
+            return
+
+        if needed > len(self._buffer):
+            size = len(self._buffer)
+            while size < needed:
+                size *= 2
+            self._view.release()
+            buffer = bytearray(size)
+            buffer[:unread] = self._buffer[self._start:self._end]
+            self._buffer = buffer
+            self._view = memoryview(buffer)
+        else:
+            self._buffer[:unread] = self._buffer[self._start:self._end]
+
+        self._start, self._end = 0, unread
+
+    def _fill(self, needed):
+        """
+        Receive until `needed` unread bytes are buffered
+
+        Returns:
+            False on a clean end of stream before any byte of the frame
+        """
+        self._make_room(needed)
+        while self._end - self._start < needed:
+            received = self.sock.recv_into(self._view[self._end:])
+            self.recv_calls += 1
+            if not received:
+                if self._end == self._start:
+                    return False
+                raise ConnectionError("Connection closed in the middle of a frame")
+            self._end += received
+        return True
+
+    def read_frame(self):
+        """
+        Read the next packet
+
+        Returns:
+            memoryview of the payload (valid until the next read_frame call),
+            or None at end of stream
+
+        Raises:
+            ConnectionError: On a truncated or oversized frame
+        """
+        if not self._fill(FRAME_HEADER_SIZE):
+            return None
+
+        (length,) = _LENGTH.unpack_from(self._buffer, self._start)
+        if length > self.max_frame_size:
+            raise ConnectionError(f"Frame of {length} bytes exceeds MAX_FRAME_SIZE")
+
+        if not self._fill(FRAME_HEADER_SIZE + length):
+            raise ConnectionError("Connection closed in the middle of a frame")
+
+        start = self._start + FRAME_HEADER_SIZE
+        self._start = start + length
+        return self._view[start:self._start]
+
+    def __iter__(self):
+        """Yield payloads until the peer closes the connection"""
+        while True:
+            frame = self.read_frame()
+            if frame is None:
+                return
+            yield frame
@@ -0,0 +1,151 @@
+"""
+End-to-end packet tracing across Client 1 -> Server -> Client 2
+Trace metadata travels in the packet header as microsecond timestamps
+"""
+
+import itertools
+import os
+import time
+
+from datacom import config
+from datacom.utils.metrics import Histogram
+
+# Header fields
+TRACE_ID = 'id'
+CREATED = 'tc'   # Client 1: before control info generation
+SENT = 'ts'      # Client 1: just before send
+INGRESS = 'ti'   # Server: packet received
+EGRESS = 'te'    # Server: just before forwarding
+RECEIVED = 'tr'  # Client 2: packet received (local only)
+VERIFIED = 'tv'  # Client 2: verification finished (local only)
+
+# Hop name -> (start field, end field)
+HOPS = {
+    'generate': (CREATED, SENT),
+    'uplink': (SENT, INGRESS),
+    'relay': (INGRESS, EGRESS),
+    'downlink': (EGRESS, RECEIVED),
+    'verify': (RECEIVED, VERIFIED),
+    'total': (CREATED, VERIFIED)
+}
+
+_packet_ids = itertools.count(1)
+
+
+def now_us():
+    """Current wall-clock time in microseconds"""
+    return time.time_ns() // 1000
+
+
+def is_traced(packet):
+    """Check whether a packet carries trace metadata"""
+    return TRACE_ID in packet.headers
+
+
+def start_trace(packet, created_us=None):
+    """
+    Attach a new trace id and creation timestamp to a packet
+
+    Args:
+        packet: Packet object
+        created_us: Creation time in microseconds (default: now)
+    """
+    packet.headers[TRACE_ID] = f"{os.getpid()}.{next(_packet_ids)}"
+    packet.headers[CREATED] = created_us if created_us is not None else now_us()
+
+
+def stamp(packet, field, timestamp_us=None):
+    """
+    Record a timestamp on a traced packet (untraced packets are left alone)
+
+    Args:
+        packet: Packet object
+        field: Header field (SENT, INGRESS, EGRESS)
+        timestamp_us: Time in microseconds (default: now)
+    """
+    if TRACE_ID in packet.headers:
+        packet.headers[field] = timestamp_us if timestamp_us is not None else now_us()
+
+
+class LatencyTracker:
+    """Aggregates per-hop latency distributions from traced packets"""
+
+    def __init__(self, interval=None):
+        """
+        Initialize tracker
+
+        Args:
+            interval: Seconds between printed reports (default: config.TRACE_REPORT_INTERVAL)
+        """
+        self.interval = interval if interval is not None else config.TRACE_REPORT_INTERVAL
+        self.histograms = {hop: Histogram(f"trace_{hop}") for hop in HOPS}
+        self.packets = 0
+        self._last_report = time.monotonic()
+
+    def record(self, packet, received_us, verified_us=None):
+        """
+        Record hop latencies of a traced packet
+
+        Args:
+            packet: Received Packet object
+            received_us: Time Client 2 received the packet (microseconds)
+            verified_us: Time verification finished (microseconds)
+
+        Returns:
+            dict mapping hop name to latency in microseconds (missing hops omitted)
+        """
+        if not is_traced(packet):
+            return {}
+
+        times = {}
+        for field in (CREATED, SENT, INGRESS, EGRESS):
+            try:
+                times[field] = int(packet.headers[field])
+            except (KeyError, ValueError):
+                pass
+        times[RECEIVED] = received_us
+        if verified_us is not None:
+            times[VERIFIED] = verified_us
+
+        latencies = {}
+        for hop, (start, end) in HOPS.items():
+            if start in times and end in times:
+                latency = max(times[end] - times[start], 0)
+                latencies[hop] = latency
+                self.histograms[hop].record(latency * 1000)
+
+        self.packets += 1
+        return latencies
+
+    def summary(self):
+        """
+        Get per-hop latency summary
+
+        Returns:
+            dict mapping hop name to count and p50/p99/max in microseconds
+        """
+        summary = {}
+        for hop, histogram in self.histograms.items():
+            if histogram.count:
+                summary[hop] = {
+                    'count': histogram.count,
+                    'p50_us': histogram.percentile(50) / 1000,
+                    'p99_us': histogram.percentile(99) / 1000,
+                    'max_us': histogram.max / 1000
+                }
+        return summary
+
+    def format_report(self):
+        """Format per-hop latency table"""
+        lines = [f"Trace latency over {self.packets} packets (us):"]
+        for hop, stats in self.summary().items():
+            lines.append(f"  {hop:<9} p50 {stats['p50_us']:>10.1f}  "
+                         f"p99 {stats['p99_us']:>10.1f}  max {stats['max_us']:>10.1f}")
+        return '\n'.join(lines)
+
+    def maybe_report(self):
+        """Print the report if the interval has elapsed"""
+        now = time.monotonic()
+        if self.packets and now - self._last_report >= self.interval:
+            self._last_report = now
+            print(self.format_report(), flush=True)
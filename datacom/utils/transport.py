@@ -0,0 +1,656 @@
+"""
+Pluggable transports for the relay links
+Client 1 -> Server and Server -> Client 2 can run over TCP (default), Unix
+domain sockets, a shared-memory ring buffer or UDP datagrams, selected with
+config.TRANSPORT. Every transport hands out socket-like connections
+(sendall, close), so send_frame in utils.socket_utils works unchanged on
+top of all of them; frame_reader() gives the matching receive side.
+"""
+
+import os
+import select
+import socket
+import struct
+import sys
+import tempfile
+import threading
+import time
+
+from datacom import config
+from datacom.utils import metrics, socket_utils
+
+TRANSPORTS = ('tcp', 'unix', 'shm', 'udp')
+
+# Shared-memory ring layout: a header of 8-byte slots followed by the data area
+_HEAD, _TAIL, _READER_WAITING, _WRITER_WAITING, _CLOSED = range(5)
+_HEADER_SIZE = 64
+# Busy-poll the ring this long before blocking on the doorbell; never on a
+# single CPU, where polling only delays the peer it is waiting for
+_SPIN_SECONDS = 0.0005 if (os.cpu_count() or 1) > 1 else 0.0
+_WAIT_TIMEOUT = 0.005  # Upper bound on a missed doorbell (seconds)
+_DOORBELL = b'\x01'
+
+# UDP datagram: 4-byte sequence number followed by one length-prefixed frame
+_SEQUENCE = struct.Struct('!I')
+_SEQUENCE_MODULUS = 1 << 32
+MAX_DATAGRAM_SIZE = 65507  # Largest UDP payload over IPv4
+
+
+def _kind(kind):
+    """Resolve and validate a transport name"""
+    kind = (kind or config.TRANSPORT).lower()
+    if kind not in TRANSPORTS:
+        raise ValueError(f"Unknown transport: {kind} (expected one of {', '.join(TRANSPORTS)})")
+    if kind in ('unix', 'shm') and not hasattr(socket, 'AF_UNIX'):
+        raise ValueError(f"The {kind} transport needs Unix domain sockets, which this platform lacks")
+    return kind
+
+
+def endpoint_path(port):
+    """
+    Unix socket path standing in for a TCP port
+
+    Args:
+        port: Configured port number of the link
+
+    Returns:
+        Path inside config.UNIX_SOCKET_DIR (default: the system temp directory)
+    """
+    directory = config.UNIX_SOCKET_DIR or tempfile.gettempdir()
+    return os.path.join(directory, f"datacom-{port}.sock")
+
+
+def create_listener(host, port, kind=None):
+    """
+    Create a listening endpoint for one relay link
+
+    Args:
+        host: Interface to bind (TCP only)
+        port: Link port; names the socket file for the unix and shm transports
+        kind: 'tcp', 'unix' or 'shm' (default: config.TRANSPORT)
+
+    Returns:
+        Object with accept() -> (connection, address) and close()
+    """
+    kind = _kind(kind)
+    if kind == 'tcp':
+        return socket_utils.create_listener(host, port)
+    if kind == 'udp':
+        return DatagramListener(host, port)
+    if kind == 'unix':
+        return UnixListener(endpoint_path(port))
+    return ShmListener(endpoint_path(port))
+
+
+def connect(host, port, kind=None):
+    """
+    Connect to a relay link
+
+    Args:
+        host: Remote host (TCP only)
+        port: Link port
+        kind: 'tcp', 'unix' or 'shm' (default: config.TRANSPORT)
+
+    Returns:
+        Connected socket-like object
+    """
+    kind = _kind(kind)
+    if kind == 'tcp':
+        return socket_utils.connect(host, port)
+    if kind == 'udp':
+        return DatagramConnection(host, port)
+
+    sock = _unix_connect(endpoint_path(port))
+    if kind == 'unix':
+        return sock
+    try:
+        return ShmConnection.create(sock)
+    except BaseException:
+        sock.close()
+        raise
+
+
+def frame_reader(conn):
+    """
+    Frame reader for a connection returned by a listener's accept()
+
+    Returns:
+        Object with read_frame() and iteration over payloads
+    """
+    if isinstance(conn, DatagramReader):
+        return conn
+    return socket_utils.FrameReader(conn)
+
+
+def _unix_connect(path):
+    """Open a tuned Unix stream connection"""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        socket_utils.tune_socket(sock)
+        sock.connect(path)
+    except BaseException:
+        sock.close()
+        raise
+    return sock
+
+
+class UnixListener:
+    """Listening Unix domain socket that removes its file on close"""
+
+    def __init__(self, path):
+        """
+        Bind and listen
+
+        Args:
+            path: Socket file path (a stale file from a previous run is replaced)
+        """
+        self.path = path
+        if os.path.exists(path):
+            os.unlink(path)
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        socket_utils.tune_socket(self.sock)
+        self.sock.bind(path)
+        self.sock.listen(config.LISTEN_BACKLOG)
+
+    def accept(self):
+        """Accept one connection"""
+        conn, _ = self.sock.accept()
+        return conn, self.path
+
+    def close(self):
+        """Close the socket and remove its file"""
+        self.sock.close()
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class ShmListener(UnixListener):
+    """Accepts shared-memory ring connections over a Unix control socket"""
+
+    def accept(self):
+        """Accept one connection and attach to the ring its writer created"""
+        conn, path = super().accept()
+        try:
+            return ShmConnection.attach(conn), path
+        except BaseException:
+            conn.close()
+            raise
+
+
+class ShmConnection:
+    """
+    One-way byte stream through a multiprocessing.shared_memory ring buffer
+
+    The connecting side creates the segment and writes; the accepting side
+    attaches and reads, which matches how every relay link is used. Head and
+    tail are free-running byte counters stored in aligned 8-byte header
+    slots, each written by one side only, so no lock is needed. A side that
+    finds the ring empty (or full) polls briefly, then raises its waiting
+    flag and sleeps on the Unix control socket until the peer rings the
+    doorbell; a short timeout bounds the cost of a doorbell missed between
+    the flag check and the sleep.
+    """
+
+    def __init__(self, shm, capacity, control, writer):
+        """
+        Wrap an attached segment
+
+        Args:
+            shm: SharedMemory holding the header and ring
+            capacity: Ring data size in bytes
+            control: Connected Unix socket used for the handshake and doorbells
+            writer: True on the sending side
+        """
+        self._shm = shm
+        self._slots = shm.buf[:_HEADER_SIZE].cast('Q')
+        self._ring = shm.buf[_HEADER_SIZE:_HEADER_SIZE + capacity]
+        self.capacity = capacity
+        self.control = control
+        self.writer = writer
+        self._peer_closed = False
+        control.setblocking(False)
+
+    @classmethod
+    def create(cls, control):
+        """
+        Writer side of the handshake: create the segment and pass its name
+
+        The segment is unlinked as soon as the reader has attached, so it
+        cannot leak if either process dies.
+        """
+        from multiprocessing import resource_tracker, shared_memory
+
+        capacity = config.SHM_RING_SIZE
+        shm = shared_memory.SharedMemory(create=True, size=_HEADER_SIZE + capacity)
+        try:
+            socket_utils.send_frame(control, f"{shm.name} {capacity}".encode())
+            if control.recv(1) != _DOORBELL:
+                raise ConnectionError("Shared-memory handshake failed")
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+        # The reader dropped the tracker entry (see attach); re-add it so
+        # unlink() can remove it whether or not both share one tracker
+        resource_tracker.register(shm._name, 'shared_memory')
+        shm.unlink()
+        return cls(shm, capacity, control, writer=True)
+
+    @classmethod
+    def attach(cls, control):
+        """Reader side of the handshake: attach to the writer's segment"""
+        from multiprocessing import resource_tracker, shared_memory
+
+        hello = socket_utils.FrameReader(control, capacity=256, max_frame_size=256).read_frame()
+        if hello is None:
+            raise ConnectionError("Shared-memory handshake failed")
+        name, capacity = str(hello, 'ascii').split()
+
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            # Before 3.13 attaching registers the segment with this process's
+            # resource tracker, which would unlink it again at exit; the
+            # writer owns it
+            shm = shared_memory.SharedMemory(name=name)
+            resource_tracker.unregister(shm._name, 'shared_memory')
+
+        control.sendall(_DOORBELL)
+        return cls(shm, int(capacity), control, writer=False)
+
+    def _ring_doorbell(self, flag):
+        """Wake the peer once if it is sleeping on `flag`"""
+        if not self._slots[flag]:
+            return
+        # Clearing the flag keeps a burst of writes to one wakeup
+        self._slots[flag] = 0
+        try:
+            self.control.send(_DOORBELL)
+        except (BlockingIOError, InterruptedError):
+            pass  # A doorbell is already pending
+        except OSError:
+            self._peer_closed = True
+
+    def _drain_doorbell(self):
+        """Consume pending doorbells and notice a closed peer"""
+        try:
+            while True:
+                data = self.control.recv(64)
+                if not data:
+                    self._peer_closed = True
+                    return
+                if len(data) < 64:
+                    return
+        except (BlockingIOError, InterruptedError):
+            pass
+        except OSError:
+            self._peer_closed = True
+
+    def _wait(self, ready, flag):
+        """Poll, then sleep on the doorbell, until ready() or the peer is gone"""
+        deadline = time.perf_counter() + _SPIN_SECONDS
+        while time.perf_counter() < deadline:
+            if ready():
+                return
+        while not ready() and not self._peer_closed:
+            self._slots[flag] = 1
+            if not ready():
+                select.select([self.control], [], [], _WAIT_TIMEOUT)
+                self._drain_doorbell()
+            self._slots[flag] = 0
+
+    def sendall(self, data):
+        """
+        Copy bytes into the ring, waiting for the reader to free space
+
+        Raises:
+            BrokenPipeError: If the reader has gone away
+        """
+        slots, capacity = self._slots, self.capacity
+        view = memoryview(data).cast('B')
+        total = len(view)
+
+        # Fast path: the whole write fits before the end of the ring
+        tail = slots[_TAIL]
+        position = tail % capacity
+        if total <= capacity - (tail - slots[_HEAD]) and position + total <= capacity:
+            self._ring[position:position + total] = view
+            slots[_TAIL] = tail + total
+            if slots[_READER_WAITING]:
+                self._ring_doorbell(_READER_WAITING)
+            return
+
+        ring, offset = self._ring, 0
+
+        while offset < total:
+            tail = slots[_TAIL]
+            free = capacity - (tail - slots[_HEAD])
+            if not free:
+                self._wait(lambda: slots[_TAIL] - slots[_HEAD] < capacity, _WRITER_WAITING)
+                if self._peer_closed:
+                    raise BrokenPipeError("Shared-memory reader closed the connection")
+                continue
+
+            chunk = min(free, total - offset)
+            position = tail % capacity
+            first = min(chunk, capacity - position)
+            ring[position:position + first] = view[offset:offset + first]
+            if chunk > first:
+                ring[:chunk - first] = view[offset + first:offset + chunk]
+            slots[_TAIL] = tail + chunk
+            offset += chunk
+
+            if slots[_READER_WAITING]:
+                self._ring_doorbell(_READER_WAITING)
+
+    def sendmsg(self, buffers):
+        """
+        Copy several buffers into the ring in order (no join)
+
+        Returns:
+            Number of bytes written (always all of them)
+        """
+        for buffer in buffers:
+            self.sendall(buffer)
+        return sum(len(buffer) for buffer in buffers)
+
+    def recv_into(self, buffer):
+        """
+        Copy available bytes out of the ring, waiting for at least one
+
+        Returns:
+            Number of bytes copied; 0 once the writer has closed and the
+            ring is drained
+        """
+        slots, ring, capacity = self._slots, self._ring, self.capacity
+        while True:
+            head = slots[_HEAD]
+            available = slots[_TAIL] - head
+            if available:
+                break
+            if slots[_CLOSED] or self._peer_closed:
+                if slots[_TAIL] == head:
+                    return 0
+                continue  # The last bytes landed just before the close
+            self._wait(lambda: slots[_TAIL] != slots[_HEAD] or slots[_CLOSED], _READER_WAITING)
+
+        size = min(available, len(buffer))
+        position = head % capacity
+        first = min(size, capacity - position)
+        buffer[:first] = ring[position:position + first]
+        if size > first:
+            buffer[first:size] = ring[:size - first]
+        slots[_HEAD] = head + size
+
+        if slots[_WRITER_WAITING]:
+            self._ring_doorbell(_WRITER_WAITING)
+        return size
+
+    def close(self):
+        """Detach from the ring (the writer marks the stream closed first)"""
+        if self._shm is None:
+            return
+        if self.writer:
+            self._slots[_CLOSED] = 1
+            self._ring_doorbell(_READER_WAITING)
+        self._slots.release()
+        self._ring.release()
+        self._shm.close()
+        self._shm = None
+        self.control.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class SequenceTracker:
+    """
+    Loss, reordering and duplicate accounting from per-sender sequence numbers
+
+    Sequence numbers are 32-bit and compared with serial-number arithmetic,
+    so wraparound is handled. A gap counts its missing numbers as lost; when
+    one of them turns up later it is moved from lost to reordered. Anything
+    else at or behind the highest number seen is a duplicate.
+    """
+
+    def __init__(self, window=None):
+        """
+        Initialize tracker
+
+        Args:
+            window: Missing numbers remembered per sender for reorder detection
+                    (default: config.UDP_REORDER_WINDOW)
+        """
+        self.window = window or config.UDP_REORDER_WINDOW
+        self.received = 0
+        self.lost = 0
+        self.reordered = 0
+        self.duplicates = 0
+        self._senders = {}  # address -> (highest sequence, set of missing sequences)
+
+    def record(self, sender, sequence):
+        """
+        Account for one datagram
+
+        Args:
+            sender: Source address
+            sequence: Sequence number carried by the datagram
+
+        Returns:
+            'new', 'reordered' or 'duplicate'
+        """
+        self.received += 1
+        state = self._senders.get(sender)
+        if state is None:
+            self._senders[sender] = (sequence, set())
+            return 'new'
+
+        highest, missing = state
+        ahead = (sequence - highest) % _SEQUENCE_MODULUS
+        if 0 < ahead < _SEQUENCE_MODULUS // 2:
+            gap = ahead - 1
+            if gap:
+                self.lost += gap
+                metrics.REGISTRY.counter('udp_datagrams_lost').inc(gap)
+                if gap <= self.window:
+                    missing.update((highest + offset) % _SEQUENCE_MODULUS for offset in range(1, ahead))
+                    while len(missing) > self.window:
+                        missing.remove(min(missing, key=lambda old: (old - sequence) % _SEQUENCE_MODULUS))
+            self._senders[sender] = (sequence, missing)
+            return 'new'
+
+        if sequence in missing:
+            missing.discard(sequence)
+            self.lost -= 1
+            self.reordered += 1
+            metrics.REGISTRY.counter('udp_datagrams_lost').inc(-1)
+            metrics.REGISTRY.counter('udp_datagrams_reordered').inc()
+            return 'reordered'
+
+        self.duplicates += 1
+        metrics.REGISTRY.counter('udp_datagrams_duplicate').inc()
+        return 'duplicate'
+
+    def format_report(self):
+        """Format totals as one line"""
+        expected = self.received - self.duplicates + self.lost
+        loss = self.lost / expected * 100 if expected else 0.0
+        return (f"Datagrams received {self.received}  lost {self.lost} ({loss:.2f}%)  "
+                f"reordered {self.reordered}  duplicate {self.duplicates}")
+
+
+class DatagramConnection:
+    """Sends each frame as one UDP datagram tagged with a sequence number"""
+
+    message_oriented = True  # send_frames() must not coalesce packets
+
+    def __init__(self, host, port):
+        """
+        Open a connected UDP socket
+
+        Args:
+            host: Receiver host
+            port: Receiver port
+        """
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        socket_utils.tune_socket(self.sock)
+        self.sock.connect((host, port))
+        self.sequence = 0
+
+    def sendmsg(self, buffers):
+        """
+        Send one complete frame, given as buffers, in one datagram
+
+        Delivery is not confirmed: a datagram refused or dropped on the way
+        shows up as a sequence gap at the receiver.
+
+        Returns:
+            Number of frame bytes sent
+
+        Raises:
+            ValueError: If the frame does not fit in a datagram
+        """
+        size = sum(len(buffer) for buffer in buffers)
+        if _SEQUENCE.size + size > MAX_DATAGRAM_SIZE:
+            raise ValueError(f"Packet of {size} bytes does not fit in a UDP datagram")
+        header = _SEQUENCE.pack(self.sequence)
+        self.sequence = (self.sequence + 1) % _SEQUENCE_MODULUS
+        try:
+            if hasattr(self.sock, 'sendmsg'):
+                self.sock.sendmsg([header, *buffers])
+            else:
+                self.sock.send(header + b''.join(buffers))
+        except ConnectionRefusedError:
+            pass  # ICMP port unreachable from an earlier datagram
+        return size
+
+    def sendall(self, frame):
+        """Send one complete frame in one datagram"""
+        self.sendmsg([frame])
+
+    def close(self):
+        """Close the socket"""
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class DatagramReader:
+    """
+    Receives framed packets from UDP datagrams of any number of senders
+
+    Each datagram is read with recv_from_into into one reusable buffer and
+    must hold exactly one frame; truncated or padded datagrams are counted
+    as malformed and skipped rather than ending the stream.
+    """
+
+    def __init__(self, sock, closed=None):
+        """
+        Initialize reader
+
+        Args:
+            sock: Bound UDP socket
+            closed: Event set when the owning listener is closed
+        """
+        self.sock = sock
+        self.sequence = SequenceTracker()
+        self.malformed = 0
+        self._buffer = bytearray(MAX_DATAGRAM_SIZE + 1)
+        self._view = memoryview(self._buffer)
+        self._closed = closed or threading.Event()
+
+    def read_frame(self):
+        """
+        Read the next packet
+
+        Returns:
+            memoryview of the payload (valid until the next read_frame call),
+            or None once the listener is closed
+        """
+        header = _SEQUENCE.size + socket_utils.FRAME_HEADER_SIZE
+        while True:
+            try:
+                size, sender = self.sock.recvfrom_into(self._buffer)
+            except OSError:
+                if self._closed.is_set():
+                    return None
+                raise
+            if self._closed.is_set():
+                return None
+
+            if size >= header:
+                sequence, length = struct.unpack_from('!II', self._buffer)
+                if size == header + length:
+                    if self.sequence.record(sender, sequence) != 'duplicate':
+                        return self._view[header:size]
+                    continue
+
+            self.malformed += 1
+            metrics.REGISTRY.counter('udp_datagrams_malformed').inc()
+
+    def __iter__(self):
+        """Yield payloads until the listener is closed"""
+        while True:
+            frame = self.read_frame()
+            if frame is None:
+                return
+            yield frame
+
+    def close(self):
+        """Stop reading (the socket belongs to the listener)"""
+        self._closed.set()
+
+
+class DatagramListener:
+    """
+    Bound UDP socket presented as a listener
+
+    UDP has no connections, so the first accept() returns one reader for
+    every sender and later calls wait until the listener is closed.
+    """
+
+    def __init__(self, host, port):
+        """
+        Bind the socket
+
+        Args:
+            host: Interface to bind
+            port: Port to bind
+        """
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        socket_utils.tune_socket(self.sock)
+        self.sock.bind((host, port))
+        self._accepted = False
+        self._closed = threading.Event()
+
+    def accept(self):
+        """
+        Get the reader for all senders
+
+        Raises:
+            OSError: Once the listener is closed
+        """
+        if not self._accepted and not self._closed.is_set():
+            self._accepted = True
+            return DatagramReader(self.sock, self._closed), self.sock.getsockname()
+        self._closed.wait()
+        raise OSError("Listener closed")
+
+    def close(self):
+        """Close the socket, ending the reader and any waiting accept()"""
+        self._closed.set()
+        try:
+            # Wake a thread blocked in recvfrom_into before closing
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
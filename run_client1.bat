@@ -1,5 +1,5 @@
 @echo off
 echo Starting Client 1 (Sender)...
 call venv\Scripts\activate.bat
-python client1\client1.py
+python -m datacom.client1.client1
 pause
@@ -1,5 +1,5 @@
 @echo off
 echo Starting Client 2 (Receiver)...
 call venv\Scripts\activate.bat
-python client2\client2.py
+python -m datacom.client2.client2
 pause
@@ -1,5 +1,5 @@
 @echo off
 echo Starting Server...
 call venv\Scripts\activate.bat
-python server\server.py
+python -m datacom.server.server
 pause
@@ -28,6 +28,10 @@ echo.
 echo Installing dependencies from requirements.txt...
 pip install -r requirements.txt
 
+echo.
+echo Installing the project (console scripts)...
+pip install -e .
+
 echo.
 echo ================================================
 echo Setup Complete!
@@ -37,8 +41,8 @@ echo To activate the virtual environment, run:
 echo   venv\Scripts\activate.bat
 echo.
 echo To run the project:
-echo   1. Start Server: python server\server.py
-echo   2. Start Client 2 (Receiver): python client2\client2.py
-echo   3. Start Client 1 (Sender): python client1\client1.py
+echo   1. Start Server: python -m datacom.server.server
+echo   2. Start Client 2 (Receiver): python -m datacom.client2.client2
+echo   3. Start Client 1 (Sender): python -m datacom.client1.client1
 echo.
 pause
@@ -0,0 +1,59 @@
+"""
+Differential tests: every accelerated detector engine against the
+reference classes in utils/error_detection.py
+"""
+
+import random
+
+import pytest
+from datacom.benchmarks.crosscheck import accelerated_engines, generate_inputs, crosscheck, fast_paths_forced
+
+try:
+    from hypothesis import given, settings, strategies as st
+except ImportError:
+    given = None
+
+ENGINES = accelerated_engines()
+ENGINE_IDS = [f"{engine.backend}-{engine.method}" for engine in ENGINES]
+
+
+class TestBackendCrossCheck:
+    """Accelerated engines must match the reference implementations bit-for-bit"""
+    
+    @pytest.mark.parametrize('engine', ENGINES, ids=ENGINE_IDS)
+    def test_seeded_inputs(self, engine):
+        """Test edge cases and seeded random inputs"""
+        inputs = generate_inputs(random.Random(2024), count=20, max_length=96)
+        result = crosscheck(engine, inputs)
+        
+        assert result['cases'] >= len(inputs)
+        assert result['mismatches'] == []
+    
+    @pytest.mark.parametrize('engine', ENGINES, ids=ENGINE_IDS)
+    def test_large_input(self, engine):
+        """Test one multi-kilobyte input"""
+        inputs = generate_inputs(random.Random(5), count=0, huge_size=2048)[-1:]
+        assert crosscheck(engine, inputs)['mismatches'] == []
+    
+    def test_cache_engines_cover_every_method(self):
+        """Test every built-in method has at least one engine checked"""
+        methods = {engine.method for engine in ENGINES if engine.backend == 'cache'}
+        assert {'PARITY', 'CRC', 'HAMMING', 'CRC32C'} <= methods
+
+
+@pytest.mark.skipif(given is None, reason="hypothesis not installed")
+class TestBackendProperties:
+    """Property-based differential checks (requires hypothesis)"""
+    
+    if given is not None:
+        @pytest.mark.parametrize('engine', ENGINES, ids=ENGINE_IDS)
+        @settings(max_examples=40, deadline=None)
+        @given(data=st.text(st.characters(blacklist_categories=('Cs',)), max_size=128))
+        def test_generate_matches_reference(self, engine, data):
+            """Test generate() agrees with the reference on arbitrary text"""
+            with fast_paths_forced():
+                assert engine.fast.generate(data) == engine.reference.generate(data)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
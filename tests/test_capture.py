@@ -0,0 +1,118 @@
+"""
+Test cases for relay traffic capture and replay
+"""
+
+import os
+
+import pytest
+from datacom.utils.capture import CaptureWriter, CaptureReader, PRE_CORRUPTION, POST_CORRUPTION
+from datacom.utils.error_detection import CRC
+from datacom.utils.packet_handler import Packet
+from datacom.tools.replay_capture import replay_to_detectors
+
+
+def _packet_bytes(data, corrupt=False):
+    """Build a CRC packet, optionally corrupting the data after generation"""
+    control_info = CRC.generate(data)
+    if corrupt:
+        data = data[:-1] + chr(ord(data[-1]) ^ 1)
+    return Packet(data, "CRC", control_info).to_string().encode('utf-8')
+
+
+class TestCapture:
+    """Test cases for capture files"""
+    
+    def test_round_trip(self, tmp_path):
+        """Test records are read back in order with kind and timestamp"""
+        path = str(tmp_path / "relay.cap")
+        writer = CaptureWriter(path)
+        writer.write(PRE_CORRUPTION, b"first", 10)
+        writer.write(POST_CORRUPTION, b"", 20)
+        writer.write(POST_CORRUPTION, "Héllo".encode('utf-8'), 30)
+        writer.close()
+        
+        with CaptureReader(path) as reader:
+            records = [(kind, ts, bytes(payload)) for kind, ts, payload in reader]
+        
+        assert records == [
+            (PRE_CORRUPTION, 10, b"first"),
+            (POST_CORRUPTION, 20, b""),
+            (POST_CORRUPTION, 30, "Héllo".encode('utf-8'))
+        ]
+    
+    def test_write_buffers(self, tmp_path):
+        """Test a payload given as a list of buffers is stored as one record"""
+        path = str(tmp_path / "relay.cap")
+        writer = CaptureWriter(path)
+        writer.write(POST_CORRUPTION, [b"Hello", b"|CRC|1010"], 5)
+        writer.close()
+        
+        with CaptureReader(path) as reader:
+            assert [(kind, ts, bytes(p)) for kind, ts, p in reader] == [
+                (POST_CORRUPTION, 5, b"Hello|CRC|1010")]
+    
+    def test_append_keeps_single_header(self, tmp_path):
+        """Test reopening a capture appends records instead of a second header"""
+        path = str(tmp_path / "relay.cap")
+        for payload in (b"one", b"two"):
+            writer = CaptureWriter(path)
+            writer.write(PRE_CORRUPTION, payload, 1)
+            writer.close()
+        
+        with CaptureReader(path) as reader:
+            assert [bytes(p) for _, _, p in reader] == [b"one", b"two"]
+    
+    def test_filter_by_kind(self, tmp_path):
+        """Test records() yields only the requested kind"""
+        path = str(tmp_path / "relay.cap")
+        writer = CaptureWriter(path)
+        for i in range(4):
+            writer.write(i % 2, str(i).encode(), i)
+        writer.close()
+        
+        with CaptureReader(path) as reader:
+            assert [ts for _, ts, _ in reader.records(POST_CORRUPTION)] == [1, 3]
+    
+    def test_truncated_record_ignored(self, tmp_path):
+        """Test a partially written final record is skipped"""
+        path = str(tmp_path / "relay.cap")
+        writer = CaptureWriter(path)
+        writer.write(PRE_CORRUPTION, b"complete", 1)
+        writer.write(PRE_CORRUPTION, b"truncated", 2)
+        writer.close()
+        
+        with open(path, 'r+b') as f:
+            f.truncate(os.path.getsize(path) - 3)
+        
+        with CaptureReader(path) as reader:
+            assert [bytes(p) for _, _, p in reader] == [b"complete"]
+    
+    def test_rejects_foreign_file(self, tmp_path):
+        """Test files without the capture header are rejected"""
+        path = tmp_path / "other.bin"
+        path.write_bytes(b"not a capture file")
+        
+        with pytest.raises(ValueError):
+            CaptureReader(str(path))
+    
+    def test_replay_to_detectors(self, tmp_path):
+        """Test replaying a capture through the detectors"""
+        path = str(tmp_path / "relay.cap")
+        writer = CaptureWriter(path)
+        writer.write(POST_CORRUPTION, _packet_bytes("Hello"), 1)
+        writer.write(POST_CORRUPTION, _packet_bytes("World", corrupt=True), 2)
+        writer.write(POST_CORRUPTION, b"garbage", 3)
+        writer.write(PRE_CORRUPTION, _packet_bytes("Ignored"), 4)
+        writer.close()
+        
+        with CaptureReader(path) as reader:
+            stats = replay_to_detectors(reader, POST_CORRUPTION)
+        
+        assert stats['packets'] == 3
+        assert stats['valid'] == 1
+        assert stats['corrupted'] == 1
+        assert stats['malformed'] == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,101 @@
+"""
+Test cases for payload compression
+"""
+
+import os
+
+import pytest
+from datacom import config
+from datacom.utils import compression
+from datacom.utils.error_detection import CRC
+from datacom.utils.packet_handler import create_packet, parse_packet
+
+TEXT = "The quick brown fox jumps over the lazy dog. " * 100
+
+
+class TestCompression:
+    """Test cases for compress/decompress"""
+    
+    @pytest.mark.parametrize('codec', compression.CODECS)
+    def test_round_trip(self, codec):
+        """Test compressed payloads are smaller, delimiter-free and restore exactly"""
+        data = TEXT + "ünïcødé ✓"
+        
+        wire, used = compression.compress(data, codec, threshold=0)
+        
+        assert used == codec
+        assert len(wire) < len(data) // 4
+        assert config.PACKET_DELIMITER not in wire
+        assert compression.decompress(wire, codec) == data
+    
+    def test_below_threshold_untouched(self):
+        """Test short payloads are sent as-is"""
+        assert compression.compress("short", 'zlib', threshold=1024) == ("short", None)
+    
+    def test_disabled(self, monkeypatch):
+        """Test COMPRESSION='none' leaves every payload alone"""
+        monkeypatch.setattr(config, 'COMPRESSION', 'none')
+        assert compression.compress(TEXT) == (TEXT, None)
+    
+    def test_incompressible_untouched(self):
+        """Test data that would grow (after base64) is sent uncompressed"""
+        data = ''.join(chr(33 + byte % 90) for byte in os.urandom(3000))
+        
+        assert compression.compress(data, 'zlib', threshold=0) == (data, None)
+    
+    @pytest.mark.parametrize('codec', compression.CODECS)
+    def test_corruption_raises(self, codec):
+        """Test a damaged compressed payload raises ValueError instead of returning garbage"""
+        wire, _ = compression.compress(TEXT, codec, threshold=0)
+        
+        with pytest.raises(ValueError):
+            compression.decompress(wire[:len(wire) // 2], codec)
+        with pytest.raises(ValueError):
+            compression.decompress(wire[:10] + "|" + wire[11:], codec)
+    
+    def test_size_limit(self):
+        """Test decompression stops at max_size"""
+        wire, _ = compression.compress("x" * 100000, 'zlib', threshold=0)
+        
+        with pytest.raises(ValueError):
+            compression.decompress(wire, 'zlib', max_size=1000)
+    
+    def test_unknown_codec(self):
+        """Test an unknown codec in the header is rejected"""
+        with pytest.raises(ValueError):
+            compression.decompress("AAAA", 'brotli')
+
+
+class TestCompressedPackets:
+    """Test cases for compressed packets end to end"""
+    
+    def test_header_flag_round_trip(self):
+        """Test the codec header survives serialization and restores the payload"""
+        wire, codec = compression.compress(TEXT, 'lzma', threshold=0)
+        packet = create_packet(wire, 'CRC', CRC.generate(wire), compression.headers_for(codec))
+        
+        received = parse_packet(packet.to_string())
+        
+        assert received.headers[compression.HEADER] == 'lzma'
+        assert CRC.verify(received.data, received.control_info)
+        assert compression.packet_payload(received) == TEXT
+    
+    def test_uncompressed_packet_payload(self):
+        """Test packets without the header are returned unchanged"""
+        packet = create_packet("plain", 'CRC', CRC.generate("plain"), compression.headers_for(None))
+        
+        assert packet.headers == {}
+        assert compression.packet_payload(packet) == "plain"
+    
+    def test_control_info_covers_compressed_bytes(self):
+        """Test corruption of the compressed form is caught by the detector"""
+        wire, _ = compression.compress(TEXT, 'zlib', threshold=0)
+        control_info = CRC.generate(wire)
+        corrupted = wire[:5] + ('A' if wire[5] != 'A' else 'B') + wire[6:]
+        
+        assert CRC.verify(wire, control_info)
+        assert not CRC.verify(corrupted, control_info)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
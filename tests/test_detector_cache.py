@@ -0,0 +1,109 @@
+"""
+Test cases for the control info cache
+"""
+
+import argparse
+
+import pytest
+from datacom import config
+from datacom.client2.client2 import Client2
+from datacom.utils import settings
+from datacom.utils.error_detection import CRC, HammingCode
+from datacom.utils.detector_cache import CACHE, ControlInfoCache, get_cached_detector
+
+
+class TestControlInfoCache:
+    """Test cases for ControlInfoCache"""
+    
+    def test_repeated_payload_hits(self):
+        """Test repeated payloads are served from the cache"""
+        cache = ControlInfoCache(max_entries=8, max_bytes=4096)
+        detector = get_cached_detector('CRC', cache)
+        
+        first = detector.generate("heartbeat")
+        second = detector.generate("heartbeat")
+        
+        assert first == second == CRC.generate("heartbeat")
+        assert cache.hits == 1
+        assert cache.misses == 1
+    
+    def test_verify_matches_detector(self):
+        """Test cached verify agrees with the wrapped detector"""
+        detector = get_cached_detector('hamming', ControlInfoCache())
+        parity = HammingCode.generate("Test")
+        assert detector.verify("Test", parity) == True
+        assert detector.verify("Best", parity) == False
+    
+    def test_polynomial_is_part_of_key(self):
+        """Test different CRC polynomials are cached separately"""
+        cache = ControlInfoCache()
+        detector = get_cached_detector('CRC', cache)
+        crc8 = detector.generate("Network")
+        crc16 = detector.generate("Network", 0x11021)
+        assert crc8 != crc16
+        assert crc16 == CRC.generate("Network", 0x11021)
+    
+    def test_lru_eviction_by_entries(self):
+        """Test least recently used entry is evicted first"""
+        cache = ControlInfoCache(max_entries=2, max_bytes=4096)
+        detector = get_cached_detector('PARITY', cache)
+        detector.generate("a")
+        detector.generate("b")
+        detector.generate("a")
+        detector.generate("c")
+        
+        assert len(cache) == 2
+        assert cache.evictions == 1
+        assert cache.get(cache.make_key('PARITY', None, "b")) is None
+        assert cache.get(cache.make_key('PARITY', None, "a")) is not None
+    
+    def test_byte_limit(self):
+        """Test byte limit bounds cache memory"""
+        cache = ControlInfoCache(max_entries=100, max_bytes=300, small_payload=1000)
+        detector = get_cached_detector('PARITY', cache)
+        for i in range(10):
+            detector.generate(str(i) * 50)
+        assert cache.current_bytes <= 300
+        assert cache.evictions > 0
+    
+    def test_large_payload_keyed_by_digest(self):
+        """Test large payloads use a fixed-size digest key"""
+        cache = ControlInfoCache(small_payload=4)
+        key = cache.make_key('CRC', None, "x" * 1000)
+        assert len(key[-1]) == 16
+    
+    def test_limits_follow_configure(self, monkeypatch):
+        """Test settings applied after import change the shared cache's limits"""
+        for name in ('DETECTOR_CACHE_MAX_ENTRIES', 'DETECTOR_CACHE_MAX_BYTES'):
+            monkeypatch.setattr(config, name, getattr(config, name))
+        parser = argparse.ArgumentParser()
+        settings.add_arguments(parser)
+        args = parser.parse_args(['--set', 'DETECTOR_CACHE_MAX_ENTRIES=10',
+                                  '--set', 'DETECTOR_CACHE_MAX_BYTES=100'])
+        monkeypatch.setattr(settings.os, 'environ', {})
+        
+        settings.configure(args)
+        
+        assert CACHE.max_entries == 10
+        assert CACHE.max_bytes == 100
+        cache = ControlInfoCache()
+        detector = get_cached_detector('PARITY', cache)
+        for i in range(20):
+            detector.generate(str(i))
+        assert cache.current_bytes <= 100
+        assert cache.evictions > 0
+    
+    def test_client2_one_lookup_per_packet(self, monkeypatch):
+        """Test Client 2 verifies each packet with a single cache lookup"""
+        monkeypatch.setattr(config, 'DETECTOR_CACHE_ENABLED', True)
+        CACHE.clear()
+        client = Client2()
+        crc = CRC.generate("payload")
+        
+        assert client.verify_data("payload", 'CRC', crc)[1] == True
+        assert client.verify_data("payloaf", 'CRC', crc)[1] == False
+        assert CACHE.hits + CACHE.misses == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
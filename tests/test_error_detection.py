@@ -2,15 +2,12 @@
 Test cases for error detection methods
 """
 
-import sys
-import os
-
-# Add parent directory to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 import pytest
-from utils.error_detection import (
-    ParityBit, TwoDParity, CRC, HammingCode, InternetChecksum
+from datacom.utils.error_detection import (
+    ParityBit, TwoDParity, CRC, HammingCode, InternetChecksum,
+    Fletcher16, Fletcher32, Adler32, CRC32C,
+    get_error_detector, get_detector_id, get_detector_by_id, register_detector,
+    DETECTOR_IDS, DETECTORS
 )
 
 
@@ -140,5 +137,80 @@ class TestInternetChecksum:
         assert InternetChecksum.verify(corrupted, checksum) == False
 
 
+class TestFastChecksums:
+    """Test cases for Fletcher, Adler-32 and CRC-32C against reference vectors"""
+    
+    def test_fletcher16(self):
+        """Test Fletcher-16 reference values"""
+        assert Fletcher16.generate("abcde") == "c8f0"
+        assert Fletcher16.generate("abcdef") == "2057"
+    
+    def test_fletcher32(self):
+        """Test Fletcher-32 reference values (odd length is zero padded)"""
+        assert Fletcher32.generate("abcde") == "f04fc729"
+        assert Fletcher32.generate("abcdef") == "56502d2a"
+        assert Fletcher32.generate("abcdefgh") == "ebe19591"
+    
+    def test_adler32(self):
+        """Test Adler-32 reference value"""
+        assert Adler32.generate("Wikipedia") == "11e60398"
+    
+    def test_crc32c(self):
+        """Test CRC-32C check value"""
+        assert CRC32C.generate("123456789") == "e3069283"
+    
+    def test_detect_corruption(self):
+        """Test each checksum detects a substituted character"""
+        for detector in (Fletcher16, Fletcher32, Adler32, CRC32C):
+            control_info = detector.generate("Network")
+            assert detector.verify("Network", control_info) == True
+            assert detector.verify("Netwark", control_info) == False
+    
+    def test_registered_methods(self):
+        """Test new methods are selectable by name"""
+        assert get_error_detector('FLETCHER16') is Fletcher16
+        assert get_error_detector('FLETCHER32') is Fletcher32
+        assert get_error_detector('ADLER32') is Adler32
+        assert issubclass(get_error_detector('CRC32C'), CRC32C)
+
+
+class TestDetectorRegistry:
+    """Test cases for the detector registry"""
+    
+    def test_builtin_ids_resolve(self):
+        """Test built-in methods resolve to stable ids"""
+        detector_id = get_detector_id('CRC')
+        assert issubclass(get_detector_by_id(detector_id), CRC)
+        assert get_detector_id('crc') == detector_id
+        assert issubclass(get_error_detector('2d_parity'), TwoDParity)
+    
+    def test_unknown_method(self):
+        """Test unknown methods resolve to None"""
+        assert get_detector_id('NOT_A_METHOD') is None
+        assert get_error_detector('NOT_A_METHOD') is None
+    
+    def test_register_plugin_detector(self):
+        """Test third-party detectors can register themselves"""
+        class XorChecksum:
+            @staticmethod
+            def generate(data):
+                value = 0
+                for char in data:
+                    value ^= ord(char)
+                return format(value, '02x')
+        
+        try:
+            detector_id = register_detector('xor_test', XorChecksum)
+            assert get_error_detector('XOR_TEST') is XorChecksum
+            assert get_detector_by_id(detector_id) is XorChecksum
+            
+            with pytest.raises(ValueError):
+                register_detector('XOR_TEST', XorChecksum)
+        finally:
+            if DETECTOR_IDS.get('XOR_TEST') == len(DETECTORS) - 1:
+                del DETECTOR_IDS['XOR_TEST']
+                DETECTORS.pop()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
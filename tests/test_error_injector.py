@@ -0,0 +1,153 @@
+"""
+Test cases for error injection methods
+"""
+
+import threading
+
+import pytest
+from datacom import config
+from datacom.server.fault_schedule import InjectionStream, ScheduleReader
+from datacom.server.server import check_fault_stream
+from datacom.utils.settings import ConfigError
+from datacom.server.error_injector import (
+    get_error_injector, get_injector_id, get_injector_by_id,
+    register_injector, INJECTOR_IDS, INJECTORS
+)
+
+
+class TestInjectorRegistry:
+    """Test cases for the injector registry"""
+    
+    def test_all_configured_types_registered(self):
+        """Test every configured injection type resolves"""
+        for injection_type in config.ERROR_INJECTION_TYPES.values():
+            assert get_error_injector(injection_type) is not None
+            assert get_error_injector(injection_type.lower()) is not None
+    
+    def test_dispatch_by_id(self):
+        """Test injectors can be dispatched by integer id"""
+        injector_id = get_injector_id('NO_ERROR')
+        assert get_injector_by_id(injector_id)("Hello") == "Hello"
+    
+    def test_register_plugin_injector(self):
+        """Test third-party injectors can register themselves"""
+        try:
+            register_injector('reverse_test', lambda data: data[::-1])
+            assert get_error_injector('REVERSE_TEST')("abc") == "cba"
+        finally:
+            if INJECTOR_IDS.get('REVERSE_TEST') == len(INJECTORS) - 1:
+                del INJECTOR_IDS['REVERSE_TEST']
+                INJECTORS.pop()
+    
+    def test_unknown_type(self):
+        """Test unknown injection types resolve to None"""
+        assert get_error_injector('NOT_A_TYPE') is None
+
+
+class TestFaultSchedule:
+    """Test cases for seeded, recordable fault injection"""
+    
+    TRAFFIC = ["Hello World", "Network", "heartbeat", "status: OK", "x" * 200]
+    TYPES = [t for t in config.ERROR_INJECTION_TYPES.values()]
+    
+    def corrupt_all(self, stream):
+        """Apply every injection type to every payload"""
+        return [stream.apply(data, injection_type)[0]
+                for data in self.TRAFFIC for injection_type in self.TYPES]
+    
+    def test_same_seed_same_faults(self):
+        """Test streams with equal seeds corrupt identically"""
+        assert self.corrupt_all(InjectionStream(seed=42)) == self.corrupt_all(InjectionStream(seed=42))
+        assert self.corrupt_all(InjectionStream(seed=42)) != self.corrupt_all(InjectionStream(seed=43))
+    
+    def test_record_and_replay(self, tmp_path):
+        """Test a recorded schedule replays exactly"""
+        path = str(tmp_path / 'faults.bin')
+        recorder = InjectionStream(seed=None, record_path=path)
+        recorded = self.corrupt_all(recorder)
+        recorder.close()
+        
+        schedule = ScheduleReader(path)
+        assert len(schedule) == len(self.TRAFFIC) * len(self.TYPES)
+        assert schedule.seed is None
+        
+        replayer = InjectionStream(replay_path=path)
+        replayed = [replayer.apply(data)[0] for data in self.TRAFFIC for _ in self.TYPES]
+        assert replayed == recorded
+    
+    def test_replay_rejects_different_traffic(self, tmp_path):
+        """Test replaying against different payloads fails loudly"""
+        path = str(tmp_path / 'faults.bin')
+        recorder = InjectionStream(seed=1, record_path=path)
+        recorder.apply("Hello", 'BIT_FLIP')
+        recorder.close()
+        
+        with pytest.raises(ValueError):
+            InjectionStream(replay_path=path).apply("Hello World")
+    
+    @pytest.mark.parametrize('mode', ['seed', 'record', 'replay'])
+    def test_reproducible_faults_need_one_worker(self, monkeypatch, tmp_path, mode):
+        """Test seeded, recorded and replayed streams reject several injector workers"""
+        path = str(tmp_path / 'faults.bin')
+        InjectionStream(seed=1, record_path=path).close()
+        stream = {'seed': lambda: InjectionStream(seed=1),
+                  'record': lambda: InjectionStream(record_path=str(tmp_path / 'new.bin')),
+                  'replay': lambda: InjectionStream(replay_path=path)}[mode]()
+        assert stream.deterministic
+        
+        monkeypatch.setattr(config, 'INJECT_WORKERS', 4)
+        with pytest.raises(ConfigError):
+            check_fault_stream(stream)
+        check_fault_stream(InjectionStream())
+        
+        monkeypatch.setattr(config, 'INJECT_WORKERS', 1)
+        check_fault_stream(stream)
+        stream.close()
+    
+    def test_concurrent_records_stay_intact(self, tmp_path):
+        """Test injector threads sharing a stream never mix their draws"""
+        def draw_per_char(data, rng=None):
+            for _ in data:
+                rng.randint(0, len(data) - 1)
+            return data
+        
+        path = str(tmp_path / 'faults.bin')
+        stream = InjectionStream(seed=3, record_path=path)
+        
+        def worker(length):
+            for _ in range(50):
+                stream.apply("x" * length, 'NO_ERROR', draw_per_char)
+        
+        threads = [threading.Thread(target=worker, args=(length,)) for length in (3, 7, 11, 13)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stream.close()
+        
+        events = list(ScheduleReader(path))
+        assert len(events) == 200
+        assert all(len(draws) == length for _, length, draws in events)
+    
+    def test_record_injector_registered_later(self, tmp_path):
+        """Test injectors registered after the schedule was created are recorded"""
+        path = str(tmp_path / 'faults.bin')
+        recorder = InjectionStream(seed=5, record_path=path)
+        try:
+            register_injector('late_test', lambda data, rng=None: data[::-1])
+            recorder.apply("abc", 'BIT_FLIP')
+            recorder.apply("abc", 'LATE_TEST')
+            recorder.close()
+            
+            assert [event[0] for event in ScheduleReader(path)] == ['BIT_FLIP', 'LATE_TEST']
+            replayer = InjectionStream(replay_path=path)
+            replayer.apply("abc")
+            assert replayer.apply("abc") == ("cba", 'LATE_TEST')
+        finally:
+            if INJECTOR_IDS.get('LATE_TEST') == len(INJECTORS) - 1:
+                del INJECTOR_IDS['LATE_TEST']
+                INJECTORS.pop()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
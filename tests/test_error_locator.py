@@ -0,0 +1,126 @@
+"""
+Test cases for 2D parity and Hamming error localization
+"""
+
+import pytest
+from datacom import config
+from datacom.utils.error_detection import TwoDParity, HammingCode, CRC
+from datacom.utils.error_locator import locate_errors, locate_2d_parity, locate_hamming
+
+
+def flip_bit(data, position):
+    """Flip one bit of the string_to_binary() form"""
+    index, bit = divmod(position, 8)
+    return data[:index] + chr(ord(data[index]) ^ (0x80 >> bit)) + data[index + 1:]
+
+
+class TestTwoDParityLocation:
+    """Test cases for 2D parity localization"""
+    
+    @pytest.mark.parametrize('position', [0, 7, 13, 31])
+    def test_single_bit_located_and_corrected(self, position):
+        """Test one flipped bit is pinned to one position and repaired"""
+        data = "Hello World"
+        parity = TwoDParity.generate(data)
+        corrupted = flip_bit(data, position)
+        
+        location = locate_2d_parity(corrupted, parity, TwoDParity.generate(corrupted))
+        
+        assert location.bit_positions == [position]
+        assert location.byte_positions == [position // 8]
+        assert location.rows == [position // config.PARITY_MATRIX_COLS]
+        assert location.cols == [position % config.PARITY_MATRIX_COLS]
+        assert location.correct(corrupted) == data
+    
+    def test_two_bits_in_one_row(self):
+        """Test errors that cancel in the row parity leave every row as a candidate"""
+        data = "Hello World"
+        parity = TwoDParity.generate(data)
+        corrupted = flip_bit(flip_bit(data, 9), 12)
+        
+        location = locate_2d_parity(corrupted, parity, TwoDParity.generate(corrupted))
+        
+        assert location.rows == []
+        assert location.cols == [1, 4]
+        assert 9 in location.bit_positions and 12 in location.bit_positions
+        assert len(location.bit_positions) == 2 * config.PARITY_MATRIX_ROWS
+        assert not location.correctable
+        assert location.correct(corrupted) is None
+    
+    def test_rectangle_of_candidates(self):
+        """Test errors in two rows and two columns give four candidates"""
+        data = "Hello World"
+        parity = TwoDParity.generate(data)
+        corrupted = flip_bit(flip_bit(data, 1), 10)
+        
+        location = locate_2d_parity(corrupted, parity, TwoDParity.generate(corrupted))
+        
+        assert location.bit_positions == [1, 2, 9, 10]
+    
+    def test_short_payload_excludes_padding(self):
+        """Test candidates never point past the payload"""
+        location = locate_2d_parity("A", '0' * 12, '1' * 12)
+        
+        assert all(position < 8 for position in location.bit_positions)
+    
+    def test_matching_or_malformed_parity(self):
+        """Test nothing is located for equal, wrong-length or non-binary parity"""
+        parity = TwoDParity.generate("data")
+        
+        assert locate_2d_parity("data", parity, parity) is None
+        assert locate_2d_parity("data", parity[:-1], parity) is None
+        assert locate_2d_parity("data", 'x' * len(parity), parity) is None
+
+
+class TestHammingLocation:
+    """Test cases for Hamming syndrome localization"""
+    
+    @pytest.mark.parametrize('position', [0, 1, 2, 3, 50, 87])
+    def test_single_bit_located_and_corrected(self, position):
+        """Test the syndrome pins any single data bit"""
+        data = "Hamming test"
+        parity = HammingCode.generate(data)
+        corrupted = flip_bit(data, position)
+        
+        location = locate_hamming(corrupted, parity, HammingCode.generate(corrupted))
+        
+        assert location.bit_positions == [position]
+        assert location.correct(corrupted) == data
+        assert HammingCode.verify(location.correct(corrupted), parity)
+    
+    def test_corrupted_parity_bit(self):
+        """Test a syndrome that is a power of two blames the parity bits"""
+        parity = HammingCode.generate("data")
+        damaged = ('1' if parity[2] == '0' else '0').join((parity[:2], parity[3:]))
+        
+        location = locate_hamming("data", damaged, parity)
+        
+        assert location.bit_positions == []
+        assert location.syndrome == 4
+        assert "parity" in str(location)
+
+
+class TestLocateErrors:
+    """Test cases for method dispatch"""
+    
+    def test_dispatch(self):
+        """Test supported methods are localized and others are not"""
+        corrupted = flip_bit("payload", 5)
+        
+        location = locate_errors('hamming', corrupted, HammingCode.generate("payload"),
+                                 HammingCode.generate(corrupted))
+        
+        assert location.method == 'HAMMING'
+        assert location.bit_positions == [5]
+        assert locate_errors('CRC', corrupted, CRC.generate("payload"), CRC.generate(corrupted)) is None
+        assert locate_errors('2D_PARITY', corrupted, None, "0") is None
+    
+    def test_wide_characters_not_localized(self):
+        """Test payloads outside one byte per character are skipped"""
+        data = "snow ☃"
+        
+        assert locate_errors('HAMMING', data, '0' * 7, '1' * 7) is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,58 @@
+"""
+Test cases for lazy loading in the utils package
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+from datacom import utils
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_python(source):
+    """Run source in a fresh interpreter from the project root and return stdout"""
+    result = subprocess.run([sys.executable, '-c', source], cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+class TestLazyImports:
+    """Test cases for the utils package __getattr__"""
+    
+    def test_import_utils_loads_no_submodules(self):
+        """Test importing the package alone does not import detectors or logging"""
+        loaded = run_python(
+            "import sys, datacom.utils; "
+            "print(sorted(m for m in sys.modules if m.startswith('datacom.utils.')), 'colorama' in sys.modules)"
+        )
+        assert loaded == "[] False"
+    
+    def test_public_names_resolve(self):
+        """Test lazily loaded names are the submodule objects"""
+        from datacom.utils.error_detection import CRC
+        from datacom.utils.packet_handler import Packet
+        
+        assert utils.CRC is CRC
+        assert utils.Packet is Packet
+        assert set(utils.__all__) <= set(dir(utils))
+    
+    def test_unknown_attribute(self):
+        """Test unknown names still raise AttributeError"""
+        with pytest.raises(AttributeError):
+            utils.does_not_exist
+    
+    def test_backend_module_imported_first(self):
+        """Test a backend module can be imported before error_detection"""
+        output = run_python(
+            "from datacom.utils import numpy_backend, native_backend; "
+            "from datacom.utils.error_detection import get_error_detector; "
+            "print(get_error_detector('CRC').__name__.endswith('CRC'))"
+        )
+        assert output == "True"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
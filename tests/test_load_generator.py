@@ -0,0 +1,84 @@
+"""
+Test cases for the load generator
+"""
+
+import random
+import socket
+
+import pytest
+from datacom import config
+from datacom.benchmarks.load_generator import parse_sizes, parse_methods, run_load
+from datacom.utils.settings import ConfigError
+
+
+def _free_port_pair():
+    """Find two consecutive free localhost ports"""
+    for _ in range(20):
+        with socket.socket() as probe:
+            probe.bind((config.SERVER_HOST, 0))
+            port = probe.getsockname()[1]
+        try:
+            with socket.socket() as second:
+                second.bind((config.SERVER_HOST, port + 1))
+            return port
+        except OSError:
+            continue
+    pytest.skip("No free port pair available")
+
+
+class TestLoadGenerator:
+    """Test cases for load generator parsing and an end-to-end run"""
+    
+    def test_parse_sizes(self):
+        """Test fixed, range and choice size distributions"""
+        rng = random.Random(1)
+        assert parse_sizes('64')(rng) == 64
+        assert all(16 <= parse_sizes('16-32')(rng) <= 32 for _ in range(50))
+        assert {parse_sizes('8,9')(rng) for _ in range(50)} == {8, 9}
+        with pytest.raises(ValueError):
+            parse_sizes('big')
+    
+    def test_parse_methods(self):
+        """Test method mix parsing and validation"""
+        assert parse_methods('crc:3,HAMMING') == (['CRC', 'HAMMING'], [3.0, 1.0])
+        with pytest.raises(ValueError):
+            parse_methods('NOT_A_METHOD')
+    
+    def test_end_to_end_run(self, monkeypatch):
+        """Test a short run delivers every packet and records latency"""
+        port = _free_port_pair()
+        monkeypatch.setattr(config, 'SERVER_TO_CLIENT1_PORT', port)
+        monkeypatch.setattr(config, 'SERVER_TO_CLIENT2_PORT', port + 1)
+        
+        results = run_load(senders=2, rate=200, duration=0.3, sizes='16-64',
+                           methods='CRC,PARITY', seed=7)
+        
+        assert results['sent'] > 0
+        assert results['received'] == results['sent']
+        assert results['lost'] == 0
+        assert results['corrupted'] == 0
+        assert results['latency_us'][50] > 0
+    
+    def test_seed_needs_one_injector_worker(self, monkeypatch):
+        """Test the fault-stream check runs before any process is started"""
+        monkeypatch.setattr(config, 'INJECT_WORKERS', 4)
+        with pytest.raises(ConfigError):
+            run_load(senders=1, duration=0.1, seed=7)
+    
+    def test_udp_run(self, monkeypatch):
+        """Test the chain runs over UDP datagrams with sequence tracking"""
+        port = _free_port_pair()
+        monkeypatch.setattr(config, 'SERVER_TO_CLIENT1_PORT', port)
+        monkeypatch.setattr(config, 'SERVER_TO_CLIENT2_PORT', port + 1)
+        monkeypatch.setattr(config, 'TRANSPORT', 'udp')
+        
+        results = run_load(senders=2, rate=200, duration=0.3, sizes='16-64', methods='CRC',
+                           seed=7, drain_timeout=0.5)
+        
+        assert results['received'] > 0
+        assert results['received'] + results['lost'] == results['sent']
+        assert results['reordered'] == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,133 @@
+"""
+Test cases for logging utilities
+"""
+
+import logging
+import threading
+
+import pytest
+from datacom import config
+from datacom.utils import logger_utils
+from datacom.utils.logger_utils import Logger, ThroughputReporter, print_colored, print_packet_info
+
+
+class _ListHandler(logging.Handler):
+    """Handler that keeps formatted messages in a list"""
+    
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+    
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class TestLogger:
+    """Test cases for Logger"""
+    
+    def test_sampled_messages(self, monkeypatch):
+        """Test only one in N sampled messages is emitted"""
+        monkeypatch.setattr(config, 'ASYNC_LOGGING', False)
+        monkeypatch.setattr(config, 'ENABLE_CONSOLE_LOGGING', False)
+        logger = Logger('TestSampling')
+        handler = _ListHandler()
+        logger.logger.addHandler(handler)
+        
+        for i in range(10):
+            logger.info("Packet %d", i, sample=4)
+        
+        assert handler.messages == ["Packet 0", "Packet 4", "Packet 8"]
+    
+    def test_sampling_across_threads(self, monkeypatch):
+        """Test concurrent callers share one exact sampling counter"""
+        monkeypatch.setattr(config, 'ASYNC_LOGGING', False)
+        monkeypatch.setattr(config, 'ENABLE_CONSOLE_LOGGING', False)
+        logger = Logger('TestSamplingThreads')
+        handler = _ListHandler()
+        logger.logger.addHandler(handler)
+        
+        def worker():
+            for _ in range(1000):
+                logger.info("Forwarded", sample=10)
+        
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len(handler.messages) == 400
+    
+    def test_disabled_level_is_not_formatted(self, monkeypatch):
+        """Test arguments are not formatted for disabled levels"""
+        monkeypatch.setattr(config, 'ASYNC_LOGGING', False)
+        monkeypatch.setattr(config, 'ENABLE_CONSOLE_LOGGING', False)
+        logger = Logger('TestLazy')
+        
+        class Explodes:
+            def __str__(self):
+                raise AssertionError("formatted")
+        
+        logger.debug("Value: %s", Explodes())
+    
+    def test_async_file_logging(self, monkeypatch, tmp_path):
+        """Test queued records reach the log file once closed"""
+        monkeypatch.setattr(config, 'ASYNC_LOGGING', True)
+        monkeypatch.setattr(config, 'ENABLE_CONSOLE_LOGGING', False)
+        monkeypatch.setattr(config, 'LOG_DIRECTORY', str(tmp_path))
+        logger = Logger('TestAsync', 'async.log')
+        
+        logger.info("Sent packet: %s", "Hello|CRC|1010")
+        logger.close()
+        
+        with open(tmp_path / 'async.log') as f:
+            assert "Sent packet: Hello|CRC|1010" in f.read()
+    
+    def test_exit_hook_closes_open_loggers(self, monkeypatch, tmp_path):
+        """Test one module-level exit hook flushes loggers never closed"""
+        monkeypatch.setattr(config, 'ASYNC_LOGGING', True)
+        monkeypatch.setattr(config, 'ENABLE_CONSOLE_LOGGING', False)
+        monkeypatch.setattr(config, 'LOG_DIRECTORY', str(tmp_path))
+        logger = Logger('TestExit', 'exit.log')
+        logger.info("Pending record")
+        assert logger in logger_utils._async_loggers
+        
+        logger_utils._close_async_loggers()
+        
+        assert logger not in logger_utils._async_loggers
+        with open(tmp_path / 'exit.log') as f:
+            assert "Pending record" in f.read()
+
+
+class TestQuietMode:
+    """Test cases for quiet/throughput mode"""
+    
+    def test_quiet_mode_suppresses_output(self, monkeypatch, capsys):
+        """Test per-packet output is suppressed without loading colorama"""
+        monkeypatch.setattr(config, 'QUIET_MODE', True)
+        monkeypatch.setattr(logger_utils, '_colorama', None)
+        
+        print_colored("Packet forwarded", 'green')
+        print_packet_info({'data': 'Hello', 'method': 'CRC', 'control_info': '1010'})
+        
+        assert capsys.readouterr().out == ""
+        assert logger_utils._colorama is None
+    
+    def test_throughput_summary(self, monkeypatch, capsys):
+        """Test reporter prints one summary line per interval"""
+        monkeypatch.setattr(config, 'QUIET_MODE', True)
+        reporter = ThroughputReporter('Test', interval=0)
+        
+        reporter.record(1000)
+        reporter.record(1000, error=True)
+        
+        lines = capsys.readouterr().out.strip().splitlines()
+        assert len(lines) == 2
+        assert lines[1].startswith("[Test]")
+        assert "errors 100.0%" in lines[1]
+        assert reporter.total_packets == 2
+        assert reporter.total_errors == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,93 @@
+"""
+Test cases for the metrics registry
+"""
+
+import json
+import urllib.request
+
+import pytest
+from datacom.utils.metrics import MetricsRegistry, Histogram
+
+
+class TestHistogram:
+    """Test cases for Histogram"""
+    
+    def test_percentiles_within_precision(self):
+        """Test percentiles are within 1% of the exact value"""
+        histogram = Histogram('latency')
+        for value in range(1, 100001):
+            histogram.record(value * 1000)
+        
+        for percent in (50, 90, 99):
+            exact = percent * 1000 * 1000
+            assert abs(histogram.percentile(percent) - exact) / exact < 0.01
+        
+        assert histogram.count == 100000
+        assert histogram.min == 1000
+        assert histogram.max == 100000000
+    
+    def test_small_values_are_exact(self):
+        """Test values below the sub-bucket range are recorded exactly"""
+        histogram = Histogram('small')
+        for value in (3, 5, 7):
+            histogram.record(value)
+        assert histogram.percentile(50) == 5
+    
+    def test_empty_histogram(self):
+        """Test empty histogram snapshot"""
+        snapshot = Histogram('empty').snapshot()
+        assert snapshot['count'] == 0
+        assert snapshot['p99'] == 0
+
+
+class TestMetricsRegistry:
+    """Test cases for MetricsRegistry"""
+    
+    def test_disabled_timer_records_nothing(self):
+        """Test timers are no-ops while disabled"""
+        registry = MetricsRegistry(enabled=False)
+        with registry.timer('generate'):
+            pass
+        assert registry.snapshot()['histograms'] == {}
+    
+    def test_snapshot_and_json(self):
+        """Test snapshot contains all metric kinds"""
+        registry = MetricsRegistry(enabled=True)
+        registry.counter('packets').inc(3)
+        registry.gauge('depth', func=lambda: 7)
+        with registry.timer('generate'):
+            pass
+        
+        snapshot = json.loads(registry.to_json())
+        assert snapshot['counters']['packets'] == 3
+        assert snapshot['gauges']['depth'] == 7
+        assert snapshot['histograms']['generate']['count'] == 1
+    
+    def test_prometheus_text(self):
+        """Test Prometheus exposition format"""
+        registry = MetricsRegistry(enabled=True)
+        registry.counter('forward_errors').inc()
+        registry.histogram('parse_packet').record(2000)
+        
+        text = registry.to_prometheus()
+        assert "# TYPE forward_errors counter" in text
+        assert "forward_errors 1" in text
+        assert "# TYPE parse_packet_seconds summary" in text
+        assert 'parse_packet_seconds{quantile="0.99"}' in text
+        assert "parse_packet_seconds_count 1" in text
+    
+    def test_http_endpoint(self):
+        """Test metrics are served over local HTTP"""
+        registry = MetricsRegistry(enabled=True)
+        registry.counter('packets').inc()
+        server = registry.serve(0)
+        try:
+            port = server.server_address[1]
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+                assert "packets 1" in response.read().decode()
+        finally:
+            registry.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,73 @@
+"""
+Cross-check tests for the C-accelerated detector backend
+"""
+
+import random
+import shutil
+
+import pytest
+from datacom.utils import native_backend
+from datacom.utils.error_detection import ParityBit, CRC, HammingCode, InternetChecksum, CRC32C
+
+
+@pytest.fixture(scope='module')
+def native(tmp_path_factory):
+    """Build and load the native library, or skip without a C compiler"""
+    if not native_backend.NATIVE_AVAILABLE:
+        if not any(shutil.which(cc) for cc in ('cc', 'gcc', 'clang')):
+            pytest.skip("no C compiler available")
+        path = native_backend.build(str(tmp_path_factory.mktemp('native')))
+        assert native_backend.load(path)
+    return native_backend
+
+
+def sample_inputs():
+    """Edge cases plus seeded random strings"""
+    rng = random.Random(2024)
+    inputs = ["", "A", "AB", "Hello", "Hello World!", "\x00\xff\x80", "caf\xe9",
+              "€ uro", "\U0001f600", "x" * 1001]
+    for length in (1, 2, 3, 7, 8, 63, 64, 257, 4096):
+        inputs.append(''.join(chr(rng.randint(0, 255)) for _ in range(length)))
+        inputs.append(''.join(chr(rng.randint(32, 126)) for _ in range(length)))
+    return inputs
+
+
+class TestNativeCrossCheck:
+    """Native results must be bit-identical to the reference classes"""
+    
+    def test_parity(self, native):
+        """Test parity bit matches"""
+        for data in sample_inputs():
+            assert native.NativeParityBit.generate(data) == ParityBit.generate(data)
+    
+    @pytest.mark.parametrize('polynomial', [0x107, 0x11021, 0x104C11DB7, 0xB, 0x1D])
+    def test_crc(self, native, polynomial):
+        """Test CRC-8/16/32 and short polynomials match"""
+        for data in sample_inputs()[:20]:
+            assert native.NativeCRC.generate(data, polynomial) == CRC.generate(data, polynomial)
+    
+    def test_hamming(self, native):
+        """Test Hamming parity bits match"""
+        for data in sample_inputs()[:22]:
+            assert native.NativeHammingCode.generate(data) == HammingCode.generate(data)
+    
+    def test_internet_checksum(self, native):
+        """Test Internet checksum matches"""
+        for data in sample_inputs():
+            assert (native.NativeInternetChecksum.generate(data) ==
+                    InternetChecksum.generate(data))
+    
+    def test_crc32c(self, native):
+        """Test CRC-32C matches"""
+        for data in sample_inputs():
+            assert native.NativeCRC32C.generate(data) == CRC32C.generate(data)
+    
+    def test_verify_detects_corruption(self, native):
+        """Test native verify flags corrupted data"""
+        control_info = native.NativeCRC.generate("Network")
+        assert native.NativeCRC.verify("Network", control_info) == True
+        assert native.NativeCRC.verify("Netwark", control_info) == False
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,54 @@
+"""
+Cross-check tests for the NumPy 2D parity / Hamming backend
+"""
+
+import random
+
+import pytest
+
+pytest.importorskip('numpy')
+
+from datacom import config
+from datacom.utils.error_detection import TwoDParity, HammingCode
+from datacom.utils.numpy_backend import NumpyTwoDParity, NumpyHammingCode
+
+
+def sample_inputs():
+    """Edge cases plus seeded random strings"""
+    rng = random.Random(7)
+    inputs = ["", "A", "Test", "Test123", "\x00\xff", "caf\xe9", "€ uro"]
+    for length in (1, 3, 4, 5, 31, 64, 300):
+        inputs.append(''.join(chr(rng.randint(0, 255)) for _ in range(length)))
+    return inputs
+
+
+class TestNumpyCrossCheck:
+    """NumPy results must be bit-identical to the reference classes"""
+    
+    @pytest.fixture(autouse=True)
+    def always_vectorize(self, monkeypatch):
+        """Force the NumPy path for every payload size"""
+        monkeypatch.setattr(config, 'NUMPY_THRESHOLD', 0)
+    
+    @pytest.mark.parametrize('rows,cols', [(4, 8), (3, 5), (16, 16)])
+    def test_two_d_parity(self, monkeypatch, rows, cols):
+        """Test row/column parities match for several matrix sizes"""
+        monkeypatch.setattr(config, 'PARITY_MATRIX_ROWS', rows)
+        monkeypatch.setattr(config, 'PARITY_MATRIX_COLS', cols)
+        for data in sample_inputs():
+            assert NumpyTwoDParity.generate(data) == TwoDParity.generate(data)
+    
+    def test_hamming(self):
+        """Test Hamming parity bits match"""
+        for data in sample_inputs():
+            assert NumpyHammingCode.generate(data) == HammingCode.generate(data)
+    
+    def test_verify_detects_corruption(self):
+        """Test vectorized verify flags corrupted data"""
+        parity = NumpyHammingCode.generate("Test")
+        assert NumpyHammingCode.verify("Test", parity) == True
+        assert NumpyHammingCode.verify("Best", parity) == False
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -2,13 +2,8 @@
 Test cases for packet handler
 """
 
-import sys
-import os
-
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 import pytest
-from utils.packet_handler import Packet, create_packet, parse_packet, validate_packet
+from datacom.utils.packet_handler import Packet, create_packet, parse_packet, validate_packet
 
 
 class TestPacket:
@@ -47,6 +42,41 @@ class TestPacket:
         """Test parsing invalid packet format"""
         with pytest.raises(ValueError):
             Packet.from_string("Invalid|Format")
+    
+    def test_packet_to_buffers(self):
+        """Test buffer encoding matches the string encoding"""
+        for packet in (Packet("Test", "CRC", "10101"),
+                       Packet("Héllo", "CRC", "1", headers={'id': '1.2'})):
+            buffers = packet.to_buffers('utf-8')
+            assert len(buffers) == 2
+            assert buffers[0] == packet.data.encode('utf-8')
+            assert b''.join(buffers) == packet.to_string().encode('utf-8')
+    
+    def test_encoded_data_reused(self):
+        """Test the payload is encoded once until it changes"""
+        packet = Packet("Héllo", "CRC", "1")
+        encoded = packet.encoded_data('utf-8')
+        assert len(encoded) == 6
+        assert packet.to_buffers('utf-8')[0] is encoded
+        
+        packet.data = "Hello"
+        assert packet.encoded_data('utf-8') == b"Hello"
+    
+    def test_packet_headers_round_trip(self):
+        """Test optional header field serialization"""
+        packet = Packet("Test", "CRC", "10101", headers={'id': '12.3', 'ts': 1700})
+        packet_string = packet.to_string()
+        assert packet_string == "Test|CRC|10101|id=12.3;ts=1700"
+        
+        parsed = Packet.from_string(packet_string)
+        assert parsed.data == "Test"
+        assert parsed.control_info == "10101"
+        assert parsed.headers == {'id': '12.3', 'ts': '1700'}
+    
+    def test_invalid_header_field(self):
+        """Test parsing malformed header field"""
+        with pytest.raises(ValueError):
+            Packet.from_string("Test|CRC|10101|broken")
 
 
 class TestPacketFunctions:
@@ -0,0 +1,124 @@
+"""
+Test cases for the parallel chunked detectors
+"""
+
+import random
+import zlib
+
+import pytest
+from datacom import config
+from datacom.utils import error_detection, parallel_detectors
+from datacom.utils.error_detection import CRC, CRC32C, InternetChecksum
+
+
+def make_payload(size, seed=0):
+    """Printable ASCII payload"""
+    rng = random.Random(seed)
+    return ''.join(chr(rng.randrange(32, 127)) for _ in range(size))
+
+
+@pytest.fixture(scope='module', autouse=True)
+def worker_pool():
+    """Share one worker pool across the module and stop it afterwards"""
+    yield
+    parallel_detectors.shutdown()
+
+
+class TestCombine:
+    """Test cases for the combine math"""
+    
+    @pytest.mark.parametrize('polynomial', [0b11, 0b1011, config.CRC_POLYNOMIAL,
+                                            config.CRC_POLYNOMIAL_16, config.CRC_POLYNOMIAL_32])
+    def test_crc_combine(self, polynomial):
+        """Test combined chunk remainders equal the remainder of the whole"""
+        data = make_payload(300)
+        for split in (0, 1, 7, 150, 300):
+            head, tail = data[:split], data[split:]
+            combined = parallel_detectors.crc_combine(int(CRC.generate(head, polynomial), 2),
+                                                      int(CRC.generate(tail, polynomial), 2),
+                                                      8 * len(tail), polynomial)
+            assert combined == int(CRC.generate(data, polynomial), 2)
+    
+    def test_crc32_combine_matches_zlib(self):
+        """Test the reflected combine against zlib's CRC-32"""
+        data = bytes(range(256)) * 40
+        for split in (0, 1, 1000, len(data)):
+            combined = parallel_detectors.crc32_combine(zlib.crc32(data[:split]),
+                                                        zlib.crc32(data[split:]),
+                                                        len(data) - split, 0xEDB88320)
+            assert combined == zlib.crc32(data)
+    
+    def test_crc32c_combine(self):
+        """Test the reflected combine with the CRC-32C polynomial"""
+        data = make_payload(1000)
+        head, tail = data[:333], data[333:]
+        combined = parallel_detectors.crc32_combine(int(CRC32C.generate(head), 16),
+                                                    int(CRC32C.generate(tail), 16), len(tail))
+        assert format(combined, '08x') == CRC32C.generate(data)
+    
+    def test_chunk_bounds(self):
+        """Test chunks cover the buffer in order and start on aligned offsets"""
+        for length, chunks, align in ((10, 3, 1), (11, 4, 2), (5, 8, 2), (1000, 7, 2)):
+            bounds = parallel_detectors._chunk_bounds(length, chunks, align)
+            assert bounds[0][0] == 0 and bounds[-1][1] == length
+            assert all(a[1] == b[0] for a, b in zip(bounds, bounds[1:]))
+            assert all(start % align == 0 for start, _ in bounds)
+            assert len(bounds) <= chunks
+
+
+class TestParallelDetectors:
+    """Test cases for results computed in the worker pool"""
+    
+    @pytest.mark.parametrize('size', [4096, 20001])
+    def test_identical_to_serial(self, size):
+        """Test every parallel detector reproduces the serial value exactly"""
+        data = make_payload(size, seed=size)
+        
+        assert parallel_detectors.crc(data, workers=3) == CRC.generate(data)
+        assert parallel_detectors.crc(data, config.CRC_POLYNOMIAL_32, workers=3) == \
+            CRC.generate(data, config.CRC_POLYNOMIAL_32)
+        assert parallel_detectors.crc32c(data, workers=3) == CRC32C.generate(data)
+        assert parallel_detectors.internet_checksum(data, workers=3) == InternetChecksum.generate(data)
+    
+    def test_multibyte_characters(self):
+        """Test byte-based detectors split UTF-8 anywhere and CRC falls back outside Latin-1"""
+        data = "ünïcødé ✓ " * 2000
+        
+        assert parallel_detectors.crc32c(data, workers=3) == CRC32C.generate(data)
+        assert parallel_detectors.internet_checksum(data, workers=3) == InternetChecksum.generate(data)
+        assert parallel_detectors.crc(data[:200], workers=3) == CRC.generate(data[:200])
+    
+    def test_pure_python_workers(self, monkeypatch):
+        """Test the reference kernels are used when the native backend is disabled"""
+        monkeypatch.setattr(config, 'DETECTOR_BACKEND', 'python')
+        data = make_payload(3001, seed=7)
+        
+        assert parallel_detectors.crc(data, workers=2) == CRC.generate(data)
+        assert parallel_detectors.crc32c(data, workers=2) == CRC32C.generate(data)
+        assert parallel_detectors.internet_checksum(data, workers=2) == InternetChecksum.generate(data)
+
+
+class TestInstall:
+    """Test cases for registry integration"""
+    
+    def test_install_wraps_registered_detectors(self, monkeypatch):
+        """Test large payloads go parallel and small ones to the previous class"""
+        monkeypatch.setattr(error_detection, 'DETECTORS', list(error_detection.DETECTORS))
+        monkeypatch.setattr(config, 'PARALLEL_THRESHOLD', 1000)
+        monkeypatch.setattr(config, 'PARALLEL_WORKERS', 2)
+        serial = error_detection.get_error_detector('CRC')
+        
+        parallel_detectors.install()
+        detector = error_detection.get_error_detector('CRC')
+        
+        assert detector is parallel_detectors.ParallelCRC
+        assert detector.serial is serial
+        for data in ("short", make_payload(5000)):
+            assert detector.generate(data) == CRC.generate(data)
+            assert detector.verify(data, CRC.generate(data))
+        assert error_detection.get_error_detector('CHECKSUM').generate(make_payload(5000)) == \
+            InternetChecksum.generate(make_payload(5000))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
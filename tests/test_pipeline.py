@@ -0,0 +1,255 @@
+"""
+Test cases for the server relay pipeline
+"""
+
+import threading
+import time
+
+import pytest
+from datacom.server.pipeline import BatchPolicy, RelayPipeline
+from datacom.utils.packet_handler import Packet
+
+
+class TestRelayPipeline:
+    """Test cases for RelayPipeline"""
+    
+    def test_packets_flow_in_order(self):
+        """Test packets pass through both stages in order"""
+        forwarded = []
+        pipeline = RelayPipeline(lambda p: p.upper(), forwarded.append, queue_size=4)
+        pipeline.start()
+        
+        for item in ['a', 'b', 'c']:
+            assert pipeline.submit(item) == True
+        pipeline.stop(timeout=2)
+        
+        assert forwarded == ['A', 'B', 'C']
+    
+    def test_backpressure_when_forwarder_is_slow(self):
+        """Test submit blocks and is counted when queues are full"""
+        release = threading.Event()
+        forwarded = []
+        
+        def slow_forward(packet):
+            release.wait(2)
+            forwarded.append(packet)
+        
+        pipeline = RelayPipeline(lambda p: p, slow_forward, queue_size=1)
+        pipeline.start()
+        
+        results = [pipeline.submit(i, timeout=0.2) for i in range(5)]
+        assert False in results
+        
+        metrics = pipeline.get_metrics()
+        assert metrics['inject']['blocked'] > 0
+        assert metrics['inject']['capacity'] == 1
+        assert metrics['inject']['high_water'] <= 1
+        
+        release.set()
+        pipeline.stop(timeout=2)
+        assert forwarded == [i for i, ok in enumerate(results) if ok]
+    
+    @pytest.mark.parametrize('batched', [False, True])
+    def test_stop_returns_when_forwarder_stalls(self, batched):
+        """Test stop() honours its timeout with both queues full behind a stuck Client 2"""
+        release = threading.Event()
+        forward = lambda packet: release.wait(10)
+        pipeline = RelayPipeline(lambda p: p, forward, queue_size=2, item_size=lambda p: 1,
+                                 forward_batch_func=(lambda packets: release.wait(10))
+                                 if batched else None,
+                                 batch_policy=BatchPolicy(max_packets=1, max_delay_us=0))
+        pipeline.start()
+        for item in range(8):
+            pipeline.submit(item, timeout=0.2)
+        assert pipeline.queue_depths() == {'inject': 2, 'forward': 2}
+        
+        # A reader blocked on the full injector queue is released by stop() too
+        results = []
+        reader = threading.Thread(target=lambda: results.append(pipeline.submit('late')))
+        reader.start()
+        
+        started = time.monotonic()
+        pipeline.stop(timeout=0.5)
+        assert time.monotonic() - started < 2
+        reader.join(1)
+        assert results == [False]
+        release.set()
+    
+    def test_stage_errors_are_counted(self):
+        """Test a failing injector does not stop the pipeline"""
+        forwarded = []
+        
+        def inject(packet):
+            if packet == 'bad':
+                raise ValueError("corrupt")
+            return packet
+        
+        pipeline = RelayPipeline(inject, forwarded.append, queue_size=4)
+        pipeline.start()
+        for item in ['ok', 'bad', 'ok2']:
+            pipeline.submit(item)
+        pipeline.stop(timeout=2)
+        
+        metrics = pipeline.get_metrics()
+        assert forwarded == ['ok', 'ok2']
+        assert metrics['inject']['errors'] == 1
+        assert metrics['forward']['processed'] == 2
+    
+    def test_forward_errors_are_counted(self):
+        """Test packets whose forward raises count as errors, not processed"""
+        def forward(packet):
+            if packet == 'bad':
+                raise OSError("connection reset")
+        
+        def forward_batch(packets):
+            if 'bad' in packets:
+                raise OSError("connection reset")
+        
+        pipeline = RelayPipeline(lambda p: p, forward, queue_size=4)
+        pipeline.start()
+        for item in ['ok', 'bad', 'ok2']:
+            pipeline.submit(item)
+        pipeline.stop(timeout=2)
+        assert pipeline.get_metrics()['forward']['errors'] == 1
+        assert pipeline.get_metrics()['forward']['processed'] == 2
+        
+        pipeline = RelayPipeline(lambda p: p, None, queue_size=4, forward_batch_func=forward_batch,
+                                 batch_policy=BatchPolicy(max_packets=2, max_delay_us=0),
+                                 item_size=len)
+        pipeline.submit('bad')
+        pipeline.submit('ok')
+        pipeline.start()
+        pipeline.stop(timeout=2)
+        assert pipeline.get_metrics()['forward']['errors'] == 2
+        assert pipeline.get_metrics()['forward']['processed'] == 0
+    
+    def test_multiple_injector_workers(self):
+        """Test every packet is forwarded once and stop drains all injectors"""
+        forwarded = []
+        pipeline = RelayPipeline(lambda p: p * 2, forwarded.append, queue_size=4,
+                                 inject_workers=3)
+        pipeline.start()
+        
+        for item in range(20):
+            pipeline.submit(item)
+        pipeline.stop(timeout=2)
+        
+        assert sorted(forwarded) == [item * 2 for item in range(20)]
+        assert pipeline.get_metrics()['inject']['processed'] == 20
+    
+    def test_queue_depths(self):
+        """Test queue depth reporting before start"""
+        pipeline = RelayPipeline(lambda p: p, lambda p: None, queue_size=8)
+        pipeline.submit('x')
+        assert pipeline.queue_depths() == {'inject': 1, 'forward': 0}
+    
+    def test_batch_forwarding(self):
+        """Test queued packets reach the batch forwarder together and in order"""
+        release = threading.Event()
+        batches = []
+        
+        def forward_batch(packets):
+            release.wait(2)
+            batches.append(list(packets))
+        
+        pipeline = RelayPipeline(lambda p: p, None, queue_size=16, forward_batch_func=forward_batch,
+                                 item_size=lambda p: 1)
+        pipeline.start()
+        for item in range(10):
+            assert pipeline.submit(item) == True
+        release.set()
+        pipeline.stop(timeout=2)
+        
+        assert [item for batch in batches for item in batch] == list(range(10))
+        assert len(batches) < 10
+        assert pipeline.get_metrics()['forward']['processed'] == 10
+    
+    def test_batch_limits(self):
+        """Test batches are cut at the packet and byte limits"""
+        release = threading.Event()
+        batches = []
+        
+        def forward_batch(packets):
+            release.wait(2)
+            batches.append(list(packets))
+        
+        policy = BatchPolicy(max_packets=4, max_bytes=10, max_delay_us=0)
+        pipeline = RelayPipeline(lambda p: p, None, queue_size=32, forward_batch_func=forward_batch,
+                                 batch_policy=policy, item_size=len)
+        pipeline.start()
+        for item in ['first'] + ['a'] * 8 + ['bbbbbb'] * 3:
+            pipeline.submit(item)
+        while pipeline.queue_depths()['inject']:
+            time.sleep(0.01)
+        release.set()
+        pipeline.stop(timeout=2)
+        
+        assert [item for batch in batches for item in batch] == ['first'] + ['a'] * 8 + ['bbbbbb'] * 3
+        assert max(len(batch) for batch in batches) <= 4
+        assert all(sum(map(len, batch[:-1])) < 10 for batch in batches)
+        
+        metrics = pipeline.get_metrics()['forward']
+        assert metrics['flush_packets'] >= 1
+        assert metrics['flush_bytes'] >= 1
+        assert metrics['batches'] == len(batches)
+    
+    def test_default_item_size_counts_bytes(self):
+        """Test the byte limit sees encoded bytes, not characters"""
+        pipeline = RelayPipeline(lambda p: p, None, forward_batch_func=lambda packets: None)
+        assert pipeline.item_size(Packet("ü" * 10, "CRC", "0")) == 20
+    
+    def test_linger_coalesces_paced_packets(self):
+        """Test a lingering forwarder batches packets that arrive slightly apart"""
+        batches = []
+        policy = BatchPolicy(max_packets=8, max_bytes=1000, max_delay_us=200000)
+        policy.linger = policy.max_delay
+        pipeline = RelayPipeline(lambda p: p, None, queue_size=16, forward_batch_func=batches.append,
+                                 batch_policy=policy, item_size=len)
+        pipeline.start()
+        for item in 'abcd':
+            pipeline.submit(item)
+            time.sleep(0.01)
+        pipeline.stop(timeout=2)
+        
+        assert len(batches) == 1
+        assert batches[0] == list('abcd')
+
+
+class TestBatchPolicy:
+    """Test cases for the adaptive forward batching policy"""
+    
+    def test_no_linger_when_idle(self):
+        """Test single packets at low rate never start lingering"""
+        policy = BatchPolicy(max_packets=8, max_bytes=1000, max_delay_us=800)
+        for _ in range(10):
+            policy.update('idle', 1, 0)
+        assert policy.linger == 0
+    
+    def test_backlog_grows_linger_up_to_max(self):
+        """Test full batches and backlog raise the linger, capped at the maximum delay"""
+        policy = BatchPolicy(max_packets=8, max_bytes=1000, max_delay_us=800)
+        policy.update('idle', 3, 0)
+        assert policy.linger_us == pytest.approx(100)
+        for _ in range(10):
+            policy.update('packets', 8, 0)
+        assert policy.linger_us == pytest.approx(800)
+    
+    def test_useless_waits_shrink_linger_to_zero(self):
+        """Test timeouts that gained nothing back the linger off to zero"""
+        policy = BatchPolicy(max_packets=8, max_bytes=1000, max_delay_us=800)
+        policy.linger = policy.max_delay
+        policy.update('timeout', 2, 1)
+        assert policy.linger_us == pytest.approx(800)
+        for _ in range(10):
+            policy.update('timeout', 1, 0)
+        assert policy.linger == 0
+    
+    def test_zero_delay_disables_linger(self):
+        """Test FORWARD_BATCH_DELAY_US=0 keeps drain-only batching"""
+        policy = BatchPolicy(max_packets=8, max_bytes=1000, max_delay_us=0)
+        policy.update('packets', 8, 0)
+        assert policy.linger == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,82 @@
+"""
+Test cases for runtime configuration loading and validation
+"""
+
+import argparse
+import json
+
+import pytest
+from datacom import config
+from datacom.utils import settings
+from datacom.utils.settings import ConfigError
+
+
+class TestSettings:
+    """Test cases for utils.settings"""
+    
+    def test_defaults_come_from_config(self):
+        """Test values default to the constants in config.py"""
+        loaded = settings.load(environ={})
+        assert loaded.BUFFER_SIZE == config.BUFFER_SIZE
+        assert loaded.sources['BUFFER_SIZE'] == 'default'
+    
+    def test_precedence_file_env_cli(self, tmp_path):
+        """Test CLI overrides env, which overrides the file"""
+        path = tmp_path / "settings.json"
+        path.write_text(json.dumps({'buffer_size': 1024, 'PIPELINE_QUEUE_SIZE': 8, 'TCP_NODELAY': False}))
+        
+        loaded = settings.load(str(path), environ={'DATACOM_BUFFER_SIZE': '2048',
+                                                   'DATACOM_PIPELINE_QUEUE_SIZE': '16'},
+                               assignments=['BUFFER_SIZE=0x1000'])
+        
+        assert loaded.BUFFER_SIZE == 4096
+        assert loaded.sources['BUFFER_SIZE'] == 'cli'
+        assert loaded.PIPELINE_QUEUE_SIZE == 16
+        assert loaded.TCP_NODELAY is False
+        assert loaded.sources['TCP_NODELAY'].startswith('file')
+    
+    def test_config_file_from_environment(self, tmp_path):
+        """Test $DATACOM_CONFIG names the settings file"""
+        path = tmp_path / "settings.json"
+        path.write_text(json.dumps({'INJECT_WORKERS': 4}))
+        
+        loaded = settings.load(environ={'DATACOM_CONFIG': str(path)})
+        assert loaded.INJECT_WORKERS == 4
+    
+    @pytest.mark.parametrize('assignment', [
+        'BUFFER_SIZE=0', 'BUFFER_SIZE=big', 'SERVER_TO_CLIENT1_PORT=70000',
+        'DETECTOR_BACKEND=gpu', 'TCP_NODELAY=maybe', 'NOT_A_SETTING=1',
+        'SERVER_TO_CLIENT2_PORT=5001'
+    ])
+    def test_invalid_values_rejected(self, assignment):
+        """Test type, range, choice, unknown-name and cross-field errors"""
+        with pytest.raises(ConfigError):
+            settings.load(environ={}, assignments=[assignment])
+    
+    def test_all_errors_reported(self):
+        """Test every invalid value is listed in one error"""
+        with pytest.raises(ConfigError) as excinfo:
+            settings.load(environ={'DATACOM_LOG_SAMPLE_EVERY': '-1'}, assignments=['BUFFER_SIZE=x'])
+        assert 'LOG_SAMPLE_EVERY' in str(excinfo.value)
+        assert 'BUFFER_SIZE' in str(excinfo.value)
+    
+    def test_configure_applies_to_config(self, monkeypatch):
+        """Test configure() writes values onto the config module"""
+        monkeypatch.setattr(config, 'SOCKET_RCVBUF', config.SOCKET_RCVBUF)
+        parser = argparse.ArgumentParser()
+        settings.add_arguments(parser)
+        args = parser.parse_args(['--set', 'SOCKET_RCVBUF=262144'])
+        
+        monkeypatch.setattr(settings.os, 'environ', {})
+        loaded = settings.configure(args)
+        
+        assert loaded.SOCKET_RCVBUF == 262144
+        assert config.SOCKET_RCVBUF == 262144
+    
+    def test_every_setting_exists_in_config(self):
+        """Test the schema only names constants defined in config.py"""
+        assert all(hasattr(config, name) for name in settings.SCHEMA)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
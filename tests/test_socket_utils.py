@@ -0,0 +1,250 @@
+"""
+Test cases for socket tuning and length-prefixed framing
+"""
+
+import socket
+import struct
+import threading
+
+import pytest
+from datacom import config
+from datacom.utils import socket_utils
+from datacom.utils.socket_utils import FrameReader, send_frame
+
+
+class ChunkedSocket:
+    """Socket stand-in that returns at most `chunk` bytes per recv_into"""
+    
+    def __init__(self, data, chunk):
+        self.data = data
+        self.chunk = chunk
+        self.offset = 0
+    
+    def recv_into(self, view):
+        size = min(self.chunk, len(view), len(self.data) - self.offset)
+        view[:size] = self.data[self.offset:self.offset + size]
+        self.offset += size
+        return size
+
+
+def _frames(*payloads):
+    """Encode payloads as they appear on the wire"""
+    return b''.join(struct.pack('!I', len(p)) + p for p in payloads)
+
+
+class TestFrameReader:
+    """Test cases for FrameReader"""
+    
+    def test_socketpair_round_trip(self):
+        """Test frames sent with send_frame are read back in order"""
+        left, right = socket.socketpair()
+        with left, right:
+            payloads = [b"first", b"", "Héllo".encode('utf-8'), b"x" * 1000]
+            for payload in payloads:
+                send_frame(left, payload)
+            left.close()
+            
+            reader = FrameReader(right, capacity=64)
+            assert [bytes(frame) for frame in reader] == payloads
+    
+    def test_frames_split_across_receives(self):
+        """Test frames arriving one byte at a time are reassembled"""
+        payloads = [b"abc", b"defgh", b"i"]
+        reader = FrameReader(ChunkedSocket(_frames(*payloads), 1), capacity=8)
+        
+        assert [bytes(frame) for frame in reader] == payloads
+    
+    def test_coalesced_frames_use_one_receive(self):
+        """Test several frames delivered in one segment need a single recv_into"""
+        payloads = [b"one", b"two", b"three"]
+        reader = FrameReader(ChunkedSocket(_frames(*payloads), 4096), capacity=4096)
+        
+        assert [bytes(reader.read_frame()) for _ in payloads] == payloads
+        assert reader.recv_calls == 1
+    
+    def test_buffer_reused_between_frames(self):
+        """Test the receive buffer is compacted in place instead of reallocated"""
+        payloads = [bytes([i]) * 20 for i in range(50)]
+        reader = FrameReader(ChunkedSocket(_frames(*payloads), 7), capacity=32)
+        buffer = reader._buffer
+        
+        assert [bytes(frame) for frame in reader] == payloads
+        assert reader._buffer is buffer
+    
+    def test_large_frame_grows_buffer(self):
+        """Test a frame larger than the buffer is received intact"""
+        payload = bytes(range(256)) * 100
+        reader = FrameReader(ChunkedSocket(_frames(b"small", payload, b"after"), 1000), capacity=16)
+        
+        assert bytes(reader.read_frame()) == b"small"
+        assert bytes(reader.read_frame()) == payload
+        assert bytes(reader.read_frame()) == b"after"
+        assert reader.capacity >= len(payload) + socket_utils.FRAME_HEADER_SIZE
+        assert reader.read_frame() is None
+    
+    def test_eof_mid_frame_raises(self):
+        """Test a connection closed inside a frame is an error, not a clean EOF"""
+        truncated = _frames(b"complete", b"truncated")[:-3]
+        reader = FrameReader(ChunkedSocket(truncated, 5))
+        
+        assert bytes(reader.read_frame()) == b"complete"
+        with pytest.raises(ConnectionError):
+            reader.read_frame()
+    
+    def test_eof_mid_header_raises(self):
+        """Test a partial length prefix is an error"""
+        reader = FrameReader(ChunkedSocket(b"\x00\x00", 5))
+        
+        with pytest.raises(ConnectionError):
+            reader.read_frame()
+    
+    def test_oversized_frame_rejected(self):
+        """Test lengths above max_frame_size are refused before allocating"""
+        reader = FrameReader(ChunkedSocket(struct.pack('!I', 1 << 30), 4), max_frame_size=1024)
+        
+        with pytest.raises(ConnectionError):
+            reader.read_frame()
+
+
+
+class RecordingSocket:
+    """Socket stand-in recording sendmsg calls and accepting at most `limit` bytes per call"""
+    
+    def __init__(self, limit=None):
+        self.limit = limit
+        self.calls = []
+        self.data = bytearray()
+    
+    def sendmsg(self, buffers):
+        chunk = b''.join(bytes(buffer) for buffer in buffers)
+        if self.limit is not None:
+            chunk = chunk[:self.limit]
+        self.calls.append(len(buffers))
+        self.data += chunk
+        return len(chunk)
+
+
+class TestSendFrames:
+    """Test cases for scatter-gather sends"""
+    
+    def test_packets_coalesced_into_one_call(self):
+        """Test several packets go out in a single sendmsg without joining"""
+        sock = RecordingSocket()
+        frames = [[b"data%d" % i, b"|CRC|1"] for i in range(10)]
+        socket_utils.send_frames(sock, frames)
+        
+        assert sock.calls == [30]
+        expected = [b"data%d|CRC|1" % i for i in range(10)]
+        assert [bytes(f) for f in FrameReader(ChunkedSocket(bytes(sock.data), 4096))] == expected
+    
+    def test_partial_writes_resumed(self):
+        """Test a short sendmsg continues mid-buffer without losing bytes"""
+        sock = RecordingSocket(limit=7)
+        frames = [[b"abcdefghij", b"|X|1"], [b"", b"klm"]]
+        socket_utils.send_frames(sock, frames)
+        
+        assert bytes(sock.data) == _frames(b"abcdefghij|X|1", b"klm")
+        assert len(sock.calls) > 1
+    
+    def test_fallback_without_sendmsg(self):
+        """Test connections without sendmsg receive one joined sendall"""
+        sent = []
+        
+        class PlainConnection:
+            def sendall(self, data):
+                sent.append(bytes(data))
+        
+        socket_utils.send_frames(PlainConnection(), [[b"ab", b"c"], [b"d"]])
+        assert sent == [_frames(b"abc", b"d")]
+    
+    def test_message_oriented_not_coalesced(self):
+        """Test datagram connections get one message per packet"""
+        sock = RecordingSocket()
+        sock.message_oriented = True
+        socket_utils.send_frames(sock, [[b"ab", b"c"], [b"d"]])
+        
+        assert sock.calls == [3, 2]
+    
+    def test_socketpair_scatter_gather(self):
+        """Test frames sent from buffers arrive intact over a real socket"""
+        left, right = socket.socketpair()
+        with left, right:
+            frames = [[b"x" * size, b"|CRC|%d" % size] for size in (0, 1, 1000, 100000)]
+            thread = threading.Thread(target=socket_utils.send_frames, args=(left, frames))
+            thread.start()
+            reader = FrameReader(right)
+            received = [bytes(reader.read_frame()) for _ in frames]
+            thread.join(timeout=5)
+        
+        assert received == [b''.join(buffers) for buffers in frames]
+
+class TestSocketOptions:
+    """Test cases for socket tuning"""
+    
+    def test_tcp_options_applied(self, monkeypatch):
+        """Test TCP_NODELAY and buffer sizes follow config"""
+        monkeypatch.setattr(config, 'TCP_NODELAY', True)
+        monkeypatch.setattr(config, 'SOCKET_SNDBUF', 65536)
+        monkeypatch.setattr(config, 'SOCKET_RCVBUF', 65536)
+        
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            socket_utils.tune_socket(sock)
+            
+            assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY) != 0
+            # Linux reports double the requested size for bookkeeping overhead
+            assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF) >= 65536
+            assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF) >= 65536
+    
+    def test_nodelay_disabled(self, monkeypatch):
+        """Test TCP_NODELAY is left off when disabled"""
+        monkeypatch.setattr(config, 'TCP_NODELAY', False)
+        
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            socket_utils.tune_socket(sock)
+            assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY) == 0
+    
+    def test_listener_and_connect(self):
+        """Test a framed exchange over a tuned loopback connection"""
+        listener = socket_utils.create_listener('127.0.0.1', 0)
+        port = listener.getsockname()[1]
+        received = []
+        
+        def serve():
+            conn, _ = listener.accept()
+            with conn:
+                received.extend(bytes(frame) for frame in FrameReader(conn))
+        
+        thread = threading.Thread(target=serve)
+        thread.start()
+        with socket_utils.connect('127.0.0.1', port) as sock:
+            for i in range(100):
+                send_frame(sock, b"packet %d" % i)
+        thread.join(timeout=5)
+        listener.close()
+        
+        assert received == [b"packet %d" % i for i in range(100)]
+    
+    def test_connect_uses_socket_timeout(self, monkeypatch):
+        """Test connect() is bounded by SOCKET_TIMEOUT and returns a blocking socket"""
+        monkeypatch.setattr(config, 'SOCKET_TIMEOUT', 2.5)
+        listener = socket_utils.create_listener('127.0.0.1', 0)
+        port = listener.getsockname()[1]
+        timeouts = []
+        
+        class RecordingSocket(socket.socket):
+            def connect(self, address):
+                timeouts.append(self.gettimeout())
+                super().connect(address)
+        
+        monkeypatch.setattr(socket_utils.socket, 'socket', RecordingSocket)
+        with socket_utils.connect('127.0.0.1', port) as sock:
+            assert sock.gettimeout() is None
+        with socket_utils.connect('127.0.0.1', port, timeout=1.0):
+            pass
+        listener.close()
+        
+        assert timeouts == [2.5, 1.0]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
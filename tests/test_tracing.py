@@ -0,0 +1,51 @@
+"""
+Test cases for end-to-end packet tracing
+"""
+
+import pytest
+from datacom.utils import tracing
+from datacom.utils.packet_handler import Packet
+
+
+class TestTracing:
+    """Test cases for trace stamping and latency aggregation"""
+    
+    def test_untraced_packet_is_not_stamped(self):
+        """Test stamp leaves untraced packets unchanged"""
+        packet = Packet("Hello", "CRC", "1010")
+        tracing.stamp(packet, tracing.INGRESS)
+        assert packet.headers == {}
+        assert packet.to_string() == "Hello|CRC|1010"
+    
+    def test_trace_survives_serialization(self):
+        """Test trace metadata round-trips through the packet header"""
+        packet = Packet("Hello", "CRC", "1010")
+        tracing.start_trace(packet, created_us=100)
+        tracing.stamp(packet, tracing.SENT, 150)
+        
+        parsed = Packet.from_string(packet.to_string())
+        assert tracing.is_traced(parsed)
+        assert parsed.headers[tracing.SENT] == '150'
+    
+    def test_per_hop_latencies(self):
+        """Test hop latencies are computed from header timestamps"""
+        packet = Packet("Hello", "CRC", "1010")
+        tracing.start_trace(packet, created_us=1000)
+        tracing.stamp(packet, tracing.SENT, 1010)
+        tracing.stamp(packet, tracing.INGRESS, 1060)
+        tracing.stamp(packet, tracing.EGRESS, 1260)
+        parsed = Packet.from_string(packet.to_string())
+        
+        tracker = tracing.LatencyTracker(interval=60)
+        latencies = tracker.record(parsed, received_us=1300, verified_us=1305)
+        
+        assert latencies == {'generate': 10, 'uplink': 50, 'relay': 200,
+                             'downlink': 40, 'verify': 5, 'total': 305}
+        summary = tracker.summary()
+        assert summary['relay']['count'] == 1
+        assert summary['relay']['p50_us'] == 200
+        assert "relay" in tracker.format_report()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,257 @@
+"""
+Test cases for the pluggable relay transports
+"""
+
+import os
+import socket
+import struct
+import threading
+
+import pytest
+from datacom import config
+from datacom.utils import transport
+from datacom.utils.socket_utils import FrameReader, send_frame
+
+needs_unix = pytest.mark.skipif(not hasattr(socket, 'AF_UNIX'), reason="needs Unix domain sockets")
+
+
+@pytest.fixture
+def endpoint(tmp_path, monkeypatch):
+    """Isolated socket directory and a free TCP port"""
+    monkeypatch.setattr(config, 'UNIX_SOCKET_DIR', str(tmp_path))
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        return probe.getsockname()[1]
+
+
+def _relay(kind, port, payloads):
+    """Send payloads over one connection and return what the listener read"""
+    listener = transport.create_listener('127.0.0.1', port, kind)
+    received = []
+    
+    def serve():
+        conn, _ = listener.accept()
+        with conn:
+            received.extend(bytes(frame) for frame in FrameReader(conn, capacity=64))
+    
+    thread = threading.Thread(target=serve)
+    thread.start()
+    try:
+        with transport.connect('127.0.0.1', port, kind) as conn:
+            for payload in payloads:
+                send_frame(conn, payload)
+        thread.join(timeout=10)
+    finally:
+        listener.close()
+    assert not thread.is_alive()
+    return received
+
+
+def _shm_pair(listener, port):
+    """Connect a writer and accept its reader (the handshake needs both sides running)"""
+    accepted = []
+    thread = threading.Thread(target=lambda: accepted.append(listener.accept()[0]))
+    thread.start()
+    writer = transport.connect('127.0.0.1', port, 'shm')
+    thread.join(timeout=10)
+    return writer, accepted[0]
+
+
+class TestTransports:
+    """Test cases shared by every transport"""
+    
+    @pytest.mark.parametrize('kind', [
+        'tcp',
+        pytest.param('unix', marks=needs_unix),
+        pytest.param('shm', marks=needs_unix),
+    ])
+    def test_round_trip(self, kind, endpoint):
+        """Test frames arrive intact and in order"""
+        payloads = [b"packet %d" % i for i in range(500)] + [b"", bytes(range(256)) * 40]
+        
+        assert _relay(kind, endpoint, payloads) == payloads
+    
+    def test_unknown_transport(self):
+        """Test an unknown name is rejected"""
+        with pytest.raises(ValueError):
+            transport.connect('127.0.0.1', 1, 'carrier-pigeon')
+    
+    def test_default_from_config(self, endpoint, monkeypatch):
+        """Test config.TRANSPORT selects the transport"""
+        monkeypatch.setattr(config, 'TRANSPORT', 'tcp')
+        listener = transport.create_listener('127.0.0.1', endpoint)
+        try:
+            assert isinstance(listener, socket.socket)
+        finally:
+            listener.close()
+
+
+@needs_unix
+class TestUnixTransport:
+    """Test cases for Unix domain socket endpoints"""
+    
+    def test_socket_file_lifecycle(self, endpoint):
+        """Test the socket file is created per port, replaced when stale and removed on close"""
+        path = transport.endpoint_path(endpoint)
+        with open(path, 'w'):
+            pass
+        
+        listener = transport.create_listener('127.0.0.1', endpoint, 'unix')
+        assert os.path.exists(path)
+        listener.close()
+        assert not os.path.exists(path)
+
+
+@needs_unix
+class TestSharedMemoryTransport:
+    """Test cases for the shared-memory ring"""
+    
+    def test_frames_larger_than_ring(self, endpoint, monkeypatch):
+        """Test the writer waits for the reader when a frame exceeds the ring"""
+        monkeypatch.setattr(config, 'SHM_RING_SIZE', 1000)
+        payloads = [os.urandom(5000), b"small", os.urandom(2999)]
+        
+        assert _relay('shm', endpoint, payloads) == payloads
+    
+    def test_reader_close_breaks_writer(self, endpoint, monkeypatch):
+        """Test a writer blocked on a full ring fails once the reader leaves"""
+        monkeypatch.setattr(config, 'SHM_RING_SIZE', 256)
+        listener = transport.create_listener('127.0.0.1', endpoint, 'shm')
+        try:
+            writer, reader = _shm_pair(listener, endpoint)
+            reader.close()
+            
+            with pytest.raises(BrokenPipeError):
+                writer.sendall(b"x" * 1024)
+            writer.close()
+        finally:
+            listener.close()
+    
+    def test_segment_unlinked_after_handshake(self, endpoint):
+        """Test the segment name is gone once both sides are attached"""
+        from multiprocessing import shared_memory
+        
+        listener = transport.create_listener('127.0.0.1', endpoint, 'shm')
+        try:
+            writer, reader = _shm_pair(listener, endpoint)
+            name = writer._shm.name
+            
+            with pytest.raises(FileNotFoundError):
+                shared_memory.SharedMemory(name=name)
+            
+            send_frame(writer, b"still mapped")
+            writer.close()
+            assert [bytes(frame) for frame in FrameReader(reader)] == [b"still mapped"]
+            reader.close()
+        finally:
+            listener.close()
+
+
+
+class TestSequenceTracker:
+    """Test cases for UDP loss and reordering accounting"""
+    
+    def test_in_order(self):
+        """Test consecutive numbers count as received only"""
+        tracker = transport.SequenceTracker()
+        for sequence in range(100):
+            assert tracker.record('a', sequence) == 'new'
+        assert (tracker.received, tracker.lost, tracker.reordered) == (100, 0, 0)
+    
+    def test_gap_then_late_arrival(self):
+        """Test a gap counts as loss until the missing datagram turns up"""
+        tracker = transport.SequenceTracker()
+        for sequence in (0, 1, 4, 5):
+            tracker.record('a', sequence)
+        assert tracker.lost == 2
+        
+        assert tracker.record('a', 2) == 'reordered'
+        assert (tracker.lost, tracker.reordered) == (1, 1)
+        assert tracker.record('a', 2) == 'duplicate'
+        assert tracker.record('a', 5) == 'duplicate'
+        assert (tracker.lost, tracker.duplicates) == (1, 2)
+    
+    def test_senders_tracked_separately(self):
+        """Test each source address has its own sequence space"""
+        tracker = transport.SequenceTracker()
+        for sequence in range(10):
+            tracker.record('a', sequence)
+            tracker.record('b', sequence * 2)
+        assert tracker.lost == 9
+    
+    def test_wraparound(self):
+        """Test numbers wrapping past 2**32 are not counted as loss"""
+        tracker = transport.SequenceTracker()
+        for sequence in (2 ** 32 - 2, 2 ** 32 - 1, 0, 1):
+            assert tracker.record('a', sequence) == 'new'
+        assert tracker.lost == 0
+    
+    def test_window_bounds_memory(self):
+        """Test a huge gap is counted without remembering every missing number"""
+        tracker = transport.SequenceTracker(window=8)
+        tracker.record('a', 0)
+        tracker.record('a', 100000)
+        assert tracker.lost == 99999
+        assert tracker.record('a', 5) == 'duplicate'
+
+
+class TestDatagramTransport:
+    """Test cases for the UDP transport"""
+    
+    def test_one_datagram_per_packet(self, endpoint):
+        """Test every frame arrives as its own datagram with sequence tracking"""
+        listener = transport.create_listener('127.0.0.1', endpoint, 'udp')
+        try:
+            reader, _ = listener.accept()
+            assert transport.frame_reader(reader) is reader
+            payloads = [b"packet %d" % i for i in range(50)] + [b"", b"x" * 60000]
+            with transport.connect('127.0.0.1', endpoint, 'udp') as conn:
+                for payload in payloads:
+                    send_frame(conn, payload)
+            
+            assert [bytes(reader.read_frame()) for _ in payloads] == payloads
+            assert reader.sequence.received == len(payloads)
+            assert reader.sequence.lost == 0
+        finally:
+            listener.close()
+    
+    def test_malformed_datagrams_skipped(self, endpoint):
+        """Test truncated and padded datagrams are counted and skipped"""
+        listener = transport.create_listener('127.0.0.1', endpoint, 'udp')
+        try:
+            reader, _ = listener.accept()
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as raw:
+                raw.connect(('127.0.0.1', endpoint))
+                raw.send(b"\x00\x00")
+                raw.send(struct.pack('!II', 0, 10) + b"short")
+                raw.send(struct.pack('!II', 1, 2) + b"ok")
+            
+            assert bytes(reader.read_frame()) == b"ok"
+            assert reader.malformed == 2
+        finally:
+            listener.close()
+    
+    def test_oversized_packet_rejected(self, endpoint):
+        """Test a packet too large for one datagram raises instead of fragmenting"""
+        with transport.connect('127.0.0.1', endpoint, 'udp') as conn:
+            with pytest.raises(ValueError):
+                send_frame(conn, b"x" * 70000)
+    
+    def test_close_ends_reader(self, endpoint):
+        """Test closing the listener wakes a blocked reader and later accept() calls"""
+        listener = transport.create_listener('127.0.0.1', endpoint, 'udp')
+        reader, _ = listener.accept()
+        frames = []
+        thread = threading.Thread(target=lambda: frames.extend(reader))
+        thread.start()
+        listener.close()
+        thread.join(timeout=5)
+        
+        assert not thread.is_alive()
+        assert frames == []
+        with pytest.raises(OSError):
+            listener.accept()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
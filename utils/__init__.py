@@ -1,29 +0,0 @@
-# Utils package initialization
-from .error_detection import (
-    ParityBit,
-    TwoDParity,
-    CRC,
-    HammingCode,
-    InternetChecksum,
-    get_error_detector
-)
-from .packet_handler import Packet, create_packet, parse_packet, validate_packet
-from .logger_utils import Logger, print_colored, print_header, print_success, print_error
-
-__all__ = [
-    'ParityBit',
-    'TwoDParity',
-    'CRC',
-    'HammingCode',
-    'InternetChecksum',
-    'get_error_detector',
-    'Packet',
-    'create_packet',
-    'parse_packet',
-    'validate_packet',
-    'Logger',
-    'print_colored',
-    'print_header',
-    'print_success',
-    'print_error'
-]